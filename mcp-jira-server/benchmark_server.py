@@ -0,0 +1,372 @@
+"""
+SSG Jira MCP Server 벤치마크 스크립트
+로컬 가짜 Jira 서버를 띄워 모든 도구를 실제 MCP call_tool 핸들러로 호출하고
+처리량, 지연 시간 백분위, 최대 메모리 사용량을 측정합니다.
+
+사용법:
+    python benchmark_server.py [--iterations 50] [--concurrency 10] [--latency 0.02]
+                               [--page_cap 100] [--total_issues 500] [--error_rate 0.05]
+                               [--tools get_issue,search_issues]
+
+서버 설정 인수(--max_concurrency, --rate_limit 등)도 함께 전달할 수 있습니다.
+"""
+
+import argparse
+import asyncio
+import atexit
+import json
+import logging
+import random
+import sys
+import os
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Tuple
+from urllib.parse import parse_qs, urlparse
+
+# 현재 디렉토리를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+import mcp.types as types
+
+from ssg_jira_mcp_server import DiskCache, SSGJiraMCPServer
+
+# 요청별 httpx 로그가 측정 결과를 가리지 않도록 억제
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logging.getLogger("ssg-jira-mcp").setLevel(logging.ERROR)
+
+
+class FakeJira:
+    """지연 시간, 페이지 크기, 429 응답 비율을 설정할 수 있는 가짜 Jira REST API 서버"""
+
+    def __init__(self, latency: float = 0.0, page_cap: int = 100, total_issues: int = 500,
+                 error_rate: float = 0.0, description_size: int = 2000):
+        self.latency = latency
+        self.page_cap = page_cap
+        self.total_issues = total_issues
+        self.error_rate = error_rate
+        self.description = "가" * description_size
+        self.requests = 0
+        self.errors_injected = 0
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def issue(self, number: int) -> Dict[str, Any]:
+        """상세 필드가 채워진 가짜 이슈를 만듭니다."""
+        return {
+            "key": f"QAQ-{number}",
+            "fields": {
+                "summary": f"QAQ-{number} 요약",
+                "description": self.description,
+                "status": {"name": "In Progress"},
+                "priority": {"name": "Major"},
+                "issuetype": {"name": "Task"},
+                "assignee": {"displayName": "담당자"},
+                "reporter": {"displayName": "보고자"},
+                "project": {"key": "QAQ", "name": "QAQ"},
+                "labels": ["qa"],
+                "fixVersions": [{"name": "25년 1월 15일 정기 - SERVER"}],
+                "customfield_10521": {"displayName": "QA 담당자"},
+                "customfield_12213": {"value": "Y"},
+                "created": "2025-01-01T09:00:00.000+0900",
+                "updated": "2025-01-15T10:00:00.000+0900"
+            }
+        }
+
+    def respond(self, path: str, params: Dict[str, str]) -> Tuple[int, Any]:
+        """요청 경로에 맞는 (상태 코드, 응답 본문)을 반환합니다."""
+        if path.endswith("/versions"):
+            return 200, [{"id": str(i), "name": f"v{i}", "released": i < 5} for i in range(20)]
+        if path.startswith("/rest/api/2/project/"):
+            return 200, {"key": path.rsplit("/", 1)[-1], "name": "QA 프로젝트", "lead": {"displayName": "리드"}}
+        if path.endswith("/comment") or path.endswith("/worklog"):
+            # 이슈마다 댓글 30개, 작업 로그 3개를 페이지 단위로 반환
+            resource = path.rsplit("/", 1)[-1]
+            count = 30 if resource == "comment" else 3
+            start_at = int(params.get("startAt", 0))
+            max_results = min(int(params.get("maxResults", 50)), self.page_cap)
+            items = [
+                {"author": {"displayName": "작성자"}, "created": f"2025-01-{n % 28 + 1:02d}T09:00:00.000+0900",
+                 "started": f"2025-01-{n % 28 + 1:02d}T10:00:00.000+0900", "body": self.description[:200],
+                 "comment": "작업", "timeSpent": "1h"}
+                for n in range(start_at, min(start_at + max_results, count))
+            ]
+            field = "comments" if resource == "comment" else "worklogs"
+            return 200, {"startAt": start_at, "maxResults": max_results, "total": count, field: items}
+        if path.startswith("/rest/api/2/issue/"):
+            return 200, self.issue(int(path.rsplit("-", 1)[-1]))
+        if path == "/rest/api/2/field":
+            return 200, [{"id": "customfield_10101", "name": "Epic Link"}]
+        if path == "/rest/api/2/search":
+            jql = params.get("jql", "")
+            if jql.startswith("key in"):
+                keys = [key.strip('" ') for key in jql[len("key in ("):-1].split(",")]
+                issues = [self.issue(int(key.rsplit("-", 1)[-1])) for key in keys if key.startswith("QAQ-")]
+                if params.get("expand") == "changelog":
+                    for issue in issues:
+                        issue["changelog"] = {"startAt": 0, "maxResults": 5, "total": 5, "histories": [
+                            {"created": f"2025-01-{n + 2:02d}T11:00:00.000+0900", "author": {"displayName": "담당자"},
+                             "items": [{"field": "status", "fromString": "Open", "toString": "In Progress"}]}
+                            for n in range(5)
+                        ]}
+                return 200, {"startAt": 0, "maxResults": len(keys), "total": len(issues), "issues": issues}
+            start_at = int(params.get("startAt", 0))
+            max_results = min(int(params.get("maxResults", 50)), self.page_cap)
+            end = min(start_at + max_results, self.total_issues)
+            issues = [self.issue(i) for i in range(start_at, end)]
+            # 에픽 트리 조회: 결과를 첫 번째 에픽/부모 이슈에 연결
+            if jql.startswith('"Epic Link" in') or jql.startswith("parent in"):
+                owner = jql.split("(", 1)[1].split(",", 1)[0].strip('")')
+                for issue in issues:
+                    if jql.startswith("parent in"):
+                        issue["fields"]["parent"] = {"key": owner}
+                    else:
+                        issue["fields"]["customfield_10101"] = owner
+            return 200, {
+                "startAt": start_at, "maxResults": max_results, "total": self.total_issues, "issues": issues
+            }
+        return 404, {"errorMessages": ["not found"]}
+
+    def _make_handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                fake.requests += 1
+                if fake.latency:
+                    time.sleep(fake.latency)
+
+                url = urlparse(self.path)
+                if fake.error_rate and random.random() < fake.error_rate:
+                    fake.errors_injected += 1
+                    status, payload, headers = 429, {"errorMessages": ["rate limited"]}, {"Retry-After": "0"}
+                else:
+                    params = {k: v[0] for k, v in parse_qs(url.query).items()}
+                    status, payload = fake.respond(url.path, params)
+                    headers = {}
+
+                body = json.dumps(payload, ensure_ascii=False).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+# export_issues 결과 파일은 임시 디렉터리에 쓰고 종료 시 삭제
+EXPORT_DIR = tempfile.mkdtemp(prefix="ssg_jira_bench_")
+atexit.register(shutil.rmtree, EXPORT_DIR, True)
+
+# 도구별 호출 인수 (i번째 호출). 캐시와 동일 요청 합치기를 피하도록 호출마다 값을 바꿉니다.
+TOOL_CALLS: Dict[str, Callable[[int], Dict[str, Any]]] = {
+    "get_project": lambda i: {"project_key": f"QAQ{i}", "bypass_cache": True},
+    "get_project_versions": lambda i: {"project_key": f"QAQ{i}", "bypass_cache": True},
+    "get_issue": lambda i: {"issue_key": f"QAQ-{i}", "bypass_cache": True},
+    "get_issues": lambda i: {"issue_keys": [f"QAQ-{i * 100 + n}" for n in range(100)]},
+    "get_issue_activity": lambda i: {"issue_keys": [f"QAQ-{i * 20 + n}" for n in range(20)]},
+    "search_issues": lambda i: {"jql": f"project = QAQ AND key != QAQ-{i}", "max_results": 50},
+    "search_issues_fetch_all": lambda i: {"jql": f"project = QAQ AND key != QAQ-{i}", "max_results": 100, "fetch_all": True},
+    "aggregate_issues": lambda i: {"jql": f"project = QAQ AND key != QAQ-{i}", "group_by": ["status", "assignee"]},
+    "batch": lambda i: {"calls": [
+        {"tool": "get_project", "arguments": {"project_key": f"QAQ{i}", "bypass_cache": True}},
+        {"tool": "get_project_versions", "arguments": {"project_key": f"QAQ{i}", "bypass_cache": True}},
+        {"tool": "search_issues", "arguments": {"jql": f"project = QAQ AND key != QAQ-{i}", "max_results": 50}},
+        {"tool": "get_issue", "arguments": {"issue_key": f"QAQ-{i}", "bypass_cache": True}}
+    ]},
+    "export_issues": lambda i: {
+        "jql": f"project = QAQ AND key != QAQ-{i}", "path": os.path.join(EXPORT_DIR, f"export_{i}.jsonl"), "resume": False
+    },
+    "expand_epic": lambda i: {"epic_keys": [f"QAQ-{100000 + i}"]},
+    "search_qa_issues": lambda i: {"search_type": "epic_issues", "epic_key": f"QAQ-{i}"},
+    "changes_since": lambda i: {"query_name": "benchmark", "jql": "project = QAQ"},
+    "sync_status": lambda i: {},
+    "server_stats": lambda i: {},
+    "cache_stats": lambda i: {},
+    "stop_operation": lambda i: {}
+}
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """표본에서 백분위 값을 계산합니다."""
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[idx]
+
+
+async def call_tool(server: SSGJiraMCPServer, name: str, arguments: Dict[str, Any]) -> bool:
+    """실제 MCP call_tool 핸들러로 도구를 호출합니다. 오류 응답이면 False를 반환합니다."""
+    handler = server.server.request_handlers[types.CallToolRequest]
+    request = types.CallToolRequest(
+        method="tools/call",
+        params=types.CallToolRequestParams(name=name.replace("_fetch_all", ""), arguments=arguments)
+    )
+    result = await handler(request)
+    return not result.root.isError and not result.root.content[0].text.startswith("❌")
+
+
+async def run_calls(server: SSGJiraMCPServer, name: str, iterations: int, concurrency: int) -> Tuple[List[float], int, float]:
+    """도구를 iterations회 호출합니다. (호출별 지연 시간 ms, 오류 수, 전체 소요 시간 s)를 반환합니다."""
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: List[float] = []
+    errors = 0
+
+    async def one(i: int):
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            ok = await call_tool(server, name, TOOL_CALLS[name](i))
+            samples.append((time.perf_counter() - start) * 1000)
+            errors += 0 if ok else 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(iterations)))
+    return samples, errors, time.perf_counter() - started
+
+
+async def measure_peak_memory(server: SSGJiraMCPServer, name: str, iterations: int, concurrency: int) -> float:
+    """tracemalloc으로 호출 중 최대 메모리 사용량(KB)을 측정합니다."""
+    tracemalloc.start()
+    try:
+        await run_calls(server, name, iterations, concurrency)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def make_server(fake: FakeJira) -> SSGJiraMCPServer:
+    """가짜 Jira를 바라보는 서버 인스턴스를 만듭니다."""
+    server = SSGJiraMCPServer()
+    server.base_url = fake.base_url
+    server.username, server.api_token = "bench@ssg.com", "bench-token"
+    server._setup_auth_headers()
+    server.retry_backoff_base = 0.01
+    if "--rate_limit" not in sys.argv and not os.getenv("JIRA_RATE_LIMIT"):
+        # 요청 계층 자체의 성능을 측정하도록 속도 제한 해제
+        server.rate_limiter.rate = 0
+    return server
+
+
+async def benchmark_pooling(fake: FakeJira, iterations: int):
+    """커넥션 재사용 전/후의 get_issue p50/p99 지연 시간을 비교합니다."""
+    server = make_server(fake)
+    print(f"\n📊 커넥션 풀링: get_issue {iterations}회 순차 호출")
+    for label, pooled in (("호출별 클라이언트 (기존)", False), ("공유 클라이언트 (풀링)", True)):
+        samples = []
+        for i in range(iterations):
+            start = time.perf_counter()
+            await server._get_issue({"issue_key": f"QAQ-{i}", "bypass_cache": True})
+            samples.append((time.perf_counter() - start) * 1000)
+            if not pooled:
+                # 호출마다 새 클라이언트를 만들던 기존 동작을 재현
+                await server.aclose()
+        print(f"  - {label}: p50={percentile(samples, 50):.2f}ms, p99={percentile(samples, 99):.2f}ms")
+    await server.aclose()
+
+
+async def benchmark_disk_cache(fake: FakeJira):
+    """새 세션(빈 메모리 캐시)의 첫 get_project/get_project_versions 지연 시간을 디스크 캐시 유무로 비교합니다."""
+    cache_dir = tempfile.mkdtemp(prefix="bench_disk_cache_")
+    print("\n📊 디스크 응답 캐시: 새 세션의 첫 프로젝트/버전 조회")
+    try:
+        for label, use_disk in (("디스크 캐시 없음", False), ("디스크 캐시 (이전 세션 저장분)", True)):
+            samples = []
+            for session in range(2):
+                server = make_server(fake)
+                if use_disk:
+                    server.disk_cache = DiskCache(cache_dir, max_bytes=50 * 1024 * 1024, ttls=dict(server.cache.ttls))
+                start = time.perf_counter()
+                await call_tool(server, "get_project", {"project_key": "QAQ"})
+                await call_tool(server, "get_project_versions", {"project_key": "QAQ"})
+                samples.append((time.perf_counter() - start) * 1000)
+                await server.aclose()
+                if server.disk_cache is not None:
+                    server.disk_cache.close()
+            # 첫 세션은 캐시를 채우는 세션이므로 두 번째 세션을 비교
+            print(f"  - {label}: {samples[1]:.2f}ms")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+async def run_benchmark(options: argparse.Namespace):
+    """모든 도구에 대해 단일/동시 호출 성능을 측정합니다."""
+    print("=" * 60)
+    print("⏱️ SSG Jira MCP Server 벤치마크")
+    print("=" * 60)
+    print(f"  - 지연 시간: {options.latency * 1000:.0f}ms, 페이지 상한: {options.page_cap}, "
+          f"전체 이슈: {options.total_issues}, 429 비율: {options.error_rate:.0%}")
+
+    fake = FakeJira(
+        latency=options.latency, page_cap=options.page_cap, total_issues=options.total_issues,
+        error_rate=options.error_rate, description_size=options.description_size
+    )
+    fake.start()
+
+    try:
+        await benchmark_pooling(fake, options.iterations)
+        await benchmark_disk_cache(fake)
+
+        tools = options.tools.split(",") if options.tools else list(TOOL_CALLS)
+        print(f"\n📊 도구별 성능 ({options.iterations}회, 동시 {options.concurrency})")
+        print(f"  {'도구':<26}{'모드':<6}{'처리량/s':>10}{'p50ms':>10}{'p95ms':>10}{'p99ms':>10}{'최대KB':>10}{'오류':>6}")
+        for name in tools:
+            for mode, concurrency in (("단일", 1), ("동시", options.concurrency)):
+                server = make_server(fake)
+                samples, errors, elapsed = await run_calls(server, name, options.iterations, concurrency)
+                peak_kb = await measure_peak_memory(server, name, max(1, options.iterations // 5), concurrency)
+                await server.aclose()
+                print(
+                    f"  {name:<26}{mode:<6}{options.iterations / elapsed:>10.1f}"
+                    f"{percentile(samples, 50):>10.2f}{percentile(samples, 95):>10.2f}{percentile(samples, 99):>10.2f}"
+                    f"{peak_kb:>10.0f}{errors:>6}"
+                )
+
+        print(f"\n  - 가짜 Jira 요청 수: {fake.requests}, 주입한 429 응답: {fake.errors_injected}")
+    finally:
+        fake.stop()
+
+    print("\n" + "=" * 60)
+
+
+def parse_options() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="SSG Jira MCP Server 벤치마크")
+    parser.add_argument("--iterations", type=int, default=50, help="도구별 호출 횟수")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 호출 수")
+    parser.add_argument("--latency", type=float, default=0.0, help="가짜 Jira 응답 지연(초)")
+    parser.add_argument("--page_cap", type=int, default=100, help="가짜 Jira 검색 페이지 상한")
+    parser.add_argument("--total_issues", type=int, default=500, help="가짜 Jira 검색 결과 전체 건수")
+    parser.add_argument("--error_rate", type=float, default=0.0, help="429 응답 주입 비율 (0~1)")
+    parser.add_argument("--description_size", type=int, default=2000, help="이슈 description 글자 수")
+    parser.add_argument("--tools", default="", help="측정할 도구 (콤마로 구분, 기본값: 전체)")
+    # 서버 설정 인수(--max_concurrency 등)는 서버가 sys.argv에서 직접 읽음
+    options, _ = parser.parse_known_args()
+    return options
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark(parse_options()))
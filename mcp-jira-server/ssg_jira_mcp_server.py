@@ -6,12 +6,26 @@ MCP 서버를 통해 SSG Jira 시스템에 접근할 수 있는 도구들을 제
 """
 
 import asyncio
+import bisect
+import contextvars
+import csv
+import importlib.util
+import io
 import json
 import base64
+import hashlib
 import logging
 import os
+import random
+import re
+import sqlite3
 import sys
-from typing import Any, Dict, List, Optional
+import time
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 import httpx
 from mcp.server import Server, NotificationOptions
@@ -19,6 +33,11 @@ from mcp.server.models import InitializationOptions
 import mcp.server.stdio
 import mcp.types as types
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -29,6 +48,1473 @@ logging.basicConfig(
 )
 logger = logging.getLogger("ssg-jira-mcp")
 
+def _name(value: Any) -> Optional[str]:
+    return value.get("name") if value else None
+
+def _display_name(value: Any) -> Optional[str]:
+    return value.get("displayName") if value else None
+
+def _option_value(value: Any) -> Optional[str]:
+    return value.get("value") if value else None
+
+def _basic_auth_headers(authorization: str) -> Dict[str, str]:
+    return {
+        "Authorization": authorization,
+        "Accept": "application/json",
+        "Content-Type": "application/json"
+    }
+
+def _names(value: Any) -> List[Optional[str]]:
+    return [v.get("name") for v in value or []]
+
+def _raw(value: Any) -> Any:
+    return value
+
+# 이슈 출력 항목: 출력 이름 -> (Jira 필드, 추출 함수)
+ISSUE_COLUMNS: Dict[str, Tuple[str, Any]] = {
+    "summary": ("summary", _raw),
+    "description": ("description", _raw),
+    "status": ("status", _name),
+    "priority": ("priority", _name),
+    "issuetype": ("issuetype", _name),
+    "assignee": ("assignee", _display_name),
+    "reporter": ("reporter", _display_name),
+    "created": ("created", _raw),
+    "updated": ("updated", _raw),
+    "duedate": ("duedate", _raw),
+    "project": ("project", _name),
+    "labels": ("labels", lambda value: value or []),
+    "fixVersions": ("fixVersions", _names),
+    # 커스텀 필드들
+    "qa_담당자": ("customfield_10521", _display_name),
+    "배포일자": ("customfield_10706", _raw),
+    "start_date": ("customfield_10209", _raw),
+    "end_date": ("customfield_10210", _raw),
+    "qa_대상": ("customfield_12213", _option_value),
+    "epic_name": ("customfield_10103", _raw)
+}
+
+class IssueProfile:
+    """이슈 조회 필드 프로필: 요청할 Jira 필드 목록과 그에 맞는 추출기를 미리 구성합니다."""
+    
+    def __init__(self, name: str, columns: List[str]):
+        self.name = name
+        self._extractors = [(column, *ISSUE_COLUMNS[column]) for column in ISSUE_COLUMNS if column in columns]
+        self.fields = ",".join(dict.fromkeys(jira_field for _, jira_field, _ in self._extractors))
+        self.columns = ["key"] + [column for column, _, _ in self._extractors]
+    
+    def extract(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """이슈 응답에서 프로필에 포함된 항목만 추출합니다."""
+        fields_data = data.get("fields") or {}
+        issue_info = {"key": data.get("key")}
+        for column, jira_field, extractor in self._extractors:
+            issue_info[column] = extractor(fields_data.get(jira_field))
+        return issue_info
+
+ISSUE_PROFILES: Dict[str, IssueProfile] = {
+    "summary": IssueProfile("summary", ["summary", "status", "priority", "issuetype", "assignee", "updated"]),
+    "qa": IssueProfile("qa", [
+        "summary", "status", "priority", "issuetype", "assignee", "updated", "fixVersions",
+        "qa_담당자", "배포일자", "start_date", "end_date", "qa_대상", "epic_name"
+    ]),
+    "full": IssueProfile("full", list(ISSUE_COLUMNS))
+}
+
+# 기본(full) 프로필이 추출하는 필드 목록 (get_issues 배치 조회, 미러 동기화 시 요청)
+ISSUE_DETAIL_FIELDS = ISSUE_PROFILES["full"].fields
+
+# batch 도구에서 하위 호출로 실행할 수 있는 도구
+BATCH_TOOLS = ("get_project", "get_project_versions", "search_issues", "get_issue")
+
+# export_issues 파일 형식
+EXPORT_FORMATS = ("jsonl", "csv")
+
+# get_issue_activity에서 조회할 수 있는 활동 종류
+ACTIVITY_SOURCES = ("comment", "changelog", "worklog")
+
+# since 상대 시간 단위 (JQL과 같은 -7d, -12h 형식)
+SINCE_UNITS = {"m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+def _parse_jira_time(value: Optional[str]) -> Optional[float]:
+    """Jira 시각 문자열(2025-01-02T09:00:00.000+0900)을 타임스탬프로 변환합니다."""
+    try:
+        return datetime.strptime(value or "", "%Y-%m-%dT%H:%M:%S.%f%z").timestamp()
+    except ValueError:
+        return None
+
+def _parse_since(value: str) -> float:
+    """since 인수(날짜, 날짜+시각, -7d 같은 상대 시간)를 타임스탬프로 변환합니다."""
+    match = re.fullmatch(r"-(\d+)([mhdw])", value.strip())
+    if match:
+        return time.time() - int(match.group(1)) * SINCE_UNITS[match.group(2)]
+    for fmt in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value.strip(), fmt).timestamp()
+        except ValueError:
+            continue
+    raise ValueError(f"since 형식을 해석할 수 없습니다: {value} (예: 2025-01-31, 2025-01-31T09:00, -7d)")
+
+def _clip(text: Optional[str], limit: int) -> Optional[str]:
+    if text and limit > 0 and len(text) > limit:
+        return text[:limit] + "…"
+    return text
+
+# JQL의 ORDER BY 절과 따옴표로 감싼 문자열 값 (문자열 안의 "order by"는 정렬 절로 보지 않음)
+_JQL_ORDER_BY = re.compile(r"(?:^|\s)order\s+by\s", re.IGNORECASE)
+_JQL_QUOTED = re.compile(r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'')
+
+def _split_order_by(jql: str) -> Tuple[str, str]:
+    """JQL을 조건부와 ORDER BY 절로 나눕니다. 정렬 절이 없으면 두 번째 값은 빈 문자열입니다.
+    
+    조건을 덧붙이거나 NOT/괄호로 감쌀 때 ORDER BY가 괄호 안에 들어가 쿼리가 깨지지 않도록 사용합니다.
+    """
+    masked = _JQL_QUOTED.sub(lambda match: "_" * len(match.group()), jql)
+    matches = list(_JQL_ORDER_BY.finditer(masked))
+    if not matches:
+        return jql.strip(), ""
+    start = matches[-1].start()
+    return jql[:start].strip(), jql[start:].strip()
+
+def _csv_value(value: Any) -> Any:
+    """CSV 셀 값으로 변환합니다. 목록은 쉼표로 잇고 None은 빈 칸으로 둡니다."""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ", ".join(str(item) for item in value)
+    return value
+
+# search_qa_issues의 고정 JQL 프리셋 (epic_issues는 에픽 키에 따라 동적으로 생성)
+QA_PRESET_JQL = {
+    "in_progress_epics": 'project in ("QAQ","이벤트 운영 QA") AND type = Epic AND status = "In Progress"',
+    "qa_target": 'project in ("QAQ","APP 운영 QA") AND "QA 대상" = Y',
+    "deploy_waiting": '"배포 진행" = YES'
+}
+QA_PRESET_FIELDS = "summary,status,priority,issuetype,assignee,created,updated,customfield_10521,customfield_12213"
+
+# 로컬 미러로 응답할 수 있는 프리셋과 기본 미러 대상 프로젝트
+MIRROR_PRESETS = ("in_progress_epics", "qa_target", "deploy_waiting")
+DEFAULT_MIRROR_PROJECTS = "QAQ,이벤트 운영 QA,APP 운영 QA"
+
+class SearchPage(NamedTuple):
+    """검색 결과 한 페이지"""
+    start_at: int
+    total: int
+    target: int
+    page_size: int
+    issues: List[Dict[str, Any]]
+
+# 스트리밍 파서가 문자열 밖에서 확인하는 JSON 구조 문자: " [ ] { }
+_JSON_TOKENS = re.compile(rb'["\[\]{}]')
+
+class SearchStreamParser:
+    """검색 응답 본문을 조각 단위로 받아 issues 배열의 이슈를 하나씩 꺼냅니다.
+    
+    이슈 객체는 닫히는 즉시 해석하고 버퍼에서 지우므로 버퍼에는 받는 중인 이슈 하나와 수신 조각만 남습니다.
+    나머지 최상위 값(total, startAt 등)은 finish()에서 한 번에 해석합니다.
+    """
+    
+    def __init__(self):
+        self._buf = bytearray()
+        self._scan = 0
+        self._depth = 0
+        self._in_string = False
+        self._string_start = 0
+        self._last_string: Optional[bytes] = None
+        self._in_issues = False
+        self._issue_start: Optional[int] = None
+        self._flush_from = 0
+        self._rest = bytearray()
+        self.max_buffer = 0
+    
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        """받은 조각을 처리하고 이번에 완성된 이슈 목록을 반환합니다."""
+        buf = self._buf
+        buf += chunk
+        end = len(buf)
+        self.max_buffer = max(self.max_buffer, end)
+        issues = []
+        pos = self._scan
+        while pos < end:
+            if self._in_string:
+                # 문자열 안에서는 다음 따옴표로 건너뛰고, 앞의 역슬래시가 홀수 개면 이스케이프된 따옴표로 봄
+                quote = buf.find(b'"', pos)
+                if quote < 0:
+                    pos = end
+                    break
+                backslash = quote - 1
+                while backslash > self._string_start and buf[backslash] == 0x5C:
+                    backslash -= 1
+                pos = quote + 1
+                if (quote - 1 - backslash) % 2:
+                    continue
+                self._in_string = False
+                if self._depth == 1:
+                    self._last_string = bytes(buf[self._string_start + 1:quote])
+                continue
+            
+            match = _JSON_TOKENS.search(buf, pos)
+            if match is None:
+                pos = end
+                break
+            i = match.start()
+            pos = i + 1
+            c = buf[i]
+            if c == 0x22:
+                self._in_string = True
+                self._string_start = i
+            elif c in (0x7B, 0x5B):
+                self._depth += 1
+                if self._depth == 2 and c == 0x5B and self._last_string == b"issues":
+                    # issues 배열 내용은 나머지 값에 넣지 않음 ("issues":[] 로 남김)
+                    self._in_issues = True
+                    self._rest += buf[self._flush_from:i + 1]
+                elif self._in_issues and self._depth == 3:
+                    self._issue_start = i
+            else:
+                if self._in_issues and self._depth == 3 and self._issue_start is not None:
+                    issues.append(_loads(bytes(buf[self._issue_start:i + 1])))
+                    self._issue_start = None
+                elif self._in_issues and self._depth == 2:
+                    self._in_issues = False
+                    self._flush_from = i
+                self._depth -= 1
+        
+        # 해석이 끝난 앞부분을 버퍼에서 제거 (받는 중인 이슈나 문자열은 남김)
+        if not self._in_issues:
+            self._rest += buf[self._flush_from:end]
+            self._flush_from = end
+        keep = end
+        if self._issue_start is not None:
+            keep = self._issue_start
+        elif self._in_string:
+            keep = self._string_start
+        del buf[:keep]
+        self._scan = pos - keep
+        self._flush_from = max(0, self._flush_from - keep)
+        self._string_start -= keep
+        if self._issue_start is not None:
+            self._issue_start -= keep
+        return issues
+    
+    def finish(self) -> Dict[str, Any]:
+        """issues를 제외한 최상위 값을 해석해 반환합니다."""
+        return _loads(bytes(self._rest + self._buf[self._flush_from:]))
+
+# 집계 도구의 group_by 별칭 (ISSUE_COLUMNS 이름으로 변환)
+GROUP_BY_ALIASES = {
+    "qa_owner": "qa_담당자",
+    "qa_target": "qa_대상",
+    "fixVersion": "fixVersions",
+    "label": "labels"
+}
+
+# 모든 조회 도구에 공통으로 추가되는 출력 형식 옵션
+OUTPUT_FORMATS = ("pretty", "compact", "table", "ndjson")
+# table/ndjson 형식에서 행 목록으로 취급하는 결과 키
+ROW_KEYS = ("issues", "groups")
+OUTPUT_PROPERTIES = {
+    "output_format": {
+        "type": "string",
+        "enum": list(OUTPUT_FORMATS),
+        "description": "출력 형식: pretty(들여쓴 JSON, 기본값), compact(압축 JSON), table(헤더 1회 + 행 배열), ndjson(한 줄에 한 항목)"
+    },
+    "max_chars": {
+        "type": "integer",
+        "description": "응답 본문 최대 글자 수 (초과 시 description을 잘라내고 잘린 내용을 보고)"
+    }
+}
+
+# 여러 페이지를 조회하는 도구의 시간 예산 인수 (초과하면 그때까지 모은 결과를 반환)
+PROGRESS_PROPERTIES = {
+    "max_seconds": {
+        "type": "number",
+        "description": "최대 실행 시간(초). 초과하면 남은 페이지 조회를 멈추고 그때까지의 결과를 partial로 반환"
+    }
+}
+
+# 도구 목록 (list_tools마다 다시 만들지 않도록 모듈 로드 시 한 번 생성)
+TOOLS: List[types.Tool] = [
+    types.Tool(
+        name="get_project",
+        description="프로젝트 정보를 조회합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_key": {
+                    "type": "string",
+                    "description": "프로젝트 키 (예: QAQ, WASD, PROMO)"
+                },
+                "bypass_cache": {
+                    "type": "boolean",
+                    "description": "true이면 캐시를 사용하지 않고 Jira에서 직접 조회합니다",
+                    "default": False
+                },
+                **OUTPUT_PROPERTIES
+            },
+            "required": ["project_key"]
+        }
+    ),
+    types.Tool(
+        name="search_issues",
+        description="JQL을 사용하여 이슈를 검색합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jql": {
+                    "type": "string",
+                    "description": "JQL 쿼리 (예: project = QAQ AND status = 'In Progress')"
+                },
+                "fields": {
+                    "type": "string",
+                    "description": "조회할 필드 (콤마로 구분, 기본값: 주요 필드들)",
+                    "default": "summary,status,priority,issuetype,assignee,created,updated"
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "최대 결과 수 (기본값: 50, fetch_all/limit 사용 시 페이지 크기)",
+                    "default": 50
+                },
+                "fetch_all": {
+                    "type": "boolean",
+                    "description": "true이면 전체 결과를 페이지 단위로 모두 조회합니다",
+                    "default": False
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "여러 페이지에 걸쳐 조회할 최대 이슈 수"
+                },
+                **PROGRESS_PROPERTIES,
+                **OUTPUT_PROPERTIES
+            },
+            "required": ["jql"]
+        }
+    ),
+    types.Tool(
+        name="get_issue",
+        description="단건 이슈 정보를 조회합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "이슈 키 (예: QAQ-777, WASD-1251)"
+                },
+                "profile": {
+                    "type": "string",
+                    "enum": ["summary", "qa", "full"],
+                    "description": "필드 프로필: summary(요약), qa(QA 필드 포함), full(전체 주요 필드, 기본값)",
+                    "default": "full"
+                },
+                "fields": {
+                    "type": "string",
+                    "description": "조회할 필드 (콤마로 구분, 기본값: 프로필의 필드)"
+                },
+                "bypass_cache": {
+                    "type": "boolean",
+                    "description": "true이면 캐시를 사용하지 않고 Jira에서 직접 조회합니다",
+                    "default": False
+                },
+                **OUTPUT_PROPERTIES
+            },
+            "required": ["issue_key"]
+        }
+    ),
+    types.Tool(
+        name="get_issues",
+        description="여러 이슈를 JQL 배치 검색으로 한 번에 조회합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_keys": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "이슈 키 목록 (예: [\"QAQ-777\", \"WASD-1251\"])"
+                },
+                "profile": {
+                    "type": "string",
+                    "enum": ["summary", "qa", "full"],
+                    "description": "필드 프로필: summary(요약), qa(QA 필드 포함), full(전체 주요 필드, 기본값)",
+                    "default": "full"
+                },
+                **OUTPUT_PROPERTIES
+            },
+            "required": ["issue_keys"]
+        }
+    ),
+    types.Tool(
+        name="get_issue_activity",
+        description="여러 이슈의 댓글, 변경 이력, 작업 로그를 동시에 조회해 이슈별 시간순 활동 목록으로 반환합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_keys": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "이슈 키 목록 (예: [\"QAQ-777\", \"WASD-1251\"])"
+                },
+                "include": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": list(ACTIVITY_SOURCES)},
+                    "description": "조회할 활동 종류 (기본값: comment, changelog, worklog 전체)"
+                },
+                "since": {
+                    "type": "string",
+                    "description": "이 시각 이후의 활동만 반환 (예: 2025-01-31, 2025-01-31T09:00, -7d, -12h)"
+                },
+                "changelog_fields": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "변경 이력에서 남길 필드 (예: [\"status\", \"assignee\"]). 비우면 전체"
+                },
+                "body_chars": {
+                    "type": "integer",
+                    "description": "댓글/작업 로그 본문 최대 글자 수 (기본값: 300, 0이면 자르지 않음)",
+                    "default": 300
+                },
+                **OUTPUT_PROPERTIES
+            },
+            "required": ["issue_keys"]
+        }
+    ),
+    types.Tool(
+        name="aggregate_issues",
+        description="JQL 결과를 필드별로 집계합니다 (이슈 목록 대신 건수 표만 반환)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jql": {
+                    "type": "string",
+                    "description": "JQL 쿼리 (예: \"Epic Link\" = QAQ-777)"
+                },
+                "group_by": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "집계 기준 필드 (예: [\"status\", \"assignee\"], qa_owner, qa_target, fixVersion, labels 등). 비우면 전체 건수만 조회"
+                },
+                "page_size": {
+                    "type": "integer",
+                    "description": "페이지당 조회 건수 (기본값: 100)",
+                    "default": 100
+                },
+                **PROGRESS_PROPERTIES,
+                **OUTPUT_PROPERTIES
+            },
+            "required": ["jql"]
+        }
+    ),
+    types.Tool(
+        name="batch",
+        description="여러 조회(get_project, get_project_versions, search_issues, get_issue)를 한 번에 동시 실행합니다 (이슈는 공유 표로 중복 제거)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "하위 호출 목록 (예: [{\"tool\": \"get_project_versions\", \"arguments\": {\"project_key\": \"QAQ\"}}])",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "tool": {
+                                "type": "string",
+                                "enum": ["get_project", "get_project_versions", "search_issues", "get_issue"]
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "해당 도구의 인수"
+                            },
+                            "id": {
+                                "type": "string",
+                                "description": "결과에서 호출을 구분할 이름 (선택)"
+                            }
+                        },
+                        "required": ["tool"]
+                    },
+                    "minItems": 1
+                },
+                **OUTPUT_PROPERTIES
+            },
+            "required": ["calls"]
+        }
+    ),
+    types.Tool(
+        name="export_issues",
+        description="JQL 결과 전체를 JSONL/CSV 파일로 내보냅니다 (파일 경로, 건수, 소요 시간만 반환)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jql": {
+                    "type": "string",
+                    "description": "JQL 쿼리 (예: fixVersion = \"25년 1월 15일 정기 - SERVER\")"
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["jsonl", "csv"],
+                    "description": "파일 형식 (기본값: jsonl)",
+                    "default": "jsonl"
+                },
+                "path": {
+                    "type": "string",
+                    "description": "저장할 파일 경로 (기본값: JIRA_EXPORT_DIR 아래 JQL별 파일)"
+                },
+                "profile": {
+                    "type": "string",
+                    "enum": ["summary", "qa", "full"],
+                    "description": "필드 프로필: summary(요약), qa(QA 필드 포함), full(전체 주요 필드, 기본값)",
+                    "default": "full"
+                },
+                "page_size": {
+                    "type": "integer",
+                    "description": "페이지당 조회 건수 (기본값: 100)",
+                    "default": 100
+                },
+                "resume": {
+                    "type": "boolean",
+                    "description": "중단된 같은 내보내기가 있으면 마지막 startAt부터 이어서 진행 (기본값: true)",
+                    "default": True
+                },
+                **PROGRESS_PROPERTIES,
+                **OUTPUT_PROPERTIES
+            },
+            "required": ["jql"]
+        }
+    ),
+    types.Tool(
+        name="expand_epic",
+        description="에픽과 하위 이슈, 서브태스크, 연결 이슈를 한 번에 펼쳐 조회합니다 (여러 에픽 동시 지원)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "epic_keys": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "에픽 키 목록 (예: [\"QAQ-777\", \"QAQ-778\"])"
+                },
+                "in_progress_epics": {
+                    "type": "boolean",
+                    "description": "진행 중인 에픽(in_progress_epics 프리셋)을 모두 포함",
+                    "default": False
+                },
+                "include_subtasks": {
+                    "type": "boolean",
+                    "description": "하위 이슈의 서브태스크 포함 (기본값: true)",
+                    "default": True
+                },
+                "link_depth": {
+                    "type": "integer",
+                    "description": "연결 이슈(issuelinks)를 따라갈 깊이 (기본값: 0, 따라가지 않음)",
+                    "default": 0,
+                    "minimum": 0
+                },
+                "profile": {
+                    "type": "string",
+                    "enum": ["summary", "qa", "full"],
+                    "description": "필드 프로필: summary(요약), qa(QA 필드 포함, 기본값), full(전체 주요 필드)",
+                    "default": "qa"
+                },
+                **OUTPUT_PROPERTIES
+            }
+        }
+    ),
+    types.Tool(
+        name="get_project_versions",
+        description="프로젝트의 버전 목록을 조회합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_key": {
+                    "type": "string",
+                    "description": "프로젝트 키 (예: QAQ, WASD)"
+                },
+                "bypass_cache": {
+                    "type": "boolean",
+                    "description": "true이면 캐시를 사용하지 않고 Jira에서 직접 조회합니다",
+                    "default": False
+                },
+                **OUTPUT_PROPERTIES
+            },
+            "required": ["project_key"]
+        }
+    ),
+    types.Tool(
+        name="search_qa_issues",
+        description="QA 관련 이슈를 검색합니다 (미리 정의된 JQL 사용)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "search_type": {
+                    "type": "string",
+                    "enum": ["in_progress_epics", "qa_target", "deploy_waiting", "epic_issues"],
+                    "description": "검색 유형: in_progress_epics(진행중 에픽), qa_target(QA 대상), deploy_waiting(배포 대기), epic_issues(특정 에픽의 이슈들)"
+                },
+                "epic_key": {
+                    "type": "string",
+                    "description": "에픽 키 (search_type이 'epic_issues'일 때 필수)"
+                },
+                "fix_version": {
+                    "type": "string",
+                    "description": "픽스 버전 (search_type이 'deploy_waiting'일 때 선택사항)"
+                },
+                **OUTPUT_PROPERTIES
+            },
+            "required": ["search_type"]
+        }
+    ),
+    types.Tool(
+        name="changes_since",
+        description="이름별 워터마크 이후 쿼리 결과에 추가/변경/제외된 이슈만 조회합니다 (첫 호출은 기준 상태 저장)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query_name": {
+                    "type": "string",
+                    "description": "워터마크를 구분할 쿼리 이름 (in_progress_epics, qa_target, deploy_waiting이면 jql 생략 가능)"
+                },
+                "jql": {
+                    "type": "string",
+                    "description": "JQL 쿼리 (바뀌면 기준 상태를 새로 저장)"
+                },
+                "profile": {
+                    "type": "string",
+                    "enum": ["summary", "qa", "full"],
+                    "description": "비교할 필드 프로필: summary(요약), qa(QA 필드 포함, 기본값), full(전체 주요 필드)",
+                    "default": "qa"
+                },
+                "include_changelog": {
+                    "type": "boolean",
+                    "description": "changelog에서 워터마크 이후 상태 전환 이력 포함",
+                    "default": False
+                },
+                "reset": {
+                    "type": "boolean",
+                    "description": "워터마크를 버리고 기준 상태를 새로 저장",
+                    "default": False
+                },
+                **OUTPUT_PROPERTIES
+            },
+            "required": ["query_name"]
+        }
+    ),
+    types.Tool(
+        name="sync_status",
+        description="로컬 이슈 미러의 동기화 상태를 조회하거나 동기화를 실행합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "enum": ["status", "sync", "full_resync"],
+                    "description": "status(상태 조회), sync(증분 동기화), full_resync(전체 재동기화)",
+                    "default": "status"
+                },
+                **OUTPUT_PROPERTIES
+            }
+        }
+    ),
+    types.Tool(
+        name="server_stats",
+        description="도구별 지연 시간, 대기 시간, 응답 크기, 파싱/포맷 시간, 오류 유형 통계를 조회합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                **OUTPUT_PROPERTIES
+            }
+        }
+    ),
+    types.Tool(
+        name="cache_stats",
+        description="응답 캐시의 크기, TTL, 적중/실패 통계와 합쳐진 요청 수를 조회합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                **OUTPUT_PROPERTIES
+            }
+        }
+    ),
+    types.Tool(
+        name="stop_operation",
+        description="진행 중인 도구 호출(search_issues, aggregate_issues, export_issues)에 중단을 요청합니다. 중단된 호출은 그때까지 모은 결과를 partial로 반환합니다. operation_id를 비우면 진행 중인 호출 목록을 조회합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "operation_id": {
+                    "type": "string",
+                    "description": "중단할 작업 ID (클라이언트가 보낸 progressToken 또는 요청 ID)"
+                },
+                **OUTPUT_PROPERTIES
+            }
+        }
+    )
+]
+
+def _dumps(value: Any, compact: bool = False) -> str:
+    """JSON 직렬화. orjson이 설치되어 있으면 사용합니다."""
+    if orjson is not None:
+        return orjson.dumps(value, option=0 if compact else orjson.OPT_INDENT_2).decode()
+    if compact:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(value, indent=2, ensure_ascii=False)
+
+def _loads(data: Any) -> Any:
+    """JSON 역직렬화. orjson이 설치되어 있으면 사용합니다."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _split_rows(result: Any) -> Tuple[Any, Optional[str], Optional[List[Dict[str, Any]]]]:
+    """결과를 (메타 정보, 행 목록 키, 행 목록)으로 나눕니다. 행 목록이 없으면 행 관련 값은 None입니다."""
+    if isinstance(result, list) and all(isinstance(row, dict) for row in result):
+        return None, None, result
+    if isinstance(result, dict):
+        for row_key in ROW_KEYS:
+            if isinstance(result.get(row_key), list):
+                return {k: v for k, v in result.items() if k != row_key}, row_key, result[row_key]
+    return result, None, None
+
+def _serialize(output_format: str, meta: Any, row_key: Optional[str], rows: Optional[List[Dict[str, Any]]]) -> str:
+    """출력 형식에 맞게 결과를 직렬화합니다."""
+    if rows is None or output_format in ("pretty", "compact"):
+        value = meta if rows is None else (rows if row_key is None else {**meta, row_key: rows})
+        return _dumps(value, compact=output_format != "pretty")
+    
+    lines = [_dumps(meta, compact=True)] if meta is not None else []
+    if output_format == "table":
+        columns = list(dict.fromkeys(column for row in rows for column in row))
+        lines.append(_dumps(columns, compact=True))
+        lines.extend(_dumps([row.get(column) for column in columns], compact=True) for row in rows)
+    else:
+        lines.extend(_dumps(row, compact=True) for row in rows)
+    return "\n".join(lines)
+
+def _truncate_descriptions(items: List[Any], limit: int) -> Tuple[List[Any], int, int]:
+    """description 값을 limit 글자로 자릅니다. (잘린 목록, 잘린 항목 수, 제거된 글자 수)를 반환합니다."""
+    truncated, count, removed = [], 0, 0
+    for item in items:
+        description = item.get("description") if isinstance(item, dict) else None
+        if isinstance(description, str) and len(description) > limit:
+            item = {**item, "description": description[:limit] + "…"}
+            count += 1
+            removed += len(description) - limit
+        truncated.append(item)
+    return truncated, count, removed
+
+class ResponseCache:
+    """도구별 TTL과 LRU 크기 제한을 가진 프로세스 내 응답 캐시"""
+    
+    def __init__(self, max_entries: int, ttls: Dict[str, float]):
+        self.max_entries = max_entries
+        self.ttls = ttls
+        # (namespace, primary, variant) -> (만료 시각, 버전, 데이터)
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[float, Optional[str], Any]]" = OrderedDict()
+        self._by_primary: Dict[Tuple[str, str], set] = {}
+        self.stats: Dict[str, Dict[str, int]] = {
+            namespace: {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0} for namespace in ttls
+        }
+    
+    def get(self, namespace: str, primary: str, variant: str = "") -> Optional[Any]:
+        """캐시된 데이터를 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        cache_key = (namespace, primary, variant)
+        entry = self._entries.get(cache_key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                self._remove(cache_key)
+            self.stats[namespace]["misses"] += 1
+            return None
+        
+        self._entries.move_to_end(cache_key)
+        self.stats[namespace]["hits"] += 1
+        return entry[2]
+    
+    def set(self, namespace: str, primary: str, data: Any, variant: str = "", version: Optional[str] = None,
+            ttl: Optional[float] = None):
+        """데이터를 캐시에 저장하고 크기 제한을 넘으면 가장 오래 사용되지 않은 항목을 제거합니다."""
+        ttl = self.ttls.get(namespace, 0) if ttl is None else min(ttl, self.ttls.get(namespace, 0))
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        
+        cache_key = (namespace, primary, variant)
+        self._entries[cache_key] = (time.monotonic() + ttl, version, data)
+        self._entries.move_to_end(cache_key)
+        self._by_primary.setdefault((namespace, primary), set()).add(cache_key)
+        
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats[oldest[0]]["evictions"] += 1
+    
+    def invalidate_if_older(self, namespace: str, primary: str, version: str):
+        """저장된 버전이 주어진 버전보다 오래되었거나 알 수 없으면 해당 항목들을 제거합니다."""
+        for cache_key in list(self._by_primary.get((namespace, primary), ())):
+            cached_version = self._entries[cache_key][1]
+            if cached_version is None or cached_version < version:
+                self._remove(cache_key)
+                self.stats[namespace]["invalidations"] += 1
+    
+    def _remove(self, cache_key: Tuple[str, str, str]):
+        self._entries.pop(cache_key, None)
+        keys = self._by_primary.get(cache_key[:2])
+        if keys is not None:
+            keys.discard(cache_key)
+            if not keys:
+                del self._by_primary[cache_key[:2]]
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """캐시 크기, TTL, 네임스페이스별 적중/실패 카운터를 반환합니다."""
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttls": self.ttls,
+            "stats": self.stats
+        }
+
+class DiskCache:
+    """프로세스 재시작 후에도 유지되는 SQLite 응답 캐시 (압축 저장, 용량 제한, 여러 서버 프로세스 공유)"""
+    
+    # 저장 형식이 바뀌면 올려서 이전 형식의 항목을 무시
+    FORMAT_VERSION = 1
+    
+    # 다른 프로세스가 쓰기 잠금을 잡고 있을 때 기다리는 시간(ms). 이벤트 루프를 오래 막지 않도록 짧게 두고 넘으면 캐시 미사용으로 처리
+    BUSY_TIMEOUT_MS = 50
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            key TEXT PRIMARY KEY,
+            namespace TEXT NOT NULL,
+            primary_key TEXT NOT NULL,
+            format INTEGER NOT NULL,
+            expires REAL NOT NULL,
+            version TEXT,
+            accessed REAL NOT NULL,
+            size INTEGER NOT NULL,
+            data BLOB NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_entries_primary ON entries (namespace, primary_key);
+        CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed);
+    """
+    
+    def __init__(self, directory: str, max_bytes: int, ttls: Dict[str, float]):
+        self.max_bytes = max_bytes
+        self.ttls = ttls
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "jira_response_cache.db")
+        # 여러 서버 프로세스가 같은 파일을 쓰므로 WAL 모드와 잠금 대기 시간을 사용
+        self.conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        self.conn.execute(f"PRAGMA busy_timeout={self.BUSY_TIMEOUT_MS}")
+        self.stats: Dict[str, int] = {
+            "hits": 0, "misses": 0, "writes": 0, "evictions": 0, "invalidations": 0, "busy": 0, "errors": 0
+        }
+        # 검색 결과마다 디스크에 쓰지 않도록 무효화 요청을 모았다가 다음 읽기/쓰기 전에 한 번에 반영
+        self._pending_invalidations: Dict[Tuple[str, str], str] = {}
+    
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+    
+    @staticmethod
+    def _is_busy(error: Exception) -> bool:
+        return isinstance(error, sqlite3.OperationalError) and ("locked" in str(error) or "busy" in str(error))
+    
+    def _write_quietly(self, sql: str, params: Tuple[Any, ...]):
+        """접근 시각 갱신, 만료 항목 삭제처럼 실패해도 되는 쓰기를 실행합니다."""
+        try:
+            self.conn.execute(sql, params)
+        except sqlite3.Error as e:
+            self.stats["busy" if self._is_busy(e) else "errors"] += 1
+    
+    def get(self, key: str) -> Optional[Tuple[Any, Optional[str], float]]:
+        """(데이터, 버전, 남은 TTL)을 반환합니다. 없거나 만료되었거나 형식이 다르면 None을 반환합니다."""
+        self._flush_invalidations()
+        try:
+            row = self.conn.execute(
+                "SELECT format, expires, version, data, namespace, primary_key FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            now = time.time()
+            # 잠금 때문에 아직 반영하지 못한 무효화 대상이면 만료된 것으로 취급
+            pending = self._pending_invalidations.get((row[4], row[5])) if row is not None else None
+            if row is None or row[0] != self.FORMAT_VERSION or row[1] <= now or (pending and (row[2] is None or row[2] < pending)):
+                if row is not None and not pending:
+                    self._write_quietly("DELETE FROM entries WHERE key = ?", (key,))
+                self.stats["misses"] += 1
+                return None
+            data = _loads(zlib.decompress(row[3]))
+        except (sqlite3.Error, zlib.error, ValueError) as e:
+            if self._is_busy(e):
+                self.stats["busy"] += 1
+            else:
+                logger.warning(f"⚠️ 디스크 캐시 읽기 실패: {str(e)}")
+                self.stats["errors"] += 1
+            self.stats["misses"] += 1
+            return None
+        self._write_quietly("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        self.stats["hits"] += 1
+        return data, row[2], row[1] - now
+    
+    def set(self, key: str, namespace: str, primary: str, data: Any, version: Optional[str] = None):
+        """압축해 저장하고 용량 제한을 넘으면 만료된 항목과 오래 사용되지 않은 항목부터 제거합니다."""
+        ttl = self.ttls.get(namespace, 0)
+        if ttl <= 0 or self.max_bytes <= 0:
+            return
+        
+        self._flush_invalidations()
+        blob = zlib.compress(_dumps(data, compact=True).encode("utf-8"))
+        now = time.time()
+        try:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, namespace, primary, self.FORMAT_VERSION, now + ttl, version, now, len(blob), blob)
+            )
+            self.stats["writes"] += 1
+            self._evict(now)
+        except sqlite3.Error as e:
+            # 다른 프로세스가 쓰는 중이면 이번 저장은 건너뜀
+            if self._is_busy(e):
+                self.stats["busy"] += 1
+                return
+            logger.warning(f"⚠️ 디스크 캐시 쓰기 실패: {str(e)}")
+            self.stats["errors"] += 1
+    
+    def _evict(self, now: float):
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        
+        # 다른 프로세스와 동시에 제거하지 않도록 쓰기 잠금을 잡고 다시 계산
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            removed = self.conn.execute("DELETE FROM entries WHERE expires <= ? OR format != ?", (now, self.FORMAT_VERSION)).rowcount
+            total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            # 제한의 90%까지 줄여 매 쓰기마다 제거가 반복되지 않도록 함
+            target = self.max_bytes * 0.9
+            for key, size in self.conn.execute("SELECT key, size FROM entries ORDER BY accessed").fetchall():
+                if total <= target:
+                    break
+                self.conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                total -= size
+                removed += 1
+            self.conn.execute("COMMIT")
+        except sqlite3.Error:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.stats["evictions"] += removed
+    
+    def invalidate_if_older(self, namespace: str, versions: List[Tuple[str, str]]):
+        """(기본 키, 버전) 목록에 대해 저장된 버전이 더 오래되었거나 알 수 없는 항목의 제거를 예약합니다."""
+        for primary, version in versions:
+            pending = self._pending_invalidations.get((namespace, primary))
+            if pending is None or pending < version:
+                self._pending_invalidations[(namespace, primary)] = version
+        if len(self._pending_invalidations) >= 500:
+            self._flush_invalidations()
+    
+    def _flush_invalidations(self):
+        if not self._pending_invalidations:
+            return
+        pending, self._pending_invalidations = self._pending_invalidations, {}
+        try:
+            before = self.conn.total_changes
+            self.conn.execute("BEGIN")
+            self.conn.executemany(
+                "DELETE FROM entries WHERE namespace = ? AND primary_key = ? AND (version IS NULL OR version < ?)",
+                [(namespace, primary, version) for (namespace, primary), version in pending.items()]
+            )
+            self.conn.execute("COMMIT")
+            self.stats["invalidations"] += self.conn.total_changes - before
+        except sqlite3.Error as e:
+            if self.conn.in_transaction:
+                self.conn.execute("ROLLBACK")
+            if self._is_busy(e):
+                # 잠금이 풀린 뒤 다시 반영하도록 보관 (그 사이 get은 대상 항목을 미스로 처리)
+                self.stats["busy"] += 1
+                for (namespace, primary), version in pending.items():
+                    current = self._pending_invalidations.get((namespace, primary))
+                    if current is None or current < version:
+                        self._pending_invalidations[(namespace, primary)] = version
+                return
+            logger.warning(f"⚠️ 디스크 캐시 무효화 실패: {str(e)}")
+            self.stats["errors"] += 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """파일 경로, 항목 수, 크기, TTL과 적중/실패 카운터를 반환합니다."""
+        self._flush_invalidations()
+        try:
+            entries, size = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        except sqlite3.Error:
+            entries, size = None, None
+        return {
+            "path": self.path,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "ttls": self.ttls,
+            "stats": self.stats
+        }
+    
+    def close(self):
+        self._flush_invalidations()
+        self.conn.close()
+
+# 현재 처리 중인 도구 이름 (요청 계층 지표를 도구별로 기록하기 위해 사용)
+CURRENT_TOOL: contextvars.ContextVar[str] = contextvars.ContextVar("current_tool", default="-")
+
+class Operation:
+    """진행 중인 도구 호출. 진행 알림을 보내고 중단 요청(stop_operation, max_seconds)을 확인합니다."""
+    
+    def __init__(self, operation_id: str, tool: str, session: Any = None,
+                 progress_token: Any = None, max_seconds: Optional[float] = None):
+        self.operation_id = operation_id
+        self.tool = tool
+        self.session = session
+        self.progress_token = progress_token
+        self.started = time.time()
+        self.deadline = self.started + max_seconds if max_seconds else None
+        self.stop_reason: Optional[str] = None
+        self.progress: Tuple[float, Optional[float]] = (0, None)
+        self.pages_done = 0
+        self.pages_total = 0
+        self.scope = ""
+    
+    def stop(self, reason: str):
+        if self.stop_reason is None:
+            self.stop_reason = reason
+    
+    @property
+    def stopped(self) -> bool:
+        if self.stop_reason is None and self.deadline is not None and time.time() > self.deadline:
+            self.stop(f"max_seconds({self.deadline - self.started:g}초) 초과")
+        return self.stop_reason is not None
+    
+    async def report(self, progress: float, total: Optional[float], message: str):
+        """진행 상황을 기록하고, 클라이언트가 progressToken을 보냈으면 진행 알림을 전송합니다."""
+        self.progress = (progress, total)
+        if self.session is None or self.progress_token is None:
+            return
+        try:
+            await self.session.send_progress_notification(self.progress_token, progress, total, message)
+        except Exception as e:
+            logger.debug(f"Progress notification failed: {str(e)}")
+    
+    async def page_done(self, pages_total: int = 0):
+        """검색 페이지 하나를 받았음을 알립니다. 여러 하위 검색의 페이지 수를 합산해 진행률이 줄어들지 않게 합니다."""
+        self.pages_total += pages_total
+        self.pages_done += 1
+        await self.report(self.pages_done, self.pages_total, f"{self.pages_done}/{self.pages_total} 페이지 조회")
+    
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "operation_id": self.operation_id,
+            "tool": self.tool,
+            "elapsed": round(time.time() - self.started, 1),
+            "progress": self.progress[0],
+            "total": self.progress[1],
+            "stop_reason": self.stop_reason
+        }
+
+# 현재 처리 중인 도구 호출 (페이지 조회 진행 알림과 중단 확인에 사용)
+CURRENT_OPERATION: contextvars.ContextVar[Optional[Operation]] = contextvars.ContextVar("current_operation", default=None)
+
+# HTTP 모드에서 요청을 보낸 클라이언트의 Jira 인증 헤더 (없으면 서버 인증 정보 사용)
+CURRENT_AUTH: contextvars.ContextVar[Optional[Dict[str, str]]] = contextvars.ContextVar("current_auth", default=None)
+
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BYTES_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+class Histogram:
+    """고정 버킷 히스토그램 (기록 비용이 낮아 운영 환경에서 항상 켜 둘 수 있음)"""
+    
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+    
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+    
+    def quantile(self, q: float) -> float:
+        """버킷 상한으로 근사한 백분위 값을 반환합니다."""
+        target = q * self.count
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target and count:
+                return self.buckets[i] if i < len(self.buckets) else self.max
+        return 0.0
+    
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "avg": round(self.sum / self.count, 6) if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": round(self.max, 6)
+        }
+
+class Metrics:
+    """도구별 지연 시간, 대기 시간, 응답 크기, 파싱/포맷 시간, 오류 유형 지표"""
+    
+    METRICS = {
+        "tool_seconds": SECONDS_BUCKETS,
+        "upstream_seconds": SECONDS_BUCKETS,
+        "wait_seconds": SECONDS_BUCKETS,
+        "parse_seconds": SECONDS_BUCKETS,
+        "format_seconds": SECONDS_BUCKETS,
+        "response_bytes": BYTES_BUCKETS
+    }
+    
+    def __init__(self):
+        self.started = time.time()
+        self.histograms: Dict[Tuple[str, str], Histogram] = {}
+        self.errors: Dict[Tuple[str, str], int] = {}
+    
+    def observe(self, metric: str, value: float, tool: Optional[str] = None):
+        key = (tool or CURRENT_TOOL.get(), metric)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(self.METRICS[metric])
+        histogram.observe(value)
+    
+    def error(self, error_class: str, tool: Optional[str] = None):
+        key = (tool or CURRENT_TOOL.get(), error_class)
+        self.errors[key] = self.errors.get(key, 0) + 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """도구별 히스토그램 요약과 오류 유형별 횟수를 반환합니다."""
+        tools: Dict[str, Dict[str, Any]] = {}
+        for (tool, metric), histogram in sorted(self.histograms.items()):
+            tools.setdefault(tool, {})[metric] = histogram.snapshot()
+        for (tool, error_class), count in sorted(self.errors.items()):
+            tools.setdefault(tool, {}).setdefault("errors", {})[error_class] = count
+        return {"uptime_seconds": round(time.time() - self.started, 1), "tools": tools}
+    
+    def prometheus_text(self) -> str:
+        """Prometheus 텍스트 노출 형식으로 지표를 변환합니다."""
+        lines = []
+        for (tool, metric), histogram in sorted(self.histograms.items()):
+            name = f"ssg_jira_{metric}"
+            cumulative = 0
+            for bound, count in zip((*histogram.buckets, "+Inf"), histogram.counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{tool="{tool}",le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_sum{{tool="{tool}"}} {histogram.sum}')
+            lines.append(f'{name}_count{{tool="{tool}"}} {histogram.count}')
+        for (tool, error_class), count in sorted(self.errors.items()):
+            lines.append(f'ssg_jira_errors_total{{tool="{tool}",class="{error_class}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 요청을 보내지 않았을 때 발생합니다."""
+
+class TokenBucket:
+    """초당 요청 수를 제한하는 토큰 버킷"""
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """토큰 하나를 얻을 때까지 대기합니다. rate가 0 이하이면 제한하지 않습니다."""
+        if self.rate <= 0:
+            return
+        
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class CircuitBreaker:
+    """연속 실패가 쌓이면 일정 시간 요청을 즉시 실패시키는 서킷 브레이커"""
+    
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_started: Optional[float] = None
+    
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+    
+    def check(self):
+        """요청을 보내도 되는지 확인합니다. 차단 중이면 예외를 발생시킵니다."""
+        state = self.state
+        if state == "closed":
+            return
+        now = time.monotonic()
+        if state == "half_open" and (self.trial_started is None or now - self.trial_started >= self.reset_timeout):
+            # 재개 시험 요청은 reset_timeout마다 하나만 허용
+            self.trial_started = now
+            return
+        
+        remaining = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+        raise CircuitOpenError(f"Jira 요청 차단 중 (연속 {self.failures}회 실패): {remaining:.0f}초 후 재시도하세요")
+    
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.trial_started = None
+    
+    def record_failure(self):
+        self.failures += 1
+        self.trial_started = None
+        if self.failure_threshold > 0 and (self.failures >= self.failure_threshold or self.opened_at is not None):
+            self.opened_at = time.monotonic()
+
+class SingleFlight:
+    """동일한 요청이 진행 중이면 새로 보내지 않고 진행 중인 결과를 공유합니다."""
+    
+    def __init__(self):
+        self._calls: Dict[Any, "asyncio.Task"] = {}
+        self.leaders = 0
+        self.saved = 0
+    
+    async def do(self, key: Any, func: Any) -> Any:
+        """key에 대해 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 func()를 실행합니다."""
+        task = self._calls.get(key)
+        if task is not None:
+            self.saved += 1
+        else:
+            # 먼저 요청한 호출자가 취소되어도 다른 대기자에게 결과가 전달되도록 별도 태스크로 실행
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            self.leaders += 1
+            task.add_done_callback(lambda t: self._finish(key, t))
+        return await asyncio.shield(task)
+    
+    def _finish(self, key: Any, task: "asyncio.Task"):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # 모든 대기자가 취소된 경우에도 예외가 회수되지 않았다는 경고가 나지 않도록 조회
+            task.exception()
+    
+    def snapshot(self) -> Dict[str, int]:
+        return {"upstream_calls": self.leaders, "saved": self.saved, "in_flight": len(self._calls)}
+
+class SnapshotStore:
+    """백그라운드에서 미리 조회한 결과 스냅샷. 오래된 스냅샷도 즉시 반환하고 갱신은 비동기로 진행합니다 (stale-while-revalidate)."""
+    
+    def __init__(self):
+        self._snapshots: Dict[str, Tuple[Any, float]] = {}
+        self._refreshing: Dict[str, "asyncio.Task"] = {}
+        self.errors: Dict[str, str] = {}
+        self.stats = {"served": 0, "stale_served": 0, "refreshes": 0, "failures": 0}
+    
+    def refresh(self, key: str, loader: Any) -> "asyncio.Task":
+        """key의 스냅샷을 갱신하는 태스크를 시작합니다. 이미 갱신 중이면 그 태스크를 반환합니다."""
+        task = self._refreshing.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._refresh(key, loader))
+            self._refreshing[key] = task
+            task.add_done_callback(lambda t: self._refreshing.pop(key, None))
+        return task
+    
+    async def _refresh(self, key: str, loader: Any):
+        # 갱신을 시작시킨 도구 호출의 중단 요청, 시간 예산, 클라이언트 인증 정보와 분리
+        CURRENT_OPERATION.set(None)
+        CURRENT_AUTH.set(None)
+        try:
+            value = await loader()
+        except Exception as e:
+            # 갱신에 실패해도 이전 스냅샷은 그대로 유지
+            self.stats["failures"] += 1
+            self.errors[key] = str(e)
+            logger.warning(f"Snapshot refresh failed ({key}): {str(e)}")
+            return
+        self._snapshots[key] = (value, time.time())
+        self.errors.pop(key, None)
+        self.stats["refreshes"] += 1
+    
+    async def get(self, key: str, loader: Any, max_age: float) -> Tuple[Any, float, bool]:
+        """(값, 경과 시간(초), 갱신 중 여부)를 반환합니다. 스냅샷이 없을 때만 조회를 기다립니다."""
+        if key not in self._snapshots:
+            await asyncio.shield(self.refresh(key, loader))
+            if key not in self._snapshots:
+                raise Exception(self.errors.get(key, "스냅샷 조회 실패"))
+        value, fetched_at = self._snapshots[key]
+        age = time.time() - fetched_at
+        self.stats["served"] += 1
+        if age > max_age:
+            self.stats["stale_served"] += 1
+            self.refresh(key, loader)
+        return value, age, key in self._refreshing
+    
+    def snapshot(self) -> Dict[str, Any]:
+        now = time.time()
+        return {
+            "entries": {key: round(now - fetched_at, 1) for key, (_, fetched_at) in self._snapshots.items()},
+            "refreshing": sorted(self._refreshing),
+            "errors": dict(self.errors),
+            "stats": dict(self.stats)
+        }
+
+class IssueMirror:
+    """프로젝트 집합별 SQLite 이슈 미러 (프리셋 멤버십과 동기화 워터마크 저장)"""
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS issues (
+            key TEXT PRIMARY KEY,
+            project_key TEXT,
+            project_name TEXT,
+            status TEXT,
+            issuetype TEXT,
+            epic_link TEXT,
+            qa_owner TEXT,
+            qa_target TEXT,
+            updated TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_issues_status ON issues (status);
+        CREATE INDEX IF NOT EXISTS idx_issues_epic_link ON issues (epic_link);
+        CREATE INDEX IF NOT EXISTS idx_issues_qa_owner ON issues (qa_owner);
+        CREATE INDEX IF NOT EXISTS idx_issues_qa_target ON issues (qa_target);
+        CREATE INDEX IF NOT EXISTS idx_issues_updated ON issues (updated);
+        CREATE TABLE IF NOT EXISTS issue_fix_versions (
+            key TEXT NOT NULL,
+            name TEXT NOT NULL,
+            PRIMARY KEY (key, name)
+        );
+        CREATE INDEX IF NOT EXISTS idx_fix_versions_name ON issue_fix_versions (name);
+        CREATE TABLE IF NOT EXISTS preset_members (
+            preset TEXT NOT NULL,
+            key TEXT NOT NULL,
+            PRIMARY KEY (preset, key)
+        );
+        CREATE TABLE IF NOT EXISTS sync_state (
+            name TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+    
+    def __init__(self, directory: str, projects: List[str]):
+        self.projects = projects
+        digest = hashlib.sha1(",".join(sorted(projects)).encode()).hexdigest()[:10]
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"jira_mirror_{digest}.db")
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript(self.SCHEMA)
+        self.conn.commit()
+    
+    @property
+    def scope_jql(self) -> str:
+        """미러 대상 프로젝트 집합의 JQL"""
+        return "project in ({})".format(",".join(f'"{project}"' for project in self.projects))
+    
+    def upsert_issues(self, issues: List[Dict[str, Any]], epic_link_field: Optional[str]):
+        """검색 결과 이슈들을 저장하고 인덱스 컬럼을 갱신합니다."""
+        rows, versions = [], []
+        for issue in issues:
+            fields_data = issue.get("fields") or {}
+            project = fields_data.get("project") or {}
+            rows.append((
+                issue["key"],
+                project.get("key"),
+                project.get("name"),
+                (fields_data.get("status") or {}).get("name"),
+                (fields_data.get("issuetype") or {}).get("name"),
+                fields_data.get(epic_link_field) if epic_link_field else None,
+                (fields_data.get("customfield_10521") or {}).get("displayName"),
+                (fields_data.get("customfield_12213") or {}).get("value"),
+                fields_data.get("updated"),
+                json.dumps(issue, ensure_ascii=False)
+            ))
+            versions.extend((issue["key"], v.get("name")) for v in fields_data.get("fixVersions") or [])
+        
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self.conn.executemany("DELETE FROM issue_fix_versions WHERE key = ?", [(row[0],) for row in rows])
+            self.conn.executemany("INSERT OR IGNORE INTO issue_fix_versions VALUES (?, ?)", versions)
+    
+    def members(self, preset: str) -> List[str]:
+        return [row[0] for row in self.conn.execute("SELECT key FROM preset_members WHERE preset = ?", (preset,))]
+    
+    def update_members(self, preset: str, add: List[str], remove: List[str], replace: bool = False):
+        """프리셋 멤버십을 갱신합니다. replace이면 기존 멤버를 모두 교체합니다."""
+        with self.conn:
+            if replace:
+                self.conn.execute("DELETE FROM preset_members WHERE preset = ?", (preset,))
+            self.conn.executemany("DELETE FROM preset_members WHERE preset = ? AND key = ?", [(preset, key) for key in remove])
+            self.conn.executemany("INSERT OR IGNORE INTO preset_members VALUES (?, ?)", [(preset, key) for key in add])
+    
+    def out_of_scope(self, keys: List[str]) -> List[str]:
+        """미러 대상 프로젝트에 속하지 않는 이슈 키를 반환합니다."""
+        scope = set(self.projects)
+        result = []
+        for key in keys:
+            row = self.conn.execute("SELECT project_key, project_name FROM issues WHERE key = ?", (key,)).fetchone()
+            if row is None or (row[0] not in scope and row[1] not in scope):
+                result.append(key)
+        return result
+    
+    def query_preset(self, preset: str, fix_version: Optional[str] = None, limit: int = 100) -> Tuple[int, List[Dict[str, Any]]]:
+        """프리셋 멤버 이슈를 최근 수정 순으로 반환합니다."""
+        where = "m.preset = ?"
+        args: List[Any] = [preset]
+        if fix_version:
+            where += " AND EXISTS (SELECT 1 FROM issue_fix_versions f WHERE f.key = i.key AND f.name = ?)"
+            args.append(fix_version)
+        
+        base = f"FROM preset_members m JOIN issues i ON i.key = m.key WHERE {where}"
+        total = self.conn.execute(f"SELECT COUNT(*) {base}", args).fetchone()[0]
+        rows = self.conn.execute(f"SELECT i.data {base} ORDER BY i.updated DESC LIMIT ?", [*args, limit])
+        return total, [json.loads(row[0]) for row in rows]
+    
+    def get_issue(self, key: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT data FROM issues WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def get_state(self, name: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM sync_state WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+    
+    def set_state(self, **values: Any):
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?)",
+                [(name, None if value is None else str(value)) for name, value in values.items()]
+            )
+    
+    def clear(self):
+        """전체 재동기화를 위해 이슈와 멤버십을 비웁니다."""
+        with self.conn:
+            self.conn.execute("DELETE FROM issues")
+            self.conn.execute("DELETE FROM issue_fix_versions")
+            self.conn.execute("DELETE FROM preset_members")
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """미러 상태 요약을 반환합니다."""
+        counts = dict(self.conn.execute("SELECT preset, COUNT(*) FROM preset_members GROUP BY preset").fetchall())
+        return {
+            "path": self.path,
+            "projects": self.projects,
+            "issues": self.conn.execute("SELECT COUNT(*) FROM issues").fetchone()[0],
+            "presets": {preset: counts.get(preset, 0) for preset in MIRROR_PRESETS},
+            "state": dict(self.conn.execute("SELECT name, value FROM sync_state").fetchall())
+        }
+    
+    def close(self):
+        self.conn.close()
+
 class SSGJiraMCPServer:
     def __init__(self):
         self.server = Server("ssg-jira")
@@ -39,6 +1525,119 @@ class SSGJiraMCPServer:
         self.api_token: Optional[str] = self._get_auth_value("api_token")
         self.headers: Optional[Dict[str, str]] = None
         
+        # 공유 HTTP 클라이언트 (첫 요청 시 생성, 종료 시 닫힘)
+        self.client: Optional[httpx.AsyncClient] = None
+        self.max_connections: int = self._get_setting("max_connections", 20, int)
+        self.max_keepalive_connections: int = self._get_setting("max_keepalive_connections", 10, int)
+        self.keepalive_expiry: float = self._get_setting("keepalive_expiry", 30.0, float)
+        self.connect_timeout: float = self._get_setting("connect_timeout", 10.0, float)
+        self.read_timeout: float = self._get_setting("read_timeout", 30.0, float)
+        self.http2: bool = self._get_setting("http2", False, bool)
+        
+        # 요청 속도 제한, 동시 요청 수 제한, 재시도, 서킷 브레이커
+        self.rate_limiter = TokenBucket(
+            rate=self._get_setting("rate_limit", 10.0, float),
+            burst=self._get_setting("rate_burst", 20, int)
+        )
+        self.request_semaphore = asyncio.Semaphore(max(1, self._get_setting("max_concurrency", 10, int)))
+        self.max_retries: int = self._get_setting("max_retries", 3, int)
+        self.retry_backoff_base: float = self._get_setting("retry_backoff_base", 0.5, float)
+        self.retry_backoff_max: float = self._get_setting("retry_backoff_max", 30.0, float)
+        self.circuit = CircuitBreaker(
+            failure_threshold=self._get_setting("circuit_failure_threshold", 5, int),
+            reset_timeout=self._get_setting("circuit_reset_timeout", 30.0, float)
+        )
+        
+        # 도구 호출/요청 계층 지표와 주기적 덤프 설정
+        self.metrics = Metrics()
+        self.stats_dump_path: Optional[str] = self._get_setting("stats_dump_path", None)
+        self.stats_dump_format: str = self._get_setting("stats_dump_format", "prometheus")
+        self.stats_dump_interval: float = self._get_setting("stats_dump_interval", 60.0, float)
+        
+        # 기본 출력 형식과 응답 글자 수 예산
+        self.output_format: str = self._get_setting("output_format", "pretty")
+        self.max_chars: int = self._get_setting("max_chars", 0, int)
+        
+        # 동일 GET 요청 합치기 (single-flight)
+        self.single_flight = SingleFlight()
+        
+        # 진행 중인 도구 호출 (진행 알림, stop_operation 중단 요청)
+        self.operations: Dict[str, Operation] = {}
+        self._operation_seq = 0
+        
+        # 검색 응답 스트리밍 해석 (이슈를 하나씩 변환해 원본 응답 전체를 메모리에 두지 않음)
+        self.stream_search: bool = self._get_setting("stream_search", True, bool)
+        
+        # 전송 방식: stdio(기본값) 또는 http (streamable HTTP + SSE, 여러 클라이언트가 한 프로세스를 공유)
+        self.transport: str = self._get_setting("transport", "stdio").lower()
+        self.http_host: str = self._get_setting("http_host", "127.0.0.1")
+        self.http_port: int = self._get_setting("http_port", 8765, int)
+        self.http_path: str = self._get_setting("http_path", "/mcp")
+        self.http_server: Any = None
+        
+        # 검색 페이지 동시 조회 수
+        self.page_concurrency: int = self._get_setting("page_concurrency", 5, int)
+        self.batch_chunk_size: int = self._get_setting("batch_chunk_size", 50, int)
+        
+        # export_issues 기본 저장 디렉터리
+        self.export_dir: str = os.path.expanduser(self._get_setting("export_dir", "~/jira_exports"))
+        
+        # 필드 이름 → 필드 ID 조회 결과 (예: Epic Link)
+        self.field_ids: Dict[str, str] = {}
+        
+        # changes_since 이름별 워터마크와 마지막으로 본 이슈 상태
+        self.change_feeds: Dict[str, Dict[str, Any]] = {}
+        self.change_feed_lock = asyncio.Lock()
+        
+        # 로컬 SQLite 이슈 미러 (JIRA_MIRROR_DIR 설정 시 활성화)
+        self.mirror: Optional[IssueMirror] = None
+        self.mirror_max_staleness: float = self._get_setting("mirror_max_staleness", 60.0, float)
+        self.mirror_lock = asyncio.Lock()
+        self.mirror_initial_sync: Optional["asyncio.Task"] = None
+        mirror_dir = self._get_setting("mirror_dir", None)
+        if mirror_dir:
+            projects = self._get_setting("mirror_projects", DEFAULT_MIRROR_PROJECTS)
+            self.mirror = IssueMirror(mirror_dir, [p.strip() for p in projects.split(",") if p.strip()])
+            logger.info(f"🗃️ 로컬 이슈 미러 사용: {self.mirror.path}")
+        
+        # 프로젝트/버전/이슈 조회 응답 캐시
+        self.cache = ResponseCache(
+            max_entries=self._get_setting("cache_max_entries", 1000, int),
+            ttls={
+                "project": self._get_setting("cache_ttl_project", 3600.0, float),
+                "versions": self._get_setting("cache_ttl_versions", 600.0, float),
+                "issue": self._get_setting("cache_ttl_issue", 60.0, float)
+            }
+        )
+        
+        # 프로세스 재시작 후에도 유지되는 디스크 응답 캐시 (JIRA_DISK_CACHE_DIR 설정 시 활성화)
+        self.disk_cache: Optional[DiskCache] = None
+        disk_cache_dir = self._get_setting("disk_cache_dir", None)
+        if disk_cache_dir:
+            self.disk_cache = DiskCache(
+                os.path.expanduser(disk_cache_dir),
+                max_bytes=int(self._get_setting("disk_cache_max_mb", 50.0, float) * 1024 * 1024),
+                ttls={
+                    namespace: self._get_setting(f"disk_cache_ttl_{namespace}", ttl, float)
+                    for namespace, ttl in self.cache.ttls.items()
+                }
+            )
+            logger.info(f"💾 디스크 응답 캐시 사용: {self.disk_cache.path}")
+        
+        # 프리셋 검색/프로젝트 버전 백그라운드 예열 (JIRA_WARMUP 설정 시 활성화)
+        self.snapshots: Optional[SnapshotStore] = None
+        self.warmup_presets: List[str] = []
+        self.warmup_projects: List[str] = []
+        self.warmup_interval: float = self._get_setting("warmup_interval", 300.0, float)
+        self.warmup_versions_interval: float = self._get_setting("warmup_versions_interval", 1800.0, float)
+        if self._get_setting("warmup", False, bool):
+            self.snapshots = SnapshotStore()
+            presets = self._get_setting("warmup_presets", ",".join(QA_PRESET_JQL))
+            self.warmup_presets = [p.strip() for p in presets.split(",") if p.strip() in QA_PRESET_JQL]
+            projects = self._get_setting("warmup_projects", "QAQ")
+            self.warmup_projects = [p.strip() for p in projects.split(",") if p.strip()]
+            logger.info(f"🔥 백그라운드 예열 사용: 프리셋 {self.warmup_presets}, 버전 {self.warmup_projects}")
+        
         # 인증 정보가 있으면 자동으로 설정
         if self.username and self.api_token:
             self._setup_auth_headers()
@@ -62,17 +1661,52 @@ class SSGJiraMCPServer:
         env_key = f"JIRA_{key.upper()}"
         return os.getenv(env_key)
     
+    def _get_setting(self, key: str, default: Any, cast: Any = str) -> Any:
+        """명령행 인수 또는 환경 변수에서 설정 값을 가져와 지정한 타입으로 변환합니다."""
+        value = self._get_auth_value(key)
+        if value is None or value == "":
+            return default
+        
+        try:
+            if cast is bool:
+                return value.strip().lower() in ("1", "true", "yes", "y", "on")
+            return cast(value)
+        except ValueError:
+            logger.warning(f"⚠️ 잘못된 설정 값: {key}={value}, 기본값 {default} 사용")
+            return default
+    
     def _setup_auth_headers(self):
         """인증 헤더를 설정합니다."""
         if self.username and self.api_token:
             credentials = f"{self.username}:{self.api_token}"
             encoded_credentials = base64.b64encode(credentials.encode()).decode()
             
-            self.headers = {
-                "Authorization": f"Basic {encoded_credentials}",
-                "Accept": "application/json",
-                "Content-Type": "application/json"
-            }
+            self.headers = _basic_auth_headers(f"Basic {encoded_credentials}")
+    
+    def _auth_headers(self) -> Optional[Dict[str, str]]:
+        """현재 요청에 사용할 인증 헤더. HTTP 클라이언트가 자기 인증 정보를 보냈으면 그것을 사용합니다."""
+        return CURRENT_AUTH.get() or self.headers
+    
+    def _credential_scope(self) -> str:
+        """클라이언트 인증 정보별 캐시/상태 구분자. 서버 인증 정보를 쓰면 빈 문자열입니다."""
+        client_auth = CURRENT_AUTH.get()
+        if not client_auth:
+            return ""
+        return hashlib.sha256(client_auth["Authorization"].encode()).hexdigest()[:16]
+    
+    def _request_auth(self, request: Any) -> Optional[Dict[str, str]]:
+        """HTTP 요청 헤더(X-Jira-Username/X-Jira-Api-Token 또는 Authorization: Basic)에서 클라이언트 인증 헤더를 만듭니다."""
+        headers = getattr(request, "headers", None)
+        if not headers:
+            return None
+        username, api_token = headers.get("x-jira-username"), headers.get("x-jira-api-token")
+        if username and api_token:
+            encoded_credentials = base64.b64encode(f"{username}:{api_token}".encode()).decode()
+            return _basic_auth_headers(f"Basic {encoded_credentials}")
+        authorization = headers.get("authorization", "")
+        if authorization.lower().startswith("basic "):
+            return _basic_auth_headers(authorization)
+        return None
     
     def setup_tools(self):
         """MCP 도구들을 설정합니다."""
@@ -80,304 +1714,1217 @@ class SSGJiraMCPServer:
         @self.server.list_tools()
         async def handle_list_tools() -> List[types.Tool]:
             """사용 가능한 도구 목록을 반환합니다."""
-            return [
-                types.Tool(
-                    name="get_project",
-                    description="프로젝트 정보를 조회합니다",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_key": {
-                                "type": "string",
-                                "description": "프로젝트 키 (예: QAQ, WASD, PROMO)"
-                            }
-                        },
-                        "required": ["project_key"]
-                    }
-                ),
-                types.Tool(
-                    name="search_issues",
-                    description="JQL을 사용하여 이슈를 검색합니다",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "jql": {
-                                "type": "string",
-                                "description": "JQL 쿼리 (예: project = QAQ AND status = 'In Progress')"
-                            },
-                            "fields": {
-                                "type": "string",
-                                "description": "조회할 필드 (콤마로 구분, 기본값: 주요 필드들)",
-                                "default": "summary,status,priority,issuetype,assignee,created,updated"
-                            },
-                            "max_results": {
-                                "type": "integer",
-                                "description": "최대 결과 수 (기본값: 50)",
-                                "default": 50
-                            }
-                        },
-                        "required": ["jql"]
-                    }
-                ),
-                types.Tool(
-                    name="get_issue",
-                    description="단건 이슈 정보를 조회합니다",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "issue_key": {
-                                "type": "string",
-                                "description": "이슈 키 (예: QAQ-777, WASD-1251)"
-                            },
-                            "fields": {
-                                "type": "string",
-                                "description": "조회할 필드 (콤마로 구분, 기본값: 모든 필드)"
-                            }
-                        },
-                        "required": ["issue_key"]
-                    }
-                ),
-                types.Tool(
-                    name="get_project_versions",
-                    description="프로젝트의 버전 목록을 조회합니다",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_key": {
-                                "type": "string",
-                                "description": "프로젝트 키 (예: QAQ, WASD)"
-                            }
-                        },
-                        "required": ["project_key"]
-                    }
-                ),
-                types.Tool(
-                    name="search_qa_issues",
-                    description="QA 관련 이슈를 검색합니다 (미리 정의된 JQL 사용)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "search_type": {
-                                "type": "string",
-                                "enum": ["in_progress_epics", "qa_target", "deploy_waiting", "epic_issues"],
-                                "description": "검색 유형: in_progress_epics(진행중 에픽), qa_target(QA 대상), deploy_waiting(배포 대기), epic_issues(특정 에픽의 이슈들)"
-                            },
-                            "epic_key": {
-                                "type": "string",
-                                "description": "에픽 키 (search_type이 'epic_issues'일 때 필수)"
-                            },
-                            "fix_version": {
-                                "type": "string",
-                                "description": "픽스 버전 (search_type이 'deploy_waiting'일 때 선택사항)"
-                            }
-                        },
-                        "required": ["search_type"]
-                    }
-                )
-            ]
+            return TOOLS
+        
+        @self.server.call_tool()
+        async def handle_call_tool(
+            name: str, arguments: Dict[str, Any]
+        ) -> List[types.TextContent]:
+            """도구 호출을 처리하고 도구별 소요 시간과 실패를 기록합니다."""
+            token = CURRENT_TOOL.set(name)
+            try:
+                # 이전 mcp 버전의 RequestContext에는 request 속성이 없음
+                request = getattr(self.server.request_context, "request", None)
+            except LookupError:
+                request = None
+            auth_token = CURRENT_AUTH.set(self._request_auth(request))
+            operation = self._start_operation(name, arguments)
+            operation_token = CURRENT_OPERATION.set(operation)
+            started = time.perf_counter()
+            try:
+                result = await self._dispatch_tool(name, arguments)
+                if result and result[0].text.startswith("❌"):
+                    self.metrics.error("ToolError")
+                return result
+            finally:
+                self.metrics.observe("tool_seconds", time.perf_counter() - started)
+                CURRENT_OPERATION.reset(operation_token)
+                self.operations.pop(operation.operation_id, None)
+                CURRENT_AUTH.reset(auth_token)
+                CURRENT_TOOL.reset(token)
+    
+    def _start_operation(self, name: str, arguments: Dict[str, Any]) -> Operation:
+        """도구 호출을 진행 중 목록에 등록합니다. 클라이언트의 progressToken이 있으면 작업 ID로 사용합니다."""
+        try:
+            context = self.server.request_context
+        except LookupError:
+            context = None
+        progress_token = getattr(context.meta, "progressToken", None) if context and context.meta else None
+        if progress_token is not None:
+            operation_id = str(progress_token)
+        elif context is not None:
+            operation_id = str(context.request_id)
+        else:
+            self._operation_seq += 1
+            operation_id = f"local-{self._operation_seq}"
+        if operation_id in self.operations:
+            # HTTP 모드에서는 여러 세션의 요청 ID가 겹칠 수 있음
+            self._operation_seq += 1
+            operation_id = f"{operation_id}-{self._operation_seq}"
+        operation = Operation(
+            operation_id, name,
+            session=context.session if context else None,
+            progress_token=progress_token,
+            max_seconds=arguments.get("max_seconds")
+        )
+        operation.scope = self._credential_scope()
+        self.operations[operation_id] = operation
+        return operation
+    
+    async def _dispatch_tool(self, name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """도구 이름에 맞는 처리 함수를 호출합니다."""
+        try:
+            if name == "get_project":
+                return await self._get_project(arguments)
+            elif name == "search_issues":
+                return await self._search_issues(arguments)
+            elif name == "get_issue":
+                return await self._get_issue(arguments)
+            elif name == "get_issues":
+                return await self._get_issues(arguments)
+            elif name == "get_issue_activity":
+                return await self._get_issue_activity(arguments)
+            elif name == "aggregate_issues":
+                return await self._aggregate_issues(arguments)
+            elif name == "batch":
+                return await self._batch(arguments)
+            elif name == "export_issues":
+                return await self._export_issues(arguments)
+            elif name == "expand_epic":
+                return await self._expand_epic(arguments)
+            elif name == "get_project_versions":
+                return await self._get_project_versions(arguments)
+            elif name == "search_qa_issues":
+                return await self._search_qa_issues(arguments)
+            elif name == "changes_since":
+                return await self._changes_since(arguments)
+            elif name == "sync_status":
+                return await self._sync_status(arguments)
+            elif name == "server_stats":
+                return await self._server_stats(arguments)
+            elif name == "cache_stats":
+                return await self._cache_stats(arguments)
+            elif name == "stop_operation":
+                return await self._stop_operation(arguments)
+            else:
+                raise ValueError(f"Unknown tool: {name}")
+        except Exception as e:
+            logger.error(f"Tool execution error: {name}, {str(e)}")
+            return [types.TextContent(
+                type="text",
+                text=f"❌ 오류 발생: {str(e)}"
+            )]
+    
+    async def _check_auth(self):
+        """인증 정보가 설정되었는지 확인합니다."""
+        if not self._auth_headers():
+            raise ValueError("인증 정보가 설정되지 않았습니다. 환경 변수 JIRA_USERNAME, JIRA_API_TOKEN을 설정하거나 명령행 인수 --username, --api_token을 사용하세요.")
+    
+    def _create_client(self) -> httpx.AsyncClient:
+        """커넥션 풀과 keep-alive가 설정된 공유 HTTP 클라이언트를 생성합니다."""
+        http2 = self.http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("⚠️ h2 패키지가 없어 HTTP/1.1로 동작합니다. (pip install httpx[http2])")
+            http2 = False
+        
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
+        timeout = httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.read_timeout,
+            pool=self.connect_timeout
+        )
+        return httpx.AsyncClient(limits=limits, timeout=timeout, http2=http2, verify=False)
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """공유 HTTP 클라이언트를 반환합니다. 아직 없으면 생성합니다."""
+        if self.client is None or self.client.is_closed:
+            self.client = self._create_client()
+        return self.client
+    
+    async def aclose(self):
+        """공유 HTTP 클라이언트를 닫습니다."""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """재시도 대기 시간을 계산합니다. Retry-After가 있으면 우선하고, 없으면 지터가 있는 지수 백오프를 사용합니다."""
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                return min(self.retry_backoff_max, max(0.0, delay)) + random.uniform(0, self.retry_backoff_base)
+        
+        return random.uniform(0, min(self.retry_backoff_max, self.retry_backoff_base * (2 ** attempt)))
+    
+    async def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None, **kwargs) -> Dict[str, Any]:
+        """HTTP 요청을 수행합니다. 동시에 들어온 동일한 GET 요청은 한 번만 보내고 결과를 공유합니다."""
+        await self._check_auth()
+        
+        if method.upper() != "GET" or kwargs:
+            return await self._send_request(method, endpoint, params, **kwargs)
+        
+        key = (
+            method.upper(),
+            endpoint,
+            json.dumps(params or {}, sort_keys=True, default=str),
+            self._auth_headers().get("Authorization")
+        )
+        return await self.single_flight.do(key, lambda: self._send_request(method, endpoint, params))
+    
+    async def _send_request(self, method: str, endpoint: str, params: Optional[Dict] = None,
+                            consume: Optional[Callable[[httpx.Response], Awaitable[Any]]] = None, **kwargs) -> Dict[str, Any]:
+        """Jira로 요청을 보냅니다. 멱등한 GET 요청은 429/5xx/네트워크 오류 시 재시도합니다.
+        
+        consume이 있으면 성공 응답 본문을 스트리밍으로 넘기고 그 반환값을 결과로 사용합니다.
+        """
+        url = f"{self.base_url}{endpoint}"
+        retries = self.max_retries if method.upper() == "GET" else 0
+        attempt = 0
+        try:
+            self.circuit.check()
+        except CircuitOpenError:
+            self.metrics.error("CircuitOpenError")
+            raise
+        
+        while True:
+            try:
+                wait_started = time.perf_counter()
+                await self.rate_limiter.acquire()
+                async with self.request_semaphore:
+                    upstream_started = time.perf_counter()
+                    self.metrics.observe("wait_seconds", upstream_started - wait_started)
+                    client = await self._get_client()
+                    if consume is None:
+                        response = await client.request(
+                            method, 
+                            url, 
+                            headers=self._auth_headers(),
+                            params=params,
+                            **kwargs
+                        )
+                    else:
+                        request = client.build_request(method, url, headers=self._auth_headers(), params=params, **kwargs)
+                        response = await client.send(request, stream=True)
+                        try:
+                            if response.is_success:
+                                consumed = await consume(response)
+                            else:
+                                await response.aread()
+                        finally:
+                            await response.aclose()
+                    self.metrics.observe("upstream_seconds", time.perf_counter() - upstream_started)
+                self.metrics.observe("response_bytes", response.num_bytes_downloaded if consume else len(response.content))
+                
+                if (response.status_code == 429 or response.status_code >= 500) and attempt < retries:
+                    delay = self._retry_delay(attempt, response.headers.get("Retry-After"))
+                    logger.warning(f"HTTP {response.status_code}, {delay:.1f}초 후 재시도 ({attempt + 1}/{retries}): {endpoint}")
+                    attempt += 1
+                    await asyncio.sleep(delay)
+                    continue
+                
+                response.raise_for_status()
+                self.circuit.record_success()
+                if consume is not None:
+                    return consumed
+                parse_started = time.perf_counter()
+                data = response.json()
+                self.metrics.observe("parse_seconds", time.perf_counter() - parse_started)
+                return data
+            except httpx.HTTPStatusError as e:
+                self.metrics.error(f"HTTP {e.response.status_code}")
+                if e.response.status_code == 429 or e.response.status_code >= 500:
+                    self.circuit.record_failure()
+                else:
+                    # 4xx는 Jira가 정상 응답한 것이므로 서킷을 닫힌 상태로 유지
+                    self.circuit.record_success()
+                logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
+                raise Exception(f"HTTP {e.response.status_code}: {e.response.text[:200]}")
+            except httpx.TransportError as e:
+                if attempt < retries:
+                    delay = self._retry_delay(attempt)
+                    logger.warning(f"Request error: {str(e)}, {delay:.1f}초 후 재시도 ({attempt + 1}/{retries})")
+                    attempt += 1
+                    await asyncio.sleep(delay)
+                    continue
+                self.circuit.record_failure()
+                self.metrics.error(type(e).__name__)
+                logger.error(f"Request error: {str(e)}")
+                raise
+            except Exception as e:
+                self.metrics.error(type(e).__name__)
+                logger.error(f"Request error: {str(e)}")
+                raise
+    
+    def _format_result(self, title: str, result: Any, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """결과를 output_format으로 직렬화하고 max_chars 예산을 적용해 도구 응답을 만듭니다."""
+        format_started = time.perf_counter()
+        output_format = arguments.get("output_format") or self.output_format
+        if output_format not in OUTPUT_FORMATS:
+            output_format = "pretty"
+        max_chars = arguments.get("max_chars") or self.max_chars
+        
+        meta, row_key, rows = _split_rows(result)
+        body = _serialize(output_format, meta, row_key, rows)
+        notes = []
+        
+        if max_chars and len(body) > max_chars:
+            # 1단계: description을 점점 짧게 잘라냄
+            longest = max(
+                (len(item["description"]) for item in [meta, *(rows or [])]
+                 if isinstance(item, dict) and isinstance(item.get("description"), str)),
+                default=0
+            )
+            limit, cut_meta, cut_rows, count, removed = longest, meta, rows, 0, 0
+            while len(body) > max_chars and limit > 0:
+                limit = limit // 2 if limit >= 100 else 0
+                (cut_meta,), meta_count, meta_removed = _truncate_descriptions([meta], limit)
+                cut_rows, count, removed = _truncate_descriptions(rows, limit) if rows is not None else (None, 0, 0)
+                count, removed = count + meta_count, removed + meta_removed
+                body = _serialize(output_format, cut_meta, row_key, cut_rows)
+            if count:
+                notes.append(f"description {count}건을 {limit}자로 잘라냄 (총 {removed}자 제거)")
+            
+            # 2단계: 그래도 넘으면 뒤쪽 행을 생략
+            if len(body) > max_chars and cut_rows:
+                low, high = 0, len(cut_rows)
+                while low < high:
+                    middle = (low + high + 1) // 2
+                    if len(_serialize(output_format, cut_meta, row_key, cut_rows[:middle])) <= max_chars:
+                        low = middle
+                    else:
+                        high = middle - 1
+                notes.append(f"{len(cut_rows) - low}건 생략 ({low}/{len(cut_rows)}건 표시)")
+                body = _serialize(output_format, cut_meta, row_key, cut_rows[:low])
+        
+        fence = "jsonl" if rows is not None and output_format in ("table", "ndjson") else "json"
+        text = f"{title}:\n```{fence}\n{body}\n```"
+        if notes:
+            text += f"\n✂️ max_chars({max_chars}) 적용: " + ", ".join(notes)
+        self.metrics.observe("format_seconds", time.perf_counter() - format_started)
+        return [types.TextContent(type="text", text=text)]
+    
+    async def _cached_request(self, namespace: str, primary: str, endpoint: str,
+                              params: Optional[Dict] = None, bypass_cache: bool = False) -> Any:
+        """캐시를 먼저 확인하고, 없으면 Jira에 요청한 뒤 결과를 캐시에 저장합니다."""
+        variant = json.dumps(params, sort_keys=True) if params else ""
+        scope = self._credential_scope()
+        if scope:
+            # 클라이언트 인증 정보별로 캐시를 분리 (권한이 다른 계정에 응답이 섞이지 않도록)
+            variant = f"{scope}|{variant}"
+        disk_key = None
+        if self.disk_cache is not None:
+            # 디스크 캐시는 여러 프로세스가 공유하므로 서버 주소와 인증 정보까지 키에 포함
+            disk_key = DiskCache.make_key(
+                self.base_url, endpoint, variant,
+                hashlib.sha256((self._auth_headers() or {}).get("Authorization", "").encode()).hexdigest()
+            )
+        if not bypass_cache:
+            data = self.cache.get(namespace, primary, variant)
+            if data is not None:
+                return data
+            cached = self.disk_cache.get(disk_key) if disk_key else None
+            if cached is not None:
+                data, version, remaining = cached
+                self.cache.set(namespace, primary, data, variant=variant, version=version, ttl=remaining)
+                return data
+        
+        data = await self._make_request("GET", endpoint, params=params)
+        version = data.get("fields", {}).get("updated") if isinstance(data, dict) else None
+        self.cache.set(namespace, primary, data, variant=variant, version=version)
+        if disk_key:
+            self.disk_cache.set(disk_key, namespace, primary, data, version=version)
+        return data
+    
+    def _invalidate_stale_issues(self, issues: List[Dict[str, Any]]):
+        """검색 결과에 더 최신 updated가 보이는 이슈의 캐시 항목을 무효화합니다."""
+        versions = []
+        for issue in issues:
+            updated = (issue.get("fields") or {}).get("updated")
+            if updated and issue.get("key"):
+                self.cache.invalidate_if_older("issue", issue["key"], updated)
+                versions.append((issue["key"], updated))
+        if self.disk_cache is not None:
+            self.disk_cache.invalidate_if_older("issue", versions)
+    
+    async def _project_info(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """프로젝트 정보를 조회해 주요 항목을 추출합니다."""
+        project_key = arguments["project_key"]
+        data = await self._cached_request(
+            "project", project_key, f"/rest/api/2/project/{project_key}",
+            bypass_cache=arguments.get("bypass_cache", False)
+        )
+        
+        return {
+            "key": data.get("key"),
+            "name": data.get("name"),
+            "description": data.get("description"),
+            "lead": data.get("lead", {}).get("displayName"),
+            "projectTypeKey": data.get("projectTypeKey"),
+            "category": data.get("projectCategory", {}).get("name") if data.get("projectCategory") else None
+        }
+    
+    async def _get_project(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """프로젝트 정보를 조회합니다."""
+        try:
+            result = await self._project_info(arguments)
+            return self._format_result("📋 프로젝트 정보", result, arguments)
+            
+        except Exception as e:
+            logger.error(f"Project fetch error: {str(e)}")
+            return [types.TextContent(
+                type="text",
+                text=f"❌ 프로젝트 조회 실패: {str(e)}"
+            )]
+    
+    async def _search_page(self, params: Dict[str, Any], transform: Optional[Callable[[Dict[str, Any]], Any]] = None,
+                           transform_key: Optional[str] = None) -> Dict[str, Any]:
+        """검색 한 페이지를 조회합니다.
+        
+        transform이 있으면 응답 본문을 스트리밍으로 해석해 이슈를 하나씩 변환하고 원본 이슈는 보관하지 않습니다.
+        동시에 들어온 같은 검색은 transform_key가 같을 때만 합칩니다.
+        """
+        if transform is None or not self.stream_search:
+            data = await self._make_request("GET", "/rest/api/2/search", params=params)
+            if transform is not None:
+                data = {**data, "issues": [transform(issue) for issue in data.get("issues", [])]}
+            return data
+        
+        await self._check_auth()
+        
+        async def consume(response: httpx.Response) -> Dict[str, Any]:
+            parser = SearchStreamParser()
+            issues = []
+            parse_seconds = 0.0
+            async for chunk in response.aiter_bytes():
+                parse_started = time.perf_counter()
+                issues.extend(transform(issue) for issue in parser.feed(chunk))
+                parse_seconds += time.perf_counter() - parse_started
+            parse_started = time.perf_counter()
+            data = parser.finish()
+            self.metrics.observe("parse_seconds", parse_seconds + time.perf_counter() - parse_started)
+            data["issues"] = issues
+            return data
+        
+        def send() -> Awaitable[Dict[str, Any]]:
+            return self._send_request("GET", "/rest/api/2/search", params, consume=consume)
+        
+        if transform_key is None:
+            return await send()
+        key = ("STREAM", transform_key, json.dumps(params, sort_keys=True, default=str), self._auth_headers().get("Authorization"))
+        return await self.single_flight.do(key, send)
+    
+    async def _iter_search_pages(self, params: Dict[str, Any], limit: Optional[int] = None,
+                                 transform: Optional[Callable[[Dict[str, Any]], Any]] = None,
+                                 transform_key: Optional[str] = None, partial_ok: bool = False) -> AsyncIterator["SearchPage"]:
+        """첫 페이지의 total을 기준으로 나머지 startAt 페이지를 동시에 조회해 도착하는 순서대로 반환합니다.
+        
+        partial_ok이면 (도구가 직접 실행한 검색) 페이지마다 진행 알림을 보내고 중단 요청 시 남은 페이지 조회를 멈춥니다.
+        내부 보조 조회(키 목록 조회, 미러 동기화 등)는 진행 상황을 보고하지 않습니다.
+        """
+        operation = CURRENT_OPERATION.get() if partial_ok else None
+        page_size = params["maxResults"]
+        if limit is not None:
+            page_size = max(1, min(page_size, limit))
+            params = {**params, "maxResults": page_size}
+        first = await self._search_page({**params, "startAt": 0}, transform, transform_key)
+        
+        total = first.get("total", 0)
+        target = total if limit is None else min(limit, total)
+        # Jira 서버 상한에 의해 maxResults가 줄어들 수 있으므로 응답 값을 우선 사용
+        step = min(page_size, first.get("maxResults") or page_size) or page_size
+        pages_total = max(1, -(-target // step))
+        if operation is not None:
+            await operation.page_done(pages_total)
+        yield SearchPage(0, total, target, step, first.get("issues", []))
+        if operation is not None and operation.stopped:
+            return
+        
+        semaphore = asyncio.Semaphore(max(1, self.page_concurrency))
+        
+        async def fetch_page(start_at: int) -> SearchPage:
+            async with semaphore:
+                page = await self._search_page({**params, "startAt": start_at}, transform, transform_key)
+                return SearchPage(start_at, total, target, step, page.get("issues", []))
+        
+        tasks = [asyncio.ensure_future(fetch_page(start_at)) for start_at in range(step, target, step)]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                # 중단 여부는 받은 페이지를 반환한 뒤 확인 (대기 중인 코루틴을 버리지 않도록)
+                page = await next_page
+                if operation is not None:
+                    await operation.page_done()
+                yield page
+                if operation is not None and operation.stopped:
+                    return
+        finally:
+            # 호출자가 중간에 멈추면 남은 페이지 요청을 취소
+            for task in tasks:
+                task.cancel()
+    
+    async def _search_all(self, params: Dict[str, Any], limit: Optional[int] = None,
+                          transform: Optional[Callable[[Dict[str, Any]], Any]] = None,
+                          transform_key: Optional[str] = None, partial_ok: bool = False) -> Dict[str, Any]:
+        """모든 페이지를 동시에 조회해 startAt 순서대로 병합합니다. 중단되면 받은 페이지만 병합하고 partial을 표시합니다."""
+        pages: Dict[int, List[Dict[str, Any]]] = {}
+        async for page in self._iter_search_pages(params, limit, transform, transform_key, partial_ok):
+            pages[page.start_at] = page.issues
+            total, target, step = page.total, page.target, page.page_size
+        
+        # 페이지 사이에 결과가 밀린 경우를 대비해 중복 키 제거
+        issues = []
+        seen = set()
+        for start_at in sorted(pages):
+            for issue in pages[start_at]:
+                if issue.get("key") in seen:
+                    continue
+                seen.add(issue.get("key"))
+                issues.append(issue)
+        
+        result = {
+            "total": total,
+            "maxResults": step,
+            "startAt": 0,
+            "issues": issues[:target]
+        }
+        operation = CURRENT_OPERATION.get()
+        if partial_ok and len(pages) < len(range(0, target, step)) and operation is not None:
+            result["partial"] = operation.stop_reason
+        return result
+    
+    def _build_search_issue_info(self, issue: Dict[str, Any]) -> Dict[str, Any]:
+        """검색 결과 이슈에서 목록용 주요 정보를 추출합니다."""
+        fields_data = issue.get("fields", {})
+        return {
+            "key": issue.get("key"),
+            "summary": fields_data.get("summary"),
+            "status": fields_data.get("status", {}).get("name") if fields_data.get("status") else None,
+            "priority": fields_data.get("priority", {}).get("name") if fields_data.get("priority") else None,
+            "assignee": fields_data.get("assignee", {}).get("displayName") if fields_data.get("assignee") else None,
+            "created": fields_data.get("created"),
+            "updated": fields_data.get("updated")
+        }
+    
+    def _search_issue_transform(self, issue: Dict[str, Any]) -> Dict[str, Any]:
+        """검색 응답 이슈 하나를 캐시 무효화에 반영하고 목록용 정보로 변환합니다."""
+        self._invalidate_stale_issues([issue])
+        return self._build_search_issue_info(issue)
+    
+    def _render_search_result(self, result: Dict[str, Any], arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """검색 결과를 도구 응답 형식으로 변환합니다."""
+        if result.get("partial"):
+            title = f"🔍 검색 결과 ({result['total']}건 중 {len(result['issues'])}건, 중단됨)"
+            return self._format_result(title, result, arguments)
+        return self._format_result(f"🔍 검색 결과 ({result['total']}건)", result, arguments)
+    
+    async def _run_search(self, jql: str, fields: str, max_results: int,
+                          fetch_all: bool = False, limit: Optional[int] = None, partial_ok: bool = False) -> Dict[str, Any]:
+        """JQL 검색을 실행해 목록용 결과로 변환합니다."""
+        params = {
+            "jql": jql,
+            "fields": fields,
+            "maxResults": max_results
+        }
         
-        @self.server.call_tool()
-        async def handle_call_tool(
-            name: str, arguments: Dict[str, Any]
-        ) -> List[types.TextContent]:
-            """도구 호출을 처리합니다."""
+        # 응답을 스트리밍으로 해석하며 이슈마다 바로 목록용 정보로 변환
+        if fetch_all or limit is not None:
+            data = await self._search_all(
+                params, None if fetch_all else limit, self._search_issue_transform, "search_info", partial_ok
+            )
+        else:
+            data = await self._search_page(params, self._search_issue_transform, "search_info")
+        
+        result = {
+            "total": data.get("total"),
+            "maxResults": data.get("maxResults"),
+            "startAt": data.get("startAt"),
+            "issues": data.get("issues", [])
+        }
+        if data.get("partial"):
+            result["partial"] = data["partial"]
+        return result
+    
+    async def _search_result(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """search_issues 인수로 검색을 실행합니다."""
+        return await self._run_search(
+            arguments["jql"],
+            arguments.get("fields", "summary,status,priority,issuetype,assignee,created,updated"),
+            arguments.get("max_results", 50),
+            fetch_all=arguments.get("fetch_all", False),
+            limit=arguments.get("limit"),
+            partial_ok=True
+        )
+    
+    async def _search_issues(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """JQL로 이슈를 검색합니다."""
+        try:
+            result = await self._search_result(arguments)
+            return self._render_search_result(result, arguments)
             
-            try:
-                if name == "get_project":
-                    return await self._get_project(arguments)
-                elif name == "search_issues":
-                    return await self._search_issues(arguments)
-                elif name == "get_issue":
-                    return await self._get_issue(arguments)
-                elif name == "get_project_versions":
-                    return await self._get_project_versions(arguments)
-                elif name == "search_qa_issues":
-                    return await self._search_qa_issues(arguments)
-                else:
-                    raise ValueError(f"Unknown tool: {name}")
-            except Exception as e:
-                logger.error(f"Tool execution error: {name}, {str(e)}")
-                return [types.TextContent(
-                    type="text",
-                    text=f"❌ 오류 발생: {str(e)}"
-                )]
+        except Exception as e:
+            logger.error(f"Issue search error: {str(e)}")
+            return [types.TextContent(
+                type="text",
+                text=f"❌ 이슈 검색 실패: {str(e)}"
+            )]
     
-    async def _check_auth(self):
-        """인증 정보가 설정되었는지 확인합니다."""
-        if not self.headers:
-            raise ValueError("인증 정보가 설정되지 않았습니다. 환경 변수 JIRA_USERNAME, JIRA_API_TOKEN을 설정하거나 명령행 인수 --username, --api_token을 사용하세요.")
+    def _build_issue_info(self, data: Dict[str, Any], profile: str = "full") -> Dict[str, Any]:
+        """이슈 응답에서 필드 프로필에 해당하는 주요 정보와 QA 커스텀 필드를 추출합니다."""
+        return ISSUE_PROFILES[profile].extract(data)
     
-    async def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None, **kwargs) -> Dict[str, Any]:
-        """HTTP 요청을 수행합니다."""
-        await self._check_auth()
+    async def _issue_info(self, arguments: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+        """단건 이슈를 조회해 (이슈 정보, 출처)를 반환합니다. 로컬 미러에서 응답하면 출처는 "mirror"입니다."""
+        issue_key = arguments["issue_key"]
+        fields = arguments.get("fields")
+        profile = arguments.get("profile", "full")
         
-        url = f"{self.base_url}{endpoint}"
+        if profile not in ISSUE_PROFILES:
+            raise ValueError(f"지원하지 않는 필드 프로필: {profile}")
+        
+        if self.mirror and not fields and not arguments.get("bypass_cache", False) and not self._credential_scope():
+            data = await self._mirror_get_issue(issue_key)
+            if data is not None:
+                return self._build_issue_info(data, profile), "mirror"
+        
+        # fields를 직접 지정하지 않으면 프로필에서 추출하는 필드만 요청
+        params = {"fields": fields or ISSUE_PROFILES[profile].fields}
+        data = await self._cached_request(
+            "issue", issue_key, f"/rest/api/2/issue/{issue_key}", params=params,
+            bypass_cache=arguments.get("bypass_cache", False)
+        )
+        return self._build_issue_info(data, profile), "jira"
+    
+    async def _get_issue(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """단건 이슈를 조회합니다."""
+        issue_key = arguments["issue_key"]
         
         try:
-            async with httpx.AsyncClient(timeout=30.0, verify=False) as client:
-                response = await client.request(
-                    method, 
-                    url, 
-                    headers=self.headers,
-                    params=params,
-                    **kwargs
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
-            raise Exception(f"HTTP {e.response.status_code}: {e.response.text[:200]}")
+            issue_info, source = await self._issue_info(arguments)
+            title = f"📄 이슈 정보 ({issue_key}, 로컬 미러)" if source == "mirror" else f"📄 이슈 정보 ({issue_key})"
+            return self._format_result(title, issue_info, arguments)
+            
         except Exception as e:
-            logger.error(f"Request error: {str(e)}")
-            raise
+            logger.error(f"Issue fetch error: {str(e)}")
+            return [types.TextContent(
+                type="text",
+                text=f"❌ 이슈 조회 실패: {str(e)}"
+            )]
     
-    async def _get_project(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
-        """프로젝트 정보를 조회합니다."""
-        project_key = arguments["project_key"]
+    async def _fetch_issue_chunk(self, keys: List[str], fields: str = ISSUE_DETAIL_FIELDS,
+                                 expand: Optional[str] = None) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """key in (...) JQL로 이슈 묶음을 조회합니다. 실패하면 키별 단건 조회로 오류를 구분합니다."""
+        jql = "key in ({})".format(",".join(f'"{key}"' for key in keys))
+        params = {
+            "jql": jql,
+            "fields": fields,
+            "maxResults": len(keys),
+            # 없는 키가 섞여 있어도 전체 쿼리가 실패하지 않도록 경고로 처리
+            "validateQuery": "warn"
+        }
+        if expand:
+            params["expand"] = expand
+        
+        try:
+            data = await self._make_request("GET", "/rest/api/2/search", params=params)
+        except Exception as e:
+            logger.warning(f"Batch chunk failed, falling back to single fetch: {str(e)}")
+            single_params = {"fields": fields, **({"expand": expand} if expand else {})}
+            # 단건 조회는 동시에 요청 (전체 동시 요청 수는 _make_request의 세마포어가 제한)
+            results = await asyncio.gather(
+                *(self._make_request("GET", f"/rest/api/2/issue/{key}", params=single_params) for key in keys),
+                return_exceptions=True
+            )
+            found = {key: result for key, result in zip(keys, results) if not isinstance(result, BaseException)}
+            errors = {key: str(result) for key, result in zip(keys, results) if isinstance(result, BaseException)}
+            self._invalidate_stale_issues(list(found.values()))
+            return found, errors
+        
+        issues = data.get("issues", [])
+        self._invalidate_stale_issues(issues)
+        found = {issue.get("key"): issue for issue in issues}
+        errors = {key: "이슈가 없거나 조회 권한이 없습니다" for key in keys if key not in found}
+        return found, errors
+    
+    def _chunk_keys(self, keys: List[str]) -> List[List[str]]:
+        """키 목록을 batch_chunk_size 단위로 나눕니다."""
+        chunk_size = max(1, self.batch_chunk_size)
+        return [keys[i:i + chunk_size] for i in range(0, len(keys), chunk_size)]
+    
+    async def _fetch_issues_by_key(self, keys: List[str], fields: str,
+                                   expand: Optional[str] = None) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """키 목록을 청크로 나눠 page_concurrency 개까지 동시에 조회합니다."""
+        semaphore = asyncio.Semaphore(max(1, self.page_concurrency))
+        
+        async def fetch_chunk(chunk: List[str]):
+            async with semaphore:
+                return await self._fetch_issue_chunk(chunk, fields, expand)
+        
+        found: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, str] = {}
+        for chunk_found, chunk_errors in await asyncio.gather(*(fetch_chunk(chunk) for chunk in self._chunk_keys(keys))):
+            found.update(chunk_found)
+            errors.update(chunk_errors)
+        return found, errors
+    
+    async def _search_by_keys(self, jql_template: str, keys: List[str], fields: str) -> List[Dict[str, Any]]:
+        """JQL 템플릿의 {keys} 자리에 키 묶음을 넣어 청크별 전체 페이지를 동시에 조회합니다."""
+        semaphore = asyncio.Semaphore(max(1, self.page_concurrency))
+        
+        async def search_chunk(chunk: List[str]) -> List[Dict[str, Any]]:
+            jql = jql_template.format(keys=",".join(f'"{key}"' for key in chunk))
+            async with semaphore:
+                data = await self._search_all({"jql": jql, "fields": fields, "maxResults": 100})
+            return data["issues"]
+        
+        issues: List[Dict[str, Any]] = []
+        for chunk_issues in await asyncio.gather(*(search_chunk(chunk) for chunk in self._chunk_keys(keys))):
+            issues.extend(chunk_issues)
+        self._invalidate_stale_issues(issues)
+        return issues
+    
+    async def _get_issues(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """여러 이슈를 배치로 조회합니다."""
+        # 순서를 유지하며 중복 키 제거
+        issue_keys = list(dict.fromkeys(key.strip().upper() for key in arguments["issue_keys"] if key.strip()))
+        profile = arguments.get("profile", "full")
         
         try:
-            data = await self._make_request("GET", f"/rest/api/2/project/{project_key}")
+            if profile not in ISSUE_PROFILES:
+                raise ValueError(f"지원하지 않는 필드 프로필: {profile}")
+            
+            found, errors = await self._fetch_issues_by_key(issue_keys, ISSUE_PROFILES[profile].fields)
             
             result = {
-                "key": data.get("key"),
-                "name": data.get("name"),
-                "description": data.get("description"),
-                "lead": data.get("lead", {}).get("displayName"),
-                "projectTypeKey": data.get("projectTypeKey"),
-                "category": data.get("projectCategory", {}).get("name") if data.get("projectCategory") else None
+                "requested": len(issue_keys),
+                "found": len(found),
+                "issues": [self._build_issue_info(found[key], profile) for key in issue_keys if key in found],
+                "errors": errors
             }
             
-            return [types.TextContent(
-                type="text",
-                text=f"📋 프로젝트 정보:\n```json\n{json.dumps(result, indent=2, ensure_ascii=False)}\n```"
-            )]
+            return self._format_result(f"📚 이슈 배치 조회 ({result['found']}/{result['requested']}건)", result, arguments)
             
         except Exception as e:
-            logger.error(f"Project fetch error: {str(e)}")
+            logger.error(f"Batch issue fetch error: {str(e)}")
             return [types.TextContent(
                 type="text",
-                text=f"❌ 프로젝트 조회 실패: {str(e)}"
+                text=f"❌ 이슈 배치 조회 실패: {str(e)}"
             )]
     
-    async def _search_issues(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
-        """JQL로 이슈를 검색합니다."""
-        jql = arguments["jql"]
-        fields = arguments.get("fields", "summary,status,priority,issuetype,assignee,created,updated")
-        max_results = arguments.get("max_results", 50)
+    async def _page_issue_resource(self, endpoint: str, items_field: str, page_size: int = 100) -> List[Dict[str, Any]]:
+        """startAt/maxResults/total 형식의 이슈 하위 목록(댓글, 작업 로그, 변경 이력)을 모두 조회합니다.
+        
+        첫 페이지의 total을 보고 나머지 페이지를 동시에 요청합니다. 동시 요청 수는 요청 계층의 전역 제한을 따릅니다.
+        """
+        first = await self._make_request("GET", endpoint, params={"startAt": 0, "maxResults": page_size})
+        items = list(first.get(items_field) or [])
+        total = first.get("total") or len(items)
+        step = first.get("maxResults") or page_size
+        if total > len(items) and step > 0:
+            pages = await asyncio.gather(*(
+                self._make_request("GET", endpoint, params={"startAt": start_at, "maxResults": step})
+                for start_at in range(step, total, step)
+            ))
+            for page in pages:
+                items.extend(page.get(items_field) or [])
+        return items
+    
+    async def _issue_changelog(self, issue: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """expand=changelog로 받은 이력을 반환합니다. 이력이 잘려 있으면(Jira Cloud) /changelog를 페이지 단위로 조회합니다."""
+        changelog = issue.get("changelog") or {}
+        histories = changelog.get("histories") or []
+        if (changelog.get("total") or 0) <= len(histories):
+            return histories
+        return await self._page_issue_resource(f"/rest/api/2/issue/{issue['key']}/changelog", "values")
+    
+    async def _get_issue_activity(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """여러 이슈의 댓글/변경 이력/작업 로그를 동시에 조회해 이슈별 시간순 활동 목록으로 합칩니다."""
+        issue_keys = list(dict.fromkeys(key.strip().upper() for key in arguments["issue_keys"] if key.strip()))
+        include = arguments.get("include") or list(ACTIVITY_SOURCES)
+        changelog_fields = set(arguments.get("changelog_fields") or [])
+        body_chars = arguments.get("body_chars", 300)
         
         try:
-            params = {
-                "jql": jql,
-                "fields": fields,
-                "maxResults": max_results
-            }
+            unknown = [source for source in include if source not in ACTIVITY_SOURCES]
+            if unknown:
+                raise ValueError(f"지원하지 않는 활동 종류: {', '.join(unknown)} (가능: {', '.join(ACTIVITY_SOURCES)})")
+            since = _parse_since(arguments["since"]) if arguments.get("since") else None
             
-            data = await self._make_request("GET", "/rest/api/2/search", params=params)
+            # 요약/상태와 변경 이력은 key in (...) 배치 검색 한 번으로 받음
+            found, fetch_errors = await self._fetch_issues_by_key(
+                issue_keys, "summary,status,updated", "changelog" if "changelog" in include else None
+            )
+            # 이슈별 {출처: 오류} (한 이슈에서 댓글과 작업 로그가 모두 실패해도 각각 남김)
+            errors: Dict[str, Dict[str, str]] = {key: {"issue": message} for key, message in fetch_errors.items()}
+            operation = CURRENT_OPERATION.get()
+            done = 0
             
-            issues = []
-            for issue in data.get("issues", []):
-                fields_data = issue.get("fields", {})
-                issue_info = {
-                    "key": issue.get("key"),
+            async def collect(key: str) -> Dict[str, Any]:
+                nonlocal done
+                issue = found[key]
+                fields_data = issue.get("fields") or {}
+                updated = _parse_jira_time(fields_data.get("updated"))
+                # 댓글/작업 로그가 추가되면 이슈 updated도 바뀌므로 since 이전에 수정된 이슈는 건너뜀
+                active = since is None or updated is None or updated >= since
+                sources = {
+                    "comment": self._page_issue_resource(f"/rest/api/2/issue/{key}/comment", "comments")
+                    if "comment" in include and active else None,
+                    "changelog": self._issue_changelog(issue) if "changelog" in include else None,
+                    "worklog": self._page_issue_resource(f"/rest/api/2/issue/{key}/worklog", "worklogs")
+                    if "worklog" in include and active else None
+                }
+                names = [name for name, source in sources.items() if source is not None]
+                results = await asyncio.gather(*(sources[name] for name in names), return_exceptions=True)
+                
+                activity = []
+                for name, items in zip(names, results):
+                    if isinstance(items, Exception):
+                        errors.setdefault(key, {})[name] = str(items)
+                        continue
+                    for item in items:
+                        author = _display_name(item.get("author") or item.get("updateAuthor"))
+                        if name == "comment":
+                            activity.append({
+                                "at": item.get("created"), "type": "comment", "by": author,
+                                "body": _clip(item.get("body"), body_chars)
+                            })
+                        elif name == "worklog":
+                            activity.append({
+                                "at": item.get("started"), "type": "worklog", "by": author,
+                                "time_spent": item.get("timeSpent"), "comment": _clip(item.get("comment"), body_chars)
+                            })
+                        else:
+                            for change in item.get("items") or []:
+                                if changelog_fields and change.get("field") not in changelog_fields:
+                                    continue
+                                activity.append({
+                                    "at": item.get("created"), "type": "change", "by": author,
+                                    "field": change.get("field"), "from": change.get("fromString"), "to": change.get("toString")
+                                })
+                
+                stamped = [(_parse_jira_time(entry["at"]), entry) for entry in activity]
+                if since is not None:
+                    stamped = [(at, entry) for at, entry in stamped if at is not None and at >= since]
+                stamped.sort(key=lambda pair: pair[0] or 0)
+                activity = [entry for _, entry in stamped]
+                
+                done += 1
+                if operation is not None:
+                    await operation.report(done, len(found), f"{done}/{len(found)} 이슈 활동 조회")
+                return {
+                    "key": key,
                     "summary": fields_data.get("summary"),
-                    "status": fields_data.get("status", {}).get("name") if fields_data.get("status") else None,
-                    "priority": fields_data.get("priority", {}).get("name") if fields_data.get("priority") else None,
-                    "assignee": fields_data.get("assignee", {}).get("displayName") if fields_data.get("assignee") else None,
-                    "created": fields_data.get("created"),
-                    "updated": fields_data.get("updated")
+                    "status": _name(fields_data.get("status")),
+                    "counts": {kind: sum(1 for entry in activity if entry["type"] == kind) for kind in ("comment", "change", "worklog")},
+                    "activity": activity
                 }
-                issues.append(issue_info)
             
+            issues = await asyncio.gather(*(collect(key) for key in issue_keys if key in found))
             result = {
-                "total": data.get("total"),
-                "maxResults": data.get("maxResults"),
-                "startAt": data.get("startAt"),
-                "issues": issues
+                "requested": len(issue_keys),
+                "found": len(found),
+                "since": arguments.get("since"),
+                "events": sum(len(issue["activity"]) for issue in issues),
+                "issues": list(issues),
+                "errors": errors
             }
+            title = f"🗂️ 이슈 활동 ({result['found']}/{result['requested']}건, 활동 {result['events']}개)"
+            return self._format_result(title, result, arguments)
             
+        except Exception as e:
+            logger.error(f"Issue activity error: {str(e)}")
             return [types.TextContent(
                 type="text",
-                text=f"🔍 검색 결과 ({result['total']}건):\n```json\n{json.dumps(result, indent=2, ensure_ascii=False)}\n```"
+                text=f"❌ 이슈 활동 조회 실패: {str(e)}"
             )]
+    
+    async def _aggregate_issues(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """JQL 결과를 group_by 필드별 건수로 집계합니다. 페이지는 도착하는 대로 집계하고 버립니다."""
+        jql = arguments["jql"]
+        group_by = [GROUP_BY_ALIASES.get(field, field) for field in arguments.get("group_by") or []]
+        
+        try:
+            unknown = [field for field in group_by if field not in ISSUE_COLUMNS]
+            if unknown:
+                raise ValueError(f"집계할 수 없는 필드: {', '.join(unknown)} (가능: {', '.join(ISSUE_COLUMNS)})")
+            
+            if not group_by:
+                # 전체 건수만 필요하면 maxResults=0 조회로 total만 받음
+                data = await self._make_request("GET", "/rest/api/2/search", params={"jql": jql, "maxResults": 0, "fields": "key"})
+                result = {"jql": jql, "total": data.get("total", 0)}
+                return self._format_result(f"📊 집계 결과 ({result['total']}건)", result, arguments)
+            
+            extractors = [(field, *ISSUE_COLUMNS[field]) for field in group_by]
+            params = {
+                "jql": jql,
+                "fields": ",".join(dict.fromkeys(jira_field for _, jira_field, _ in extractors)),
+                "maxResults": arguments.get("page_size", 100)
+            }
+            
+            counts: Dict[Tuple[Any, ...], int] = {}
+            seen = set()
+            total = 0
+            async for page in self._iter_search_pages(params, partial_ok=True):
+                total = page.total
+                for issue in page.issues:
+                    if issue.get("key") in seen:
+                        continue
+                    seen.add(issue.get("key"))
+                    fields_data = issue.get("fields") or {}
+                    # 다중 값 필드(labels, fixVersions)는 값마다 한 번씩 집계
+                    combinations: List[Tuple[Any, ...]] = [()]
+                    for _, jira_field, extractor in extractors:
+                        value = extractor(fields_data.get(jira_field))
+                        values = (value or [None]) if isinstance(value, list) else [value]
+                        combinations = [combo + (v,) for combo in combinations for v in values]
+                    for combo in combinations:
+                        counts[combo] = counts.get(combo, 0) + 1
+            
+            groups = [
+                {**dict(zip(group_by, combo)), "count": count}
+                for combo, count in sorted(counts.items(), key=lambda item: -item[1])
+            ]
+            result = {"jql": jql, "total": total, "counted": len(seen), "group_by": group_by, "groups": groups}
+            operation = CURRENT_OPERATION.get()
+            if operation is not None and operation.stop_reason and len(seen) < total:
+                result["partial"] = operation.stop_reason
+            return self._format_result(f"📊 집계 결과 ({total}건, {len(groups)}개 그룹)", result, arguments)
             
         except Exception as e:
-            logger.error(f"Issue search error: {str(e)}")
+            logger.error(f"Issue aggregation error: {str(e)}")
             return [types.TextContent(
                 type="text",
-                text=f"❌ 이슈 검색 실패: {str(e)}"
+                text=f"❌ 이슈 집계 실패: {str(e)}"
             )]
     
-    async def _get_issue(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
-        """단건 이슈를 조회합니다."""
-        issue_key = arguments["issue_key"]
-        fields = arguments.get("fields")
+    async def _batch(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """여러 하위 호출을 동시에 실행하고 결과에 나온 이슈를 공유 이슈 표로 합칩니다."""
+        calls = arguments["calls"]
+        issues: Dict[str, Dict[str, Any]] = {}
+        
+        def collect(issue_info: Dict[str, Any]) -> str:
+            # 같은 이슈가 여러 결과에 나오면 필드를 합쳐 한 행으로 보관
+            issues.setdefault(issue_info["key"], {}).update(issue_info)
+            return issue_info["key"]
+        
+        async def run_call(index: int, call: Any) -> Dict[str, Any]:
+            entry: Dict[str, Any] = {"index": index}
+            tool = None
+            try:
+                # 형식이 잘못된 항목도 배치 전체가 아니라 해당 항목의 오류로 기록
+                if not isinstance(call, dict):
+                    raise ValueError(f"하위 호출은 tool/arguments 객체여야 합니다: {call!r}")
+                tool = entry["tool"] = call.get("tool")
+                if call.get("id"):
+                    entry["id"] = call["id"]
+                call_args = call.get("arguments") or {}
+                if not isinstance(call_args, dict):
+                    raise ValueError(f"arguments는 객체여야 합니다: {call_args!r}")
+                
+                if tool == "get_project":
+                    entry["result"] = await self._project_info(call_args)
+                elif tool == "get_project_versions":
+                    entry["result"], _ = await self._project_versions(call_args)
+                elif tool == "search_issues":
+                    result = await self._search_result(call_args)
+                    entry["result"] = {**result, "issues": [collect(issue) for issue in result["issues"]]}
+                elif tool == "get_issue":
+                    issue_info, _ = await self._issue_info(call_args)
+                    entry["result"] = {"issue": collect(issue_info)}
+                else:
+                    raise ValueError(f"batch에서 지원하지 않는 도구: {tool} (가능: {', '.join(BATCH_TOOLS)})")
+            except KeyError as e:
+                entry["error"] = f"필수 인수 누락: {e.args[0]}"
+            except Exception as e:
+                # 하위 호출의 실패는 다른 호출에 영향을 주지 않고 해당 항목에만 기록
+                logger.warning(f"Batch call failed: {tool}, {str(e)}")
+                entry["error"] = str(e)
+            return entry
+        
+        # 동시 실행 수는 요청 계층의 전역 동시 요청 제한과 속도 제한을 따름
+        results = await asyncio.gather(*(run_call(i, call) for i, call in enumerate(calls)))
+        failed = sum(1 for entry in results if "error" in entry)
+        result = {
+            "calls": len(calls),
+            "succeeded": len(calls) - failed,
+            "failed": failed,
+            "results": results,
+            "issues": list(issues.values())
+        }
+        return self._format_result(f"🧺 배치 실행 ({len(calls) - failed}/{len(calls)}건 성공, 이슈 {len(issues)}건)", result, arguments)
+    
+    async def _export_issues(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """JQL 결과를 페이지 단위로 받아 도착하는 대로 JSONL/CSV 파일에 기록합니다."""
+        jql = arguments["jql"]
+        export_format = arguments.get("format", "jsonl")
+        profile = arguments.get("profile", "full")
+        page_size = arguments.get("page_size", 100)
+        progress: Optional[Dict[str, Any]] = None
         
         try:
-            params = {"fields": fields} if fields else None
-            data = await self._make_request("GET", f"/rest/api/2/issue/{issue_key}", params=params)
-            
-            fields_data = data.get("fields", {})
-            
-            # 주요 정보 추출
-            issue_info = {
-                "key": data.get("key"),
-                "summary": fields_data.get("summary"),
-                "description": fields_data.get("description"),
-                "status": fields_data.get("status", {}).get("name") if fields_data.get("status") else None,
-                "priority": fields_data.get("priority", {}).get("name") if fields_data.get("priority") else None,
-                "issuetype": fields_data.get("issuetype", {}).get("name") if fields_data.get("issuetype") else None,
-                "assignee": fields_data.get("assignee", {}).get("displayName") if fields_data.get("assignee") else None,
-                "reporter": fields_data.get("reporter", {}).get("displayName") if fields_data.get("reporter") else None,
-                "created": fields_data.get("created"),
-                "updated": fields_data.get("updated"),
-                "duedate": fields_data.get("duedate"),
-                "project": fields_data.get("project", {}).get("name") if fields_data.get("project") else None,
-                "labels": fields_data.get("labels", []),
-                "fixVersions": [v.get("name") for v in fields_data.get("fixVersions", [])],
-                # 커스텀 필드들
-                "qa_담당자": fields_data.get("customfield_10521", {}).get("displayName") if fields_data.get("customfield_10521") else None,
-                "배포일자": fields_data.get("customfield_10706"),
-                "start_date": fields_data.get("customfield_10209"),
-                "end_date": fields_data.get("customfield_10210"),
-                "qa_대상": fields_data.get("customfield_12213", {}).get("value") if fields_data.get("customfield_12213") else None,
-                "epic_name": fields_data.get("customfield_10103")
+            if export_format not in EXPORT_FORMATS:
+                raise ValueError(f"지원하지 않는 파일 형식: {export_format}")
+            if profile not in ISSUE_PROFILES:
+                raise ValueError(f"지원하지 않는 필드 프로필: {profile}")
+            
+            # 이어받기 중에 페이지 경계가 흔들리지 않도록 정렬 순서를 고정
+            if not _split_order_by(jql)[1]:
+                jql += " ORDER BY key ASC"
+            path = arguments.get("path") or os.path.join(
+                self.export_dir, f"jira_export_{hashlib.sha1(jql.encode('utf-8')).hexdigest()[:10]}.{export_format}"
+            )
+            path = os.path.abspath(os.path.expanduser(path))
+            progress_path = f"{path}.progress"
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            
+            # 같은 조건으로 중단된 내보내기가 있으면 마지막으로 기록한 startAt부터 이어서 진행
+            job = {"jql": jql, "format": export_format, "profile": profile}
+            if arguments.get("resume", True) and os.path.exists(progress_path) and os.path.exists(path):
+                with open(progress_path, encoding="utf-8") as f:
+                    saved = json.load(f)
+                if all(saved.get(k) == v for k, v in job.items()):
+                    progress = saved
+            
+            issue_profile = ISSUE_PROFILES[profile]
+            params = {"jql": jql, "fields": issue_profile.fields, "maxResults": page_size}
+            start_at = progress["next_start_at"] if progress else 0
+            rows = progress["rows"] if progress else 0
+            resumed_from = start_at
+            started = time.time()
+            
+            async def fetch_page(page_start: int) -> Dict[str, Any]:
+                return await self._search_page({**params, "startAt": page_start}, issue_profile.extract)
+            
+            pending: Dict[int, "asyncio.Task"] = {}
+            pages = 0
+            operation = CURRENT_OPERATION.get()
+            with open(path, "r+b" if progress else "wb") as f:
+                if progress:
+                    # 마지막 체크포인트 이후에 일부만 기록된 내용은 잘라냄
+                    f.truncate(progress["bytes"])
+                    f.seek(progress["bytes"])
+                elif export_format == "csv":
+                    # 엑셀에서 한글이 깨지지 않도록 BOM과 헤더를 기록
+                    f.write(b"\xef\xbb\xbf" + self._csv_lines([issue_profile.columns]))
+                
+                page = await fetch_page(start_at)
+                step = min(page_size, page.get("maxResults") or page_size) or page_size
+                try:
+                    while True:
+                        total = page.get("total", 0)
+                        infos = issues = page.get("issues", [])
+                        if export_format == "csv":
+                            f.write(self._csv_lines([[_csv_value(info[c]) for c in issue_profile.columns] for info in infos]))
+                        else:
+                            f.write(b"".join(_dumps(info, compact=True).encode("utf-8") + b"\n" for info in infos))
+                        f.flush()
+                        rows += len(infos)
+                        pages += 1
+                        start_at += step
+                        
+                        progress = {**job, "next_start_at": start_at, "rows": rows, "bytes": f.tell(), "total": total}
+                        with open(progress_path, "w", encoding="utf-8") as pf:
+                            json.dump(progress, pf)
+                        if operation is not None:
+                            pages_total = max(pages, -(-(total - resumed_from) // step))
+                            await operation.report(pages, pages_total, f"{pages}/{pages_total} 페이지 기록 ({rows}건)")
+                        if start_at >= total or not issues or (operation is not None and operation.stopped):
+                            break
+                        
+                        # 다음 페이지 몇 개를 미리 요청하되 파일에는 startAt 순서대로 기록
+                        window_end = min(total, start_at + step * max(1, self.page_concurrency))
+                        for page_start in range(start_at, window_end, step):
+                            if page_start not in pending:
+                                pending[page_start] = asyncio.ensure_future(fetch_page(page_start))
+                        page = await pending.pop(start_at)
+                finally:
+                    for task in pending.values():
+                        task.cancel()
+            
+            stopped = operation is not None and operation.stop_reason is not None and start_at < total
+            if not stopped:
+                os.remove(progress_path)
+            result = {
+                "path": path,
+                "format": export_format,
+                "rows": rows,
+                "total": total,
+                "pages": pages,
+                "resumed_from": resumed_from,
+                "seconds": round(time.time() - started, 3)
             }
+            if stopped:
+                # 진행 파일을 남겨 두어 같은 조건으로 다시 호출하면 이어서 진행
+                result["partial"] = operation.stop_reason
+                result["next_start_at"] = start_at
+                return self._format_result(f"📤 이슈 내보내기 중단 ({rows}/{total}건)", result, arguments)
+            return self._format_result(f"📤 이슈 내보내기 완료 ({rows}건)", result, arguments)
             
+        except Exception as e:
+            logger.error(f"Issue export error: {str(e)}")
+            resume_hint = f" (다시 실행하면 startAt={progress['next_start_at']}부터 이어서 진행합니다)" if progress else ""
             return [types.TextContent(
                 type="text",
-                text=f"📄 이슈 정보 ({issue_key}):\n```json\n{json.dumps(issue_info, indent=2, ensure_ascii=False)}\n```"
+                text=f"❌ 이슈 내보내기 실패: {str(e)}{resume_hint}"
             )]
+    
+    def _csv_lines(self, rows: List[List[Any]]) -> bytes:
+        """행 목록을 CSV 바이트로 변환합니다."""
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(rows)
+        return buffer.getvalue().encode("utf-8")
+    
+    async def _expand_epic(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """에픽과 하위 이슈, 서브태스크, 연결 이슈를 단계별 배치 JQL로 펼칩니다."""
+        epic_keys = list(dict.fromkeys(key.strip().upper() for key in arguments.get("epic_keys") or [] if key.strip()))
+        profile = arguments.get("profile", "qa")
+        include_subtasks = arguments.get("include_subtasks", True)
+        link_depth = max(0, arguments.get("link_depth", 0))
+        
+        try:
+            if profile not in ISSUE_PROFILES:
+                raise ValueError(f"지원하지 않는 필드 프로필: {profile}")
+            
+            if arguments.get("in_progress_epics"):
+                data = await self._search_all({"jql": QA_PRESET_JQL["in_progress_epics"], "fields": "key", "maxResults": 100})
+                epic_keys = list(dict.fromkeys(epic_keys + [issue["key"] for issue in data["issues"]]))
+            if not epic_keys:
+                raise ValueError("epic_keys 또는 in_progress_epics 중 하나는 지정해야 합니다")
+            
+            epic_link_field = await self._resolve_field_id("Epic Link")
+            if not epic_link_field:
+                raise ValueError("Epic Link 필드를 찾을 수 없습니다")
+            
+            fields = ISSUE_PROFILES[profile].fields + (",issuelinks" if link_depth else "")
+            # 이미 조회한 이슈는 다음 단계에서 다시 요청하지 않음
+            fetched: Dict[str, Dict[str, Any]] = {}
+            
+            epics, errors = await self._fetch_issues_by_key(epic_keys, fields)
+            fetched.update(epics)
+            
+            children: Dict[str, List[str]] = {key: [] for key in epic_keys if key in epics}
+            if children:
+                for issue in await self._search_by_keys('"Epic Link" in ({keys})', list(children), f"{fields},{epic_link_field}"):
+                    epic = (issue.get("fields") or {}).get(epic_link_field)
+                    if epic in children and issue["key"] not in fetched:
+                        fetched[issue["key"]] = issue
+                        children[epic].append(issue["key"])
+            
+            child_keys = [key for keys in children.values() for key in keys]
+            subtasks: Dict[str, List[str]] = {key: [] for key in child_keys}
+            if include_subtasks and child_keys:
+                for issue in await self._search_by_keys("parent in ({keys})", child_keys, f"{fields},parent"):
+                    parent = ((issue.get("fields") or {}).get("parent") or {}).get("key")
+                    if parent in subtasks and issue["key"] not in fetched:
+                        fetched[issue["key"]] = issue
+                        subtasks[parent].append(issue["key"])
+            
+            # 연결 이슈는 depth 단계까지 새로 발견한 키만 배치 조회
+            links: List[Dict[str, Any]] = []
+            linked: Dict[str, Dict[str, Any]] = {}
+            frontier = list(fetched)
+            for depth in range(1, link_depth + 1):
+                discovered: List[str] = []
+                for key in frontier:
+                    for link in (fetched[key].get("fields") or {}).get("issuelinks") or []:
+                        direction = "outward" if "outwardIssue" in link else "inward"
+                        target = (link.get(f"{direction}Issue") or {}).get("key")
+                        if not target:
+                            continue
+                        links.append({"from": key, "type": (link.get("type") or {}).get(direction), "to": target})
+                        if target not in fetched and target not in discovered:
+                            discovered.append(target)
+                            linked[target] = {"depth": depth, "linked_from": key}
+                if not discovered:
+                    break
+                found, link_errors = await self._fetch_issues_by_key(discovered, fields)
+                fetched.update(found)
+                errors.update(link_errors)
+                frontier = [key for key in discovered if key in found]
+            
+            def row(key: str, level: str, **extra: Any) -> Dict[str, Any]:
+                return {"key": key, "level": level, **extra, **self._build_issue_info(fetched[key], profile)}
+            
+            rows = []
+            for epic in children:
+                rows.append(row(epic, "epic"))
+                for child in children[epic]:
+                    rows.append(row(child, "child", epic=epic))
+                    rows.extend(row(subtask, "subtask", epic=epic, parent=child) for subtask in subtasks[child])
+            rows.extend(row(key, "linked", **info) for key, info in linked.items() if key in fetched)
+            
+            result = {
+                "epics": list(children),
+                "counts": {
+                    "epics": len(children),
+                    "children": len(child_keys),
+                    "subtasks": sum(len(keys) for keys in subtasks.values()),
+                    "linked": sum(1 for key in linked if key in fetched)
+                },
+                "links": links,
+                "errors": errors,
+                "issues": rows
+            }
+            if not link_depth:
+                del result["links"]
+            
+            return self._format_result(f"🌳 에픽 트리 ({len(children)}개 에픽, {len(rows)}건)", result, arguments)
             
         except Exception as e:
-            logger.error(f"Issue fetch error: {str(e)}")
+            logger.error(f"Epic expansion error: {str(e)}")
             return [types.TextContent(
                 type="text",
-                text=f"❌ 이슈 조회 실패: {str(e)}"
+                text=f"❌ 에픽 트리 조회 실패: {str(e)}"
             )]
     
-    async def _get_project_versions(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
-        """프로젝트 버전을 조회합니다."""
+    async def _load_versions(self, project_key: str) -> Any:
+        """스냅샷용 버전 목록을 조회합니다. 응답 캐시도 함께 갱신합니다."""
+        return await self._cached_request(
+            "versions", project_key, f"/rest/api/latest/project/{project_key}/versions", bypass_cache=True
+        )
+    
+    async def _project_versions(self, arguments: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], str]:
+        """프로젝트 버전 목록을 조회해 (버전 목록, 제목 보충 문구)를 반환합니다."""
         project_key = arguments["project_key"]
+        title_suffix = ""
+        if project_key in self.warmup_projects and not arguments.get("bypass_cache") and not self._credential_scope():
+            data, age, refreshing = await self.snapshots.get(
+                f"versions:{project_key}", lambda: self._load_versions(project_key), self.warmup_versions_interval
+            )
+            title_suffix = f", {age:.0f}초 전 스냅샷{' · 갱신 중' if refreshing else ''}"
+        else:
+            data = await self._cached_request(
+                "versions", project_key, f"/rest/api/latest/project/{project_key}/versions",
+                bypass_cache=arguments.get("bypass_cache", False)
+            )
         
+        versions = []
+        for version in data:
+            version_info = {
+                "id": version.get("id"),
+                "name": version.get("name"),
+                "archived": version.get("archived"),
+                "released": version.get("released"),
+                "releaseDate": version.get("releaseDate"),
+                "description": version.get("description")
+            }
+            versions.append(version_info)
+        return versions, title_suffix
+    
+    async def _get_project_versions(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """프로젝트 버전을 조회합니다."""
         try:
-            data = await self._make_request("GET", f"/rest/api/latest/project/{project_key}/versions")
-            
-            versions = []
-            for version in data:
-                version_info = {
-                    "id": version.get("id"),
-                    "name": version.get("name"),
-                    "archived": version.get("archived"),
-                    "released": version.get("released"),
-                    "releaseDate": version.get("releaseDate"),
-                    "description": version.get("description")
-                }
-                versions.append(version_info)
-            
-            return [types.TextContent(
-                type="text",
-                text=f"📦 프로젝트 버전 ({len(versions)}개):\n```json\n{json.dumps(versions, indent=2, ensure_ascii=False)}\n```"
-            )]
+            versions, title_suffix = await self._project_versions(arguments)
+            return self._format_result(f"📦 프로젝트 버전 ({len(versions)}개{title_suffix})", versions, arguments)
             
         except Exception as e:
             logger.error(f"Version fetch error: {str(e)}")
@@ -390,11 +2937,32 @@ class SSGJiraMCPServer:
         """QA 관련 이슈를 검색합니다."""
         search_type = arguments["search_type"]
         
+        # 미러와 예열 스냅샷은 서버 인증 정보로 만든 것이라 서버 인증 정보로 호출할 때만 사용
+        shared = not self._credential_scope()
+        if self.mirror and shared and search_type in MIRROR_PRESETS:
+            result = await self._mirror_search_preset(search_type, arguments.get("fix_version"))
+            if result is not None:
+                return self._render_search_result(result, arguments)
+        
+        # 예열 대상 프리셋은 최신 스냅샷으로 즉시 응답 (fix_version 조건이 붙으면 직접 검색)
+        if shared and search_type in self.warmup_presets and not arguments.get("fix_version"):
+            try:
+                result, age, refreshing = await self.snapshots.get(
+                    f"preset:{search_type}", lambda: self._load_preset(search_type), self.warmup_interval
+                )
+            except Exception as e:
+                logger.error(f"Preset snapshot error: {str(e)}")
+                return [types.TextContent(
+                    type="text",
+                    text=f"❌ 이슈 검색 실패: {str(e)}"
+                )]
+            return self._render_search_result(
+                {**result, "source": "snapshot", "snapshot_age": round(age, 1), "refreshing": refreshing}, arguments
+            )
+        
         # 미리 정의된 JQL 쿼리들
         jql_queries = {
-            "in_progress_epics": 'project in ("QAQ","이벤트 운영 QA") AND type = Epic AND status = "In Progress"',
-            "qa_target": 'project in ("QAQ","APP 운영 QA") AND "QA 대상" = Y',
-            "deploy_waiting": '"배포 진행" = YES',
+            **QA_PRESET_JQL,
             "epic_issues": f'"Epic Link" = {arguments.get("epic_key", "")}'
         }
         
@@ -410,28 +2978,448 @@ class SSGJiraMCPServer:
         
         # 검색 실행
         search_args = {
+            "output_format": arguments.get("output_format"),
+            "max_chars": arguments.get("max_chars"),
             "jql": jql,
-            "fields": "summary,status,priority,issuetype,assignee,created,updated,customfield_10521,customfield_12213",
+            "fields": QA_PRESET_FIELDS,
             "max_results": 100
         }
         
         return await self._search_issues(search_args)
     
-    async def run(self):
-        """서버를 실행합니다."""
-        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="ssg-jira",
-                    server_version="1.0.0",
-                    capabilities=self.server.get_capabilities(
-                        notification_options=NotificationOptions(),
-                        experimental_capabilities={}
-                    )
-                )
+    async def _load_preset(self, preset: str) -> Dict[str, Any]:
+        """스냅샷용 프리셋 검색을 실행합니다."""
+        return await self._run_search(QA_PRESET_JQL[preset], QA_PRESET_FIELDS, 100)
+    
+    async def _warmup_loop(self, loaders: Dict[str, Any], interval: float):
+        """스냅샷을 미리 조회하고 설정된 주기로 갱신합니다."""
+        while True:
+            await asyncio.gather(*(self.snapshots.refresh(key, loader) for key, loader in loaders.items()))
+            await asyncio.sleep(interval)
+    
+    def _start_warmup(self) -> List["asyncio.Task"]:
+        """프리셋 검색과 프로젝트 버전 예열 태스크를 시작합니다."""
+        if self.snapshots is None:
+            return []
+        presets = {f"preset:{p}": (lambda p=p: self._load_preset(p)) for p in self.warmup_presets}
+        versions = {f"versions:{p}": (lambda p=p: self._load_versions(p)) for p in self.warmup_projects}
+        return [
+            asyncio.create_task(self._warmup_loop(loaders, interval))
+            for loaders, interval in ((presets, self.warmup_interval), (versions, self.warmup_versions_interval))
+            if loaders
+        ]
+    
+    async def _changes_since(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """이름별 워터마크 이후 쿼리 결과에 추가/변경/제외된 이슈만 반환합니다."""
+        name = arguments["query_name"]
+        scope = self._credential_scope()
+        feed_key = f"{scope}:{name}" if scope else name
+        jql = arguments.get("jql") or QA_PRESET_JQL.get(name)
+        profile = arguments.get("profile", "qa")
+        include_changelog = arguments.get("include_changelog", False)
+        
+        try:
+            if not jql:
+                raise ValueError(f"jql이 필요합니다 (프리셋 이름이 아닌 쿼리: {name})")
+            if profile not in ISSUE_PROFILES:
+                raise ValueError(f"지원하지 않는 필드 프로필: {profile}")
+            
+            issue_profile = ISSUE_PROFILES[profile]
+            params = {"jql": jql, "fields": issue_profile.fields, "maxResults": 100}
+            if include_changelog:
+                params["expand"] = "changelog"
+            
+            async with self.change_feed_lock:
+                feed = self.change_feeds.get(feed_key)
+                baseline = arguments.get("reset", False) or feed is None or feed["jql"] != jql or feed["profile"] != profile
+                started = time.time()
+                rows: List[Dict[str, Any]] = []
+                
+                if baseline:
+                    # 처음이거나 쿼리가 바뀌면 전체 결과를 기준 상태로 저장
+                    data = await self._search_all(params)
+                    issues = data["issues"]
+                    self._invalidate_stale_issues(issues)
+                    feed = {"jql": jql, "profile": profile, "issues": {}}
+                    for issue in issues:
+                        info = issue_profile.extract(issue)
+                        feed["issues"][issue["key"]] = info
+                        rows.append({"change": "added", **info})
+                else:
+                    # Jira 서버 시간 기준 상대 시간으로 조회해 타임존 차이를 피하고, 1분 겹치게 조회
+                    minutes = int((started - feed["watermark"]) // 60) + 2
+                    delta = f'updated >= "-{minutes}m"'
+                    # ORDER BY는 괄호 밖 맨 뒤에 다시 붙임
+                    where, order_by = _split_order_by(jql)
+                    incremental = (f"({where}) AND {delta}" if where else delta) + (f" {order_by}" if order_by else "")
+                    data = await self._search_all({**params, "jql": incremental})
+                    issues = data["issues"]
+                    self._invalidate_stale_issues(issues)
+                    
+                    for issue in issues:
+                        info = issue_profile.extract(issue)
+                        previous = feed["issues"].get(issue["key"])
+                        feed["issues"][issue["key"]] = info
+                        transitions = self._status_transitions(issue, feed["watermark"]) if include_changelog else None
+                        if previous is None:
+                            row = {"change": "added", **info}
+                        else:
+                            # 겹쳐 조회된 구간 때문에 다시 받은 이슈는 바뀐 필드가 없으면 제외
+                            changed_fields = {
+                                column: {"from": previous.get(column), "to": value}
+                                for column, value in info.items() if column != "updated" and previous.get(column) != value
+                            }
+                            if not changed_fields and not transitions:
+                                continue
+                            row = {"change": "changed", **info, "changed_fields": changed_fields}
+                        if transitions:
+                            row["transitions"] = transitions
+                        rows.append(row)
+                    
+                    # 기존 멤버 중 최근 수정되었는데 쿼리에 더 이상 포함되지 않는 이슈는 제외된 것으로 판단
+                    # (NOT (JQL)은 값이 EMPTY가 된 이슈를 찾지 못하고 인스턴스 전체를 조회하므로 추적 중인 키로 확인)
+                    matched = {issue["key"] for issue in issues}
+                    candidates = [key for key in feed["issues"] if key not in matched]
+                    if candidates:
+                        updated = await self._search_by_keys(f"key in ({{keys}}) AND {delta}", candidates, "key")
+                        for key in dict.fromkeys(issue["key"] for issue in updated):
+                            rows.append({"change": "removed", **feed["issues"].pop(key)})
+                
+                feed["watermark"] = started
+                self.change_feeds[feed_key] = feed
+            
+            counts = {change: sum(1 for row in rows if row["change"] == change) for change in ("added", "changed", "removed")}
+            result = {
+                "query_name": name,
+                "jql": jql,
+                "baseline": baseline,
+                "watermark": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(started)),
+                "tracked": len(feed["issues"]),
+                "counts": counts,
+                "issues": rows
+            }
+            title = "기준 상태 저장" if baseline else f"추가 {counts['added']} · 변경 {counts['changed']} · 제외 {counts['removed']}"
+            return self._format_result(f"🔔 변경 사항 ({name}: {title})", result, arguments)
+            
+        except Exception as e:
+            logger.error(f"Change feed error: {str(e)}")
+            return [types.TextContent(
+                type="text",
+                text=f"❌ 변경 사항 조회 실패: {str(e)}"
+            )]
+    
+    def _status_transitions(self, issue: Dict[str, Any], since: float) -> List[Dict[str, Any]]:
+        """changelog 확장에서 since 이후의 상태 전환만 추출합니다."""
+        transitions = []
+        for history in (issue.get("changelog") or {}).get("histories") or []:
+            at = _parse_jira_time(history.get("created"))
+            if at is None or at < since:
+                continue
+            for item in history.get("items") or []:
+                if item.get("field") == "status":
+                    transitions.append({
+                        "at": history.get("created"),
+                        "by": (history.get("author") or {}).get("displayName"),
+                        "from": item.get("fromString"),
+                        "to": item.get("toString")
+                    })
+        return sorted(transitions, key=lambda t: t["at"])
+    
+    async def _resolve_field_id(self, field_name: str) -> Optional[str]:
+        """필드 이름으로 Jira 필드 ID를 조회합니다. (예: Epic Link → customfield_xxxxx)"""
+        if field_name in self.field_ids:
+            return self.field_ids[field_name]
+        fields = await self._make_request("GET", "/rest/api/2/field")
+        for field in fields:
+            if field.get("name") == field_name:
+                self.field_ids[field_name] = field.get("id")
+                return field.get("id")
+        return None
+    
+    def _mirror_is_fresh(self) -> bool:
+        """마지막 동기화가 mirror_max_staleness 이내인지 확인합니다."""
+        watermark = self.mirror.get_state("watermark")
+        return watermark is not None and time.time() - float(watermark) < self.mirror_max_staleness
+    
+    async def _sync_mirror(self, full: bool = False, only_if_stale: bool = False) -> Dict[str, Any]:
+        """로컬 미러를 동기화합니다. 워터마크가 없거나 full이면 전체, 아니면 updated 기준 증분 동기화합니다.
+        
+        only_if_stale이면 잠금을 얻은 뒤 다시 확인해, 기다리는 동안 다른 호출이 동기화했으면 건너뜁니다.
+        """
+        mirror = self.mirror
+        async with self.mirror_lock:
+            if only_if_stale and not full and self._mirror_is_fresh():
+                return mirror.snapshot()
+            watermark = mirror.get_state("watermark")
+            full = full or watermark is None
+            started = time.time()
+            
+            epic_link_field = mirror.get_state("epic_link_field")
+            if full or not epic_link_field:
+                epic_link_field = await self._resolve_field_id("Epic Link")
+            fields = f"{ISSUE_DETAIL_FIELDS},{epic_link_field}" if epic_link_field else ISSUE_DETAIL_FIELDS
+            
+            async def fetch(jql: str) -> List[Dict[str, Any]]:
+                data = await self._search_all({"jql": jql, "fields": fields, "maxResults": 100})
+                issues = data["issues"]
+                self._invalidate_stale_issues(issues)
+                mirror.upsert_issues(issues, epic_link_field)
+                return issues
+            
+            if full:
+                mirror.clear()
+                synced = len(await fetch(mirror.scope_jql))
+                for preset in MIRROR_PRESETS:
+                    keys = [issue["key"] for issue in await fetch(QA_PRESET_JQL[preset])]
+                    mirror.update_members(preset, add=keys, remove=[], replace=True)
+            else:
+                # Jira 서버 시간 기준 상대 시간으로 조회해 타임존 차이를 피하고, 1분 겹치게 조회
+                minutes = int((started - float(watermark)) // 60) + 2
+                delta = f'updated >= "-{minutes}m"'
+                changed = {issue["key"] for issue in await fetch(f"({mirror.scope_jql}) AND {delta}")}
+                synced = len(changed)
+                for preset in MIRROR_PRESETS:
+                    matched = {issue["key"] for issue in await fetch(f"({QA_PRESET_JQL[preset]}) AND {delta}")}
+                    synced += len(matched - changed)
+                    candidates = [key for key in mirror.members(preset) if key not in matched]
+                    # 미러 범위 안의 이슈는 변경 목록으로, 범위 밖 이슈는 key in 조회로 이탈 여부 확인
+                    removed = [key for key in candidates if key in changed]
+                    outside = mirror.out_of_scope([key for key in candidates if key not in changed])
+                    for i in range(0, len(outside), self.batch_chunk_size):
+                        chunk = ",".join(f'"{key}"' for key in outside[i:i + self.batch_chunk_size])
+                        removed.extend(issue["key"] for issue in await fetch(f"key in ({chunk}) AND {delta}"))
+                    mirror.update_members(preset, add=list(matched), remove=removed)
+            
+            mirror.set_state(
+                watermark=started,
+                epic_link_field=epic_link_field,
+                last_sync=time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(started)),
+                last_sync_type="full" if full else "incremental",
+                last_sync_issues=synced,
+                last_sync_seconds=round(time.time() - started, 3)
+            )
+            if full:
+                mirror.set_state(last_full_sync=mirror.get_state("last_sync"))
+            
+            logger.info(f"🗃️ 미러 {'전체' if full else '증분'} 동기화 완료: {synced}건")
+            return mirror.snapshot()
+    
+    async def _ensure_mirror_fresh(self) -> bool:
+        """미러가 오래되었으면 증분 동기화합니다. 동기화에 실패해도 기존 데이터가 있으면 True를 반환합니다."""
+        if self._mirror_is_fresh():
+            return True
+        
+        try:
+            await self._sync_mirror(only_if_stale=True)
+            return True
+        except Exception as e:
+            logger.error(f"Mirror sync error: {str(e)}")
+            return self.mirror.get_state("watermark") is not None
+    
+    def _mirror_synced(self) -> bool:
+        """미러가 한 번이라도 동기화되었는지 확인합니다.
+        
+        아직이면 첫 전체 동기화를 백그라운드로 시작하고 False를 반환합니다. 전체 동기화는 미러 범위의 모든 이슈를
+        받으므로 도구 호출 안에서 기다리지 않고, 끝날 때까지는 Jira에서 직접 조회합니다.
+        """
+        if self.mirror.get_state("watermark") is not None:
+            return True
+        if self.mirror_initial_sync is None or self.mirror_initial_sync.done():
+            self.mirror_initial_sync = asyncio.ensure_future(self._initial_mirror_sync())
+        return False
+    
+    async def _initial_mirror_sync(self):
+        try:
+            await self._sync_mirror(only_if_stale=True)
+        except Exception as e:
+            logger.error(f"Initial mirror sync error: {str(e)}")
+    
+    async def _mirror_search_preset(self, preset: str, fix_version: Optional[str]) -> Optional[Dict[str, Any]]:
+        """프리셋 검색을 로컬 미러에서 처리합니다. 미러를 사용할 수 없거나 아직 동기화 전이면 None을 반환합니다."""
+        if not self._mirror_synced() or not await self._ensure_mirror_fresh():
+            return None
+        
+        total, issues = self.mirror.query_preset(preset, fix_version, limit=100)
+        return {
+            "total": total,
+            "maxResults": 100,
+            "startAt": 0,
+            "source": "mirror",
+            "synced_at": self.mirror.get_state("last_sync"),
+            "issues": [self._build_search_issue_info(issue) for issue in issues]
+        }
+    
+    async def _mirror_get_issue(self, issue_key: str) -> Optional[Dict[str, Any]]:
+        """로컬 미러에서 이슈를 조회합니다. 미러에 없거나 아직 동기화 전이면 None을 반환합니다."""
+        if not self._mirror_synced() or not await self._ensure_mirror_fresh():
+            return None
+        return self.mirror.get_issue(issue_key.upper())
+    
+    async def _sync_status(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """로컬 미러 동기화 상태를 조회하거나 동기화를 실행합니다."""
+        if not self.mirror:
+            return [types.TextContent(
+                type="text",
+                text="⚠️ 로컬 이슈 미러가 비활성화되어 있습니다. JIRA_MIRROR_DIR 환경 변수 또는 --mirror_dir 인수를 설정하세요."
+            )]
+        
+        action = arguments.get("action", "status")
+        try:
+            if action == "status":
+                status = self.mirror.snapshot()
+            else:
+                status = await self._sync_mirror(full=action == "full_resync")
+            
+            return self._format_result("🗃️ 미러 동기화 상태", status, arguments)
+            
+        except Exception as e:
+            logger.error(f"Mirror sync error: {str(e)}")
+            return [types.TextContent(
+                type="text",
+                text=f"❌ 미러 동기화 실패: {str(e)}"
+            )]
+    
+    async def _stop_operation(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """진행 중인 도구 호출에 중단을 요청합니다. 작업 ID가 없으면 진행 중인 호출 목록을 반환합니다."""
+        operation_id = arguments.get("operation_id")
+        current = CURRENT_OPERATION.get()
+        scope = self._credential_scope()
+        running = [op for op in self.operations.values() if op is not current and op.scope == scope]
+        if not operation_id:
+            return self._format_result(f"⏳ 진행 중인 작업 ({len(running)}건)", [op.snapshot() for op in running], arguments)
+        
+        operation = self.operations.get(str(operation_id))
+        if operation is None or operation is current or operation.scope != scope:
+            return [types.TextContent(
+                type="text",
+                text=f"❌ 진행 중인 작업이 없습니다: {operation_id}"
+            )]
+        operation.stop("stop_operation 요청")
+        return self._format_result(f"⏹️ 중단 요청 ({operation_id})", operation.snapshot(), arguments)
+    
+    async def _cache_stats(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """응답 캐시 통계를 조회합니다."""
+        stats = {**self.cache.snapshot(), "single_flight": self.single_flight.snapshot()}
+        if self.disk_cache is not None:
+            stats["disk"] = self.disk_cache.snapshot()
+        if self.snapshots is not None:
+            stats["snapshots"] = self.snapshots.snapshot()
+        return self._format_result("🗄️ 캐시 통계", stats, arguments)
+    
+    def _server_stats_snapshot(self) -> Dict[str, Any]:
+        """도구별 지표와 요청 계층 상태를 모아 반환합니다."""
+        return {
+            **self.metrics.snapshot(),
+            "circuit": {"state": self.circuit.state, "failures": self.circuit.failures},
+            "single_flight": self.single_flight.snapshot(),
+            "cache": {"size": len(self.cache._entries), "stats": self.cache.stats}
+        }
+    
+    async def _server_stats(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """서버 성능 통계를 조회합니다."""
+        return self._format_result("📈 서버 통계", self._server_stats_snapshot(), arguments)
+    
+    def _dump_stats(self):
+        """지표를 파일로 내보냅니다. prometheus는 파일을 교체하고 jsonl은 한 줄씩 추가합니다."""
+        if self.stats_dump_format == "jsonl":
+            with open(self.stats_dump_path, "a", encoding="utf-8") as f:
+                f.write(_dumps({"timestamp": time.time(), **self._server_stats_snapshot()}, compact=True) + "\n")
+        else:
+            tmp_path = f"{self.stats_dump_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(self.metrics.prometheus_text())
+            os.replace(tmp_path, self.stats_dump_path)
+    
+    async def _stats_dump_loop(self):
+        """설정된 주기로 지표를 파일에 기록합니다."""
+        while True:
+            await asyncio.sleep(self.stats_dump_interval)
+            try:
+                self._dump_stats()
+            except OSError as e:
+                logger.error(f"Stats dump error: {str(e)}")
+    
+    def _initialization_options(self) -> InitializationOptions:
+        return InitializationOptions(
+            server_name="ssg-jira",
+            server_version="1.0.0",
+            capabilities=self.server.get_capabilities(
+                notification_options=NotificationOptions(),
+                experimental_capabilities={}
             )
+        )
+    
+    def _http_app(self) -> Any:
+        """streamable HTTP(JIRA_HTTP_PATH)와 SSE(/sse, /messages/) 엔드포인트를 가진 ASGI 앱을 만듭니다."""
+        from mcp.server.sse import SseServerTransport
+        from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+        from starlette.applications import Starlette
+        from starlette.responses import Response
+        from starlette.routing import Mount, Route
+        
+        session_manager = StreamableHTTPSessionManager(app=self.server)
+        sse = SseServerTransport("/messages/")
+        
+        class StreamableHTTPEndpoint:
+            async def __call__(self, scope, receive, send):
+                await session_manager.handle_request(scope, receive, send)
+        
+        async def handle_sse(request):
+            async with sse.connect_sse(request.scope, request.receive, request._send) as (read_stream, write_stream):
+                await self.server.run(read_stream, write_stream, self._initialization_options())
+            return Response()
+        
+        return Starlette(
+            routes=[
+                Route(self.http_path, endpoint=StreamableHTTPEndpoint()),
+                Route("/sse", endpoint=handle_sse, methods=["GET"]),
+                Mount("/messages/", app=sse.handle_post_message)
+            ],
+            lifespan=lambda app: session_manager.run()
+        )
+    
+    async def _serve_http(self):
+        """HTTP 모드로 상주하며 여러 클라이언트 세션이 커넥션 풀, 캐시, 속도 제한을 공유합니다."""
+        import uvicorn
+        
+        config = uvicorn.Config(self._http_app(), host=self.http_host, port=self.http_port, log_level="warning")
+        self.http_server = uvicorn.Server(config)
+        logger.info(f"🌐 HTTP 모드 시작: http://{self.http_host}:{self.http_port}{self.http_path} (SSE: /sse)")
+        await self.http_server.serve()
+    
+    async def _serve_stdio(self):
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await self.server.run(read_stream, write_stream, self._initialization_options())
+    
+    async def run(self):
+        """서버를 실행합니다.
+        
+        Jira 클라이언트는 첫 요청 때 만듭니다. 생성 시 SSL 컨텍스트와 httpcore 로드에 100ms 이상 걸려
+        미리 만들면 initialize 응답이 그만큼 늦어집니다.
+        """
+        dump_task = asyncio.create_task(self._stats_dump_loop()) if self.stats_dump_path else None
+        warmup_tasks = self._start_warmup()
+        try:
+            if self.transport == "http":
+                await self._serve_http()
+            else:
+                await self._serve_stdio()
+        finally:
+            for task in warmup_tasks:
+                task.cancel()
+            if dump_task is not None:
+                dump_task.cancel()
+                try:
+                    self._dump_stats()
+                except OSError as e:
+                    logger.error(f"Stats dump error: {str(e)}")
+            if self.mirror_initial_sync is not None:
+                self.mirror_initial_sync.cancel()
+            await self.aclose()
+            if self.mirror is not None:
+                self.mirror.close()
+            if self.disk_cache is not None:
+                self.disk_cache.close()
 
 async def main():
     """메인 함수"""
@@ -84,13 +84,28 @@ async def test_server():
             "get_project", 
             "search_issues",
             "get_issue",
+            "get_issues",
+            "get_issue_activity",
+            "aggregate_issues",
+            "batch",
+            "export_issues",
+            "expand_epic",
             "get_project_versions",
-            "search_qa_issues"
+            "search_qa_issues",
+            "changes_since",
+            "sync_status",
+            "server_stats",
+            "cache_stats",
+            "stop_operation"
         ]
         
         print(f"  📋 예상되는 도구 목록 ({len(expected_tools)}개):")
         for tool in expected_tools:
             print(f"    - {tool}")
+        from ssg_jira_mcp_server import TOOLS
+        if [tool.name for tool in TOOLS] != expected_tools:
+            print(f"  ❌ 도구 목록이 예상과 다릅니다: {[tool.name for tool in TOOLS]}")
+            return False
         
         # 인증 검증 테스트
         print("\n🔑 7. 인증 검증 테스트...")
@@ -123,6 +138,16 @@ async def test_server():
                 print("     - Jira URL이 올바른지 확인하세요")
                 print("     - 인증 정보가 올바른지 확인하세요")
         
+        # 오프라인 동작 테스트 (가짜 Jira 응답 사용)
+        print("\n🧪 9. 오프라인 동작 테스트...")
+        if not await test_offline():
+            return False
+        
+        # 시작 시간 측정 (새 프로세스의 import, initialize, tools/list 응답)
+        print("\n⏱️ 10. 시작 시간 측정...")
+        if not measure_startup():
+            return False
+        
         print("\n" + "=" * 60)
         print("🎉 기본 테스트 완료!")
         print("=" * 60)
@@ -152,6 +177,901 @@ async def test_server():
         print("  3. 파일 경로 및 권한 확인")
         return False
 
+def measure_startup() -> bool:
+    """새 프로세스로 서버를 띄워 import 시간과 initialize/tools/list 첫 응답 시간을 측정합니다."""
+    import subprocess
+    import time
+    import mcp.types as mcp_types
+    from ssg_jira_mcp_server import TOOLS
+    
+    here = os.path.dirname(os.path.abspath(__file__))
+    env = {**os.environ, "JIRA_USERNAME": "test@ssg.com", "JIRA_API_TOKEN": "test-token"}
+    
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "import ssg_jira_mcp_server"], cwd=here, env=env, check=True, capture_output=True)
+    print(f"  ⏱️ 모듈 import (인터프리터 시작 포함): {(time.perf_counter() - started) * 1000:.0f}ms")
+    
+    requests = [
+        {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {
+            "protocolVersion": mcp_types.LATEST_PROTOCOL_VERSION, "capabilities": {},
+            "clientInfo": {"name": "test", "version": "1.0"}
+        }},
+        {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}
+    ]
+    for label, command in (
+        ("스크립트 실행", [sys.executable, os.path.join(here, "ssg_jira_mcp_server.py")]),
+        ("모듈 실행 (-m)", [sys.executable, "-m", "ssg_jira_mcp_server"])
+    ):
+        started = time.perf_counter()
+        proc = subprocess.Popen(command, cwd=here, env=env, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True, encoding="utf-8")
+        try:
+            elapsed, replies = [], []
+            for request in requests:
+                proc.stdin.write(json.dumps(request) + "\n")
+                proc.stdin.flush()
+                replies.append(json.loads(proc.stdout.readline()))
+                elapsed.append((time.perf_counter() - started) * 1000)
+                if request["method"] == "initialize":
+                    proc.stdin.write(json.dumps({"jsonrpc": "2.0", "method": "notifications/initialized"}) + "\n")
+        finally:
+            proc.stdin.close()
+            proc.wait(timeout=10)
+        if replies[0]["result"]["serverInfo"]["name"] != "ssg-jira" or len(replies[1]["result"]["tools"]) != len(TOOLS):
+            print(f"  ❌ {label}: initialize/tools/list 응답이 예상과 다릅니다")
+            return False
+        print(f"  ⏱️ {label}: initialize {elapsed[0]:.0f}ms, tools/list {elapsed[1]:.0f}ms")
+    print("  ✅ 시작 시간 측정 정상")
+    return True
+
+
+def jql_keys(jql: str) -> list:
+    """'key in ("A-1","A-2")'처럼 JQL의 첫 번째 in (...) 목록에서 키를 꺼냅니다."""
+    _, _, rest = jql.partition(" in (")
+    return [key.strip('" ') for key in rest[:rest.index(")")].split(",")] if rest else []
+
+
+def make_fake_jira(total_issues: int = 230, page_cap: int = 50):
+    """httpx.MockTransport용 가짜 Jira REST API 핸들러를 만듭니다."""
+    import httpx
+    
+    calls = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        path = request.url.path
+        params = request.url.params
+        if path == "/rest/api/2/search" and params.get("jql", "").startswith("key in"):
+            requested = jql_keys(params["jql"])
+            issues = [
+                {"key": key, "fields": {"summary": f"{key} 요약", "customfield_12213": {"value": "Y"}}}
+                for key in requested if key.startswith("QAQ-")
+            ]
+            return httpx.Response(200, json={"startAt": 0, "maxResults": len(requested), "total": len(issues), "issues": issues})
+        if path == "/rest/api/2/search":
+            start_at = int(params.get("startAt", 0))
+            max_results = min(int(params.get("maxResults", 50)), page_cap)
+            issues = [
+                {"key": f"QAQ-{i}", "fields": {
+                    "summary": f"이슈 {i}", "status": {"name": "Open"}, "updated": "2025-01-02T09:00:00.000+0900"
+                }}
+                for i in range(start_at, min(start_at + max_results, total_issues))
+            ]
+            return httpx.Response(200, json={
+                "startAt": start_at, "maxResults": max_results, "total": total_issues, "issues": issues
+            })
+        if path.startswith("/rest/api/2/issue/"):
+            key = path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json={"key": key, "fields": {
+                "summary": f"{key} 요약", "updated": "2025-01-01T09:00:00.000+0900"
+            }})
+        return httpx.Response(404, json={"errorMessages": ["not found"]})
+    
+    return handler, calls
+
+
+def make_fake_mirror_jira(issues: dict, changed: set):
+    """프리셋 JQL 일부를 해석하는 미러 동기화용 가짜 Jira 핸들러를 만듭니다."""
+    import httpx
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/rest/api/2/field":
+            return httpx.Response(200, json=[{"id": "customfield_10101", "name": "Epic Link"}])
+        jql = request.url.params.get("jql", "")
+        matched = list(issues.values())
+        if '"QA 대상" = Y' in jql:
+            matched = [i for i in matched if (i["fields"].get("customfield_12213") or {}).get("value") == "Y"]
+        if "type = Epic" in jql or '"배포 진행"' in jql:
+            matched = []
+        if "updated >=" in jql:
+            matched = [i for i in matched if i["key"] in changed]
+        return httpx.Response(200, json={"startAt": 0, "maxResults": 100, "total": len(matched), "issues": matched})
+    
+    return handler
+
+
+def make_fake_epic_jira(issues: dict):
+    """key in / "Epic Link" in / parent in JQL을 해석하는 에픽 트리용 가짜 Jira 핸들러를 만듭니다."""
+    import httpx
+    
+    calls = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.url.path == "/rest/api/2/field":
+            return httpx.Response(200, json=[{"id": "customfield_10101", "name": "Epic Link"}])
+        jql = request.url.params.get("jql", "")
+        field, keys = jql.partition(" in (")[0], jql_keys(jql)
+        if field == "key":
+            matched = [issue for key, issue in issues.items() if key in keys]
+        elif field == '"Epic Link"':
+            matched = [issue for issue in issues.values() if issue["fields"].get("customfield_10101") in keys]
+        else:
+            matched = [issue for issue in issues.values() if (issue["fields"].get("parent") or {}).get("key") in keys]
+        return httpx.Response(200, json={"startAt": 0, "maxResults": 100, "total": len(matched), "issues": matched})
+    
+    return handler, calls
+
+
+def make_fake_feed_jira(issues: dict, changed: set):
+    """status = Open 쿼리와 updated/NOT/key in 조건을 해석하는 변경 피드용 가짜 Jira 핸들러를 만듭니다.
+    
+    Jira처럼 NOT (status = Open)은 status가 EMPTY인 이슈를 포함하지 않습니다.
+    """
+    import httpx
+    
+    def status(issue: dict):
+        return (issue["fields"].get("status") or {}).get("name")
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        jql = request.url.params.get("jql", "")
+        where, _, order_by = jql.upper().partition("ORDER BY")
+        # Jira처럼 ORDER BY 뒤에 조건이 이어지거나 괄호 안에 있으면 잘못된 JQL로 응답
+        if order_by and (")" in order_by or " AND " in order_by):
+            return httpx.Response(400, json={"errorMessages": [f"잘못된 JQL: {jql}"]})
+        if jql.startswith("key in"):
+            keys = jql_keys(jql)
+            matched = [issue for key, issue in issues.items() if key in keys]
+        elif "NOT (" in jql:
+            matched = [issue for issue in issues.values() if status(issue) not in (None, "Open")]
+        else:
+            matched = [issue for issue in issues.values() if status(issue) == "Open"]
+        if "updated >=" in jql:
+            matched = [issue for issue in matched if issue["key"] in changed]
+        return httpx.Response(200, json={"startAt": 0, "maxResults": 100, "total": len(matched), "issues": matched})
+    
+    return handler
+
+
+def make_fake_activity_jira(comments: dict, worklogs: dict, histories: dict, page_cap: int = 2, forbidden: tuple = ()):
+    """key in 배치 검색(expand=changelog)과 페이지 단위 /comment, /worklog를 흉내 내는 가짜 Jira 핸들러를 만듭니다."""
+    import httpx
+    
+    requests = []
+    
+    def page(items: list, params, field: str) -> dict:
+        start_at = int(params.get("startAt", 0))
+        max_results = min(int(params.get("maxResults", 50)), page_cap)
+        return {"startAt": start_at, "maxResults": max_results, "total": len(items), field: items[start_at:start_at + max_results]}
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        path, params = request.url.path, request.url.params
+        if path == "/rest/api/2/search":
+            keys = jql_keys(params.get("jql", ""))
+            issues = []
+            for key in keys:
+                if key not in comments:
+                    continue
+                issue = {"key": key, "fields": {"summary": f"{key} 요약", "status": {"name": "Open"},
+                                                "updated": "2025-01-05T09:00:00.000+0900" if key != "QAQ-2" else "2024-12-01T09:00:00.000+0900"}}
+                if params.get("expand") == "changelog":
+                    issue["changelog"] = {"startAt": 0, "maxResults": len(histories[key]), "total": len(histories[key]), "histories": histories[key]}
+                issues.append(issue)
+            return httpx.Response(200, json={"startAt": 0, "maxResults": len(keys), "total": len(issues), "issues": issues})
+        key, resource = path.split("/")[-2:]
+        if key in forbidden:
+            return httpx.Response(403, json={"errorMessages": ["권한 없음"]})
+        if resource == "comment":
+            return httpx.Response(200, json=page(comments[key], params, "comments"))
+        if resource == "worklog":
+            return httpx.Response(200, json=page(worklogs[key], params, "worklogs"))
+        return httpx.Response(404, json={"errorMessages": ["not found"]})
+    
+    return handler, requests
+
+
+def make_test_server(handler):
+    """가짜 Jira 핸들러로 요청하는 테스트용 서버를 새로 만듭니다.
+    
+    검사 항목마다 새 서버를 써서 앞 항목에서 바꾼 설정(재시도, 동시 실행 수), 캐시, 클라이언트가 다음 항목에 남지 않게 합니다.
+    """
+    import httpx
+    from ssg_jira_mcp_server import SSGJiraMCPServer
+    
+    server = SSGJiraMCPServer()
+    server.username, server.api_token = "test@ssg.com", "test-token"
+    server._setup_auth_headers()
+    server.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return server
+
+
+async def test_offline() -> bool:
+    """가짜 Jira 응답으로 요청 계층 동작을 검증합니다. 각 항목은 새 서버에서 독립적으로 실행합니다."""
+    import httpx
+    
+    # 자동 페이지 조회
+    handler, calls = make_fake_jira(total_issues=230, page_cap=50)
+    server = make_test_server(handler)
+    data = await server._search_all({"jql": "project = QAQ", "fields": "summary", "maxResults": 100})
+    keys = [issue["key"] for issue in data["issues"]]
+    if keys != [f"QAQ-{i}" for i in range(230)] or len(calls) != 5:
+        print(f"  ❌ 전체 페이지 조회 결과가 예상과 다릅니다: {len(keys)}건, {len(calls)}회 요청")
+        return False
+    data = await server._search_all({"jql": "project = QAQ", "fields": "summary", "maxResults": 50}, limit=120)
+    if len(data["issues"]) != 120:
+        print(f"  ❌ limit 적용 결과가 예상과 다릅니다: {len(data['issues'])}건")
+        return False
+    print("  ✅ 자동 페이지 조회 (fetch_all/limit) 정상")
+    
+    # 서버 측 집계
+    await server.aclose()
+    server = make_test_server(handler)
+    calls.clear()
+    result = await server._aggregate_issues({"jql": "project = QAQ", "group_by": ["status"]})
+    aggregate = json.loads(result[0].text.split("```json\n", 1)[1].rsplit("\n```", 1)[0])
+    if aggregate["groups"] != [{"status": "Open", "count": 230}] or calls[0].url.params.get("fields") != "status":
+        print(f"  ❌ 집계 결과가 예상과 다릅니다: {aggregate['groups']}")
+        return False
+    calls.clear()
+    result = await server._aggregate_issues({"jql": "project = QAQ"})
+    if "230" not in result[0].text or calls[0].url.params.get("maxResults") != "0":
+        print("  ❌ 전체 건수 조회(maxResults=0)가 예상과 다릅니다")
+        return False
+    print("  ✅ 서버 측 집계 (aggregate_issues) 정상")
+    
+    # 검색 응답 스트리밍 해석
+    from ssg_jira_mcp_server import SearchStreamParser
+    
+    page = {"startAt": 0, "maxResults": 50, "total": 50, "names": {"issues": "]"}, "issues": [
+        {"key": f"QAQ-{i}", "fields": {"summary": f'괄호 {{ }} [ ] "따옴표" \\ {i}', "description": "가" * 1000, "labels": ["a"]}}
+        for i in range(50)
+    ]}
+    raw = json.dumps(page, ensure_ascii=False).encode()
+    parser = SearchStreamParser()
+    streamed = [issue for i in range(0, len(raw), 7) for issue in parser.feed(raw[i:i + 7])]
+    if streamed != page["issues"] or parser.finish() != {**page, "issues": []} or parser.max_buffer > 4000:
+        print(f"  ❌ 스트리밍 해석 결과가 예상과 다릅니다: {len(streamed)}건, 최대 버퍼 {parser.max_buffer}바이트")
+        return False
+    
+    async def chunked(body: bytes):
+        for i in range(0, len(body), 1000):
+            yield body[i:i + 1000]
+    
+    def chunked_handler(request: httpx.Request) -> httpx.Response:
+        response = handler(request)
+        return httpx.Response(response.status_code, content=chunked(response.content))
+    
+    await server.aclose()
+    server = make_test_server(chunked_handler)
+    streamed = await server._run_search("project = QAQ", "summary", 100, fetch_all=True)
+    server.stream_search = False
+    buffered = await server._run_search("project = QAQ", "summary", 100, fetch_all=True)
+    server.stream_search = True
+    if streamed != buffered or len(streamed["issues"]) != 230:
+        print("  ❌ 스트리밍 검색 결과가 일반 검색과 다릅니다")
+        return False
+    print("  ✅ 검색 응답 스트리밍 해석 정상")
+    
+    # 응답 캐시
+    await server.aclose()
+    server = make_test_server(handler)
+    calls.clear()
+    await server._get_issue({"issue_key": "QAQ-1"})
+    await server._get_issue({"issue_key": "QAQ-1"})
+    await server._get_issue({"issue_key": "QAQ-1", "bypass_cache": True})
+    if len(calls) != 2 or server.cache.stats["issue"]["hits"] != 1:
+        print(f"  ❌ 캐시 동작이 예상과 다릅니다: {len(calls)}회 요청")
+        return False
+    await server._search_issues({"jql": "key = QAQ-1", "max_results": 5})
+    await server._get_issue({"issue_key": "QAQ-1"})
+    if len(calls) != 4 or server.cache.stats["issue"]["invalidations"] != 1:
+        print("  ❌ 검색 결과의 최신 updated로 캐시가 무효화되지 않았습니다")
+        return False
+    print("  ✅ 응답 캐시 (TTL/LRU/무효화) 정상")
+    
+    # 디스크 응답 캐시 (재시작 후 유지, 여러 프로세스 공유)
+    import sqlite3
+    import subprocess
+    import tempfile
+    import time
+    from ssg_jira_mcp_server import DiskCache, SSGJiraMCPServer
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ["JIRA_DISK_CACHE_DIR"] = cache_dir
+        try:
+            first, restarted = SSGJiraMCPServer(), SSGJiraMCPServer()
+        finally:
+            del os.environ["JIRA_DISK_CACHE_DIR"]
+        for instance in (first, restarted):
+            instance.username, instance.api_token = server.username, server.api_token
+            instance._setup_auth_headers()
+            instance.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        calls.clear()
+        await first._get_issue({"issue_key": "QAQ-2"})
+        result = await restarted._get_issue({"issue_key": "QAQ-2"})
+        if len(calls) != 1 or restarted.disk_cache.stats["hits"] != 1 or "QAQ-2" not in result[0].text:
+            print(f"  ❌ 재시작한 서버가 디스크 캐시를 사용하지 않았습니다: {len(calls)}회 요청")
+            return False
+        await first._search_issues({"jql": "key = QAQ-2", "max_results": 5})
+        if first.disk_cache.snapshot()["entries"] != 0:
+            print("  ❌ 검색 결과의 최신 updated로 디스크 캐시가 무효화되지 않았습니다")
+            return False
+        
+        await first._get_issue({"issue_key": "QAQ-3"})
+        first.disk_cache.conn.execute("UPDATE entries SET format = 0")
+        restarted.cache = type(restarted.cache)(restarted.cache.max_entries, restarted.cache.ttls)
+        calls.clear()
+        await restarted._get_issue({"issue_key": "QAQ-3"})
+        if len(calls) != 1:
+            print("  ❌ 이전 저장 형식의 디스크 캐시 항목이 사용되었습니다")
+            return False
+        for instance in (first, restarted):
+            await instance.aclose()
+            instance.disk_cache.close()
+        
+        # 여러 프로세스가 동시에 쓰면서 용량 제한 유지
+        writer = (
+            "import os, sys; sys.path.insert(0, sys.argv[2]); from ssg_jira_mcp_server import DiskCache; "
+            "cache = DiskCache(sys.argv[1], max_bytes=64 * 1024, ttls={'issue': 60}); "
+            "[cache.set(f'{os.getpid()}-{i}', 'issue', f'QAQ-{i}', {'blob': os.urandom(512).hex()}) for i in range(150)]; "
+            "sys.exit(1 if cache.stats['errors'] else 0)"
+        )
+        shared_dir = os.path.join(cache_dir, "shared")
+        here = os.path.dirname(os.path.abspath(__file__))
+        writers = [subprocess.Popen([sys.executable, "-c", writer, shared_dir, here], stderr=subprocess.DEVNULL) for _ in range(3)]
+        codes = [w.wait() for w in writers]
+        shared = DiskCache(shared_dir, max_bytes=64 * 1024, ttls={"issue": 60})
+        usage = shared.snapshot()
+        
+        # 다른 프로세스가 쓰기 잠금을 잡고 있으면 기다리지 않고 저장은 건너뛰고, 무효화 대상은 미스로 처리
+        shared.set("busy-1", "issue", "QAQ-1", {"key": "QAQ-1"}, version="2025-01-01")
+        locker = sqlite3.connect(shared.path, isolation_level=None)
+        locker.execute("BEGIN IMMEDIATE")
+        started = time.perf_counter()
+        shared.set("busy-2", "issue", "QAQ-2", {"key": "QAQ-2"})
+        cached = shared.get("busy-1")
+        shared.invalidate_if_older("issue", [("QAQ-1", "2025-01-02")])
+        invalidated = shared.get("busy-1")
+        busy_seconds = time.perf_counter() - started
+        locker.execute("ROLLBACK")
+        locker.close()
+        leftover = shared.get("busy-1")
+        busy = shared.stats["busy"]
+        shared.close()
+    if codes != [0, 0, 0] or not 0 < usage["bytes"] <= 64 * 1024:
+        print(f"  ❌ 다중 프로세스 쓰기/용량 제한이 예상과 다릅니다: {codes}, {usage['bytes']}바이트")
+        return False
+    if busy_seconds > 1 or not busy or cached is None or invalidated is not None or leftover is not None:
+        print(f"  ❌ 잠금 중 디스크 캐시 처리가 예상과 다릅니다: {busy_seconds:.2f}초, busy {busy}회")
+        return False
+    print("  ✅ 디스크 응답 캐시 (재시작 유지/형식 버전/다중 프로세스) 정상")
+    
+    # 필드 프로필
+    from ssg_jira_mcp_server import ISSUE_PROFILES
+    
+    await server.aclose()
+    server = make_test_server(handler)
+    calls.clear()
+    result = await server._get_issue({"issue_key": "QAQ-5", "profile": "summary"})
+    info = json.loads(result[0].text.split("```json\n", 1)[1].rsplit("\n```", 1)[0])
+    if calls[0].url.params.get("fields") != ISSUE_PROFILES["summary"].fields or "description" in info:
+        print(f"  ❌ 필드 프로필이 적용되지 않았습니다: {calls[0].url.params.get('fields')}")
+        return False
+    print("  ✅ 필드 프로필 (summary/qa/full) 정상")
+    
+    # 출력 형식, max_chars 예산
+    rows = [{"key": f"QAQ-{i}", "summary": "요약", "description": "가" * 2000} for i in range(20)]
+    table = server._format_result("결과", {"total": 20, "issues": rows}, {"output_format": "table"})[0].text
+    table_lines = table.split("```jsonl\n", 1)[1].rsplit("\n```", 1)[0].split("\n")
+    if table_lines[1] != '["key","summary","description"]' or len(table_lines) != 22:
+        print(f"  ❌ table 형식이 예상과 다릅니다: {table_lines[:2]}")
+        return False
+    budget = server._format_result("결과", {"total": 20, "issues": rows}, {"output_format": "compact", "max_chars": 5000})[0].text
+    body = budget.split("```json\n", 1)[1].rsplit("\n```", 1)[0]
+    if len(body) > 5000 or "✂️" not in budget or len(json.loads(body)["issues"]) != 20:
+        print(f"  ❌ max_chars 예산이 적용되지 않았습니다: {len(body)}자")
+        return False
+    print("  ✅ 출력 형식 (table/ndjson) 및 max_chars 예산 정상")
+    
+    # 배치 이슈 조회
+    await server.aclose()
+    server = make_test_server(handler)
+    result = await server._get_issues({"issue_keys": ["QAQ-1", "qaq-2", "NOPE-1", "QAQ-1"]})
+    batch = json.loads(result[0].text.split("```json\n", 1)[1].rsplit("\n```", 1)[0])
+    if [issue["key"] for issue in batch["issues"]] != ["QAQ-1", "QAQ-2"] or list(batch["errors"]) != ["NOPE-1"]:
+        print(f"  ❌ 배치 조회 결과가 예상과 다릅니다: {batch}")
+        return False
+    if batch["issues"][0]["qa_대상"] != "Y":
+        print("  ❌ 배치 조회에 QA 커스텀 필드가 없습니다")
+        return False
+    
+    # key in 조회가 실패하면 단건 조회로 대체하되 동시에 요청
+    in_flight = [0, 0]
+    
+    async def fallback_handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/rest/api/2/search":
+            return httpx.Response(400, json={"errorMessages": ["잘못된 JQL"]})
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight[1], in_flight[0])
+        await asyncio.sleep(0.02)
+        in_flight[0] -= 1
+        key = request.url.path.rsplit("/", 1)[1]
+        if key.startswith("NOPE"):
+            return httpx.Response(404, json={"errorMessages": ["이슈 없음"]})
+        return httpx.Response(200, json={"key": key, "fields": {"summary": f"{key} 요약", "updated": "2025-01-01T09:00:00.000+0900"}})
+    
+    await server.aclose()
+    server = make_test_server(fallback_handler)
+    found, errors = await server._fetch_issue_chunk(["QAQ-1", "QAQ-2", "NOPE-1"], "summary,updated")
+    if sorted(found) != ["QAQ-1", "QAQ-2"] or list(errors) != ["NOPE-1"] or in_flight[1] < 2:
+        print(f"  ❌ 단건 조회 대체 결과가 예상과 다릅니다: {sorted(found)}, {errors}, 최대 동시 {in_flight[1]}건")
+        return False
+    print("  ✅ 배치 이슈 조회 (get_issues) 정상")
+    
+    # 백그라운드 예열 (stale-while-revalidate)
+    from ssg_jira_mcp_server import SnapshotStore
+    
+    await server.aclose()
+    server = make_test_server(handler)
+    server.snapshots = SnapshotStore()
+    server.warmup_presets = ["qa_target"]
+    server.warmup_interval = 60
+    calls.clear()
+    warmup_tasks = server._start_warmup()
+    await asyncio.sleep(0.05)
+    result = await server._search_qa_issues({"search_type": "qa_target"})
+    snapshot = json.loads(result[0].text.split("```json\n", 1)[1].rsplit("\n```", 1)[0])
+    if snapshot.get("source") != "snapshot" or len(calls) != 1:
+        print(f"  ❌ 예열된 스냅샷으로 응답하지 않았습니다: {len(calls)}회 요청")
+        return False
+    for task in warmup_tasks:
+        task.cancel()
+    # 주기가 지난 스냅샷은 즉시 반환하고 갱신은 백그라운드에서 진행
+    server.warmup_interval = 0
+    result = await server._search_qa_issues({"search_type": "qa_target"})
+    stale = json.loads(result[0].text.split("```json\n", 1)[1].rsplit("\n```", 1)[0])
+    await asyncio.gather(*server.snapshots._refreshing.values())
+    if not stale["refreshing"] or len(calls) != 2 or server.snapshots.stats["stale_served"] != 1:
+        print(f"  ❌ 오래된 스냅샷 갱신이 예상과 다릅니다: {len(calls)}회 요청")
+        return False
+    print("  ✅ 백그라운드 예열 (stale-while-revalidate) 정상")
+    
+    # 파일 내보내기 (중단 후 이어받기)
+    failed = []
+    
+    def flaky_handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("startAt") == "150" and not failed:
+            failed.append(request)
+            return httpx.Response(400, json={"errorMessages": ["일시 오류"]})
+        return handler(request)
+    
+    await server.aclose()
+    server = make_test_server(flaky_handler)
+    with tempfile.TemporaryDirectory() as export_dir:
+        export_args = {"jql": "project = QAQ", "path": os.path.join(export_dir, "qa.jsonl"), "page_size": 50}
+        first = await server._export_issues(export_args)
+        result = await server._export_issues(export_args)
+        exported = json.loads(result[0].text.split("```json\n", 1)[1].rsplit("\n```", 1)[0])
+        with open(exported["path"], encoding="utf-8") as f:
+            keys = [json.loads(line)["key"] for line in f]
+        csv_result = await server._export_issues({**export_args, "path": os.path.join(export_dir, "qa.csv"), "format": "csv"})
+        with open(os.path.join(export_dir, "qa.csv"), encoding="utf-8-sig") as f:
+            csv_lines = f.read().splitlines()
+        leftovers = [name for name in os.listdir(export_dir) if name.endswith(".progress")]
+    if "startAt=150" not in first[0].text or exported["resumed_from"] != 150 or keys != [f"QAQ-{i}" for i in range(230)]:
+        print(f"  ❌ 내보내기 이어받기 결과가 예상과 다릅니다: {first[0].text[:80]}, {len(keys)}건")
+        return False
+    if len(csv_lines) != 231 or not csv_lines[0].startswith("key,summary") or leftovers:
+        print(f"  ❌ CSV 내보내기 결과가 예상과 다릅니다: {len(csv_lines)}줄, {csv_result[0].text[:80]}")
+        return False
+    print("  ✅ 파일 내보내기 (export_issues, 이어받기) 정상")
+    
+    # 배치 실행 (batch)
+    await server.aclose()
+    server = make_test_server(handler)
+    result = await server._batch({"calls": [
+        {"tool": "search_issues", "arguments": {"jql": "project = QAQ", "max_results": 5}, "id": "검색"},
+        {"tool": "get_issue", "arguments": {"issue_key": "QAQ-1", "bypass_cache": True}},
+        {"tool": "get_project", "arguments": {"project_key": "QAQ"}},
+        {"tool": "search_issues", "arguments": {}},
+        "get_issue",
+        None
+    ]})
+    batch = json.loads(result[0].text.split("```json\n", 1)[1].rsplit("\n```", 1)[0])
+    shared = {issue["key"]: issue for issue in batch["issues"]}
+    if batch["results"][0]["result"]["issues"] != [f"QAQ-{i}" for i in range(5)] or batch["results"][1]["result"] != {"issue": "QAQ-1"}:
+        print(f"  ❌ 배치 결과의 이슈 참조가 예상과 다릅니다: {batch['results'][:2]}")
+        return False
+    if len(shared) != 5 or "description" not in shared["QAQ-1"] or batch["failed"] != 4 or "jql" not in batch["results"][3]["error"]:
+        print(f"  ❌ 배치 이슈 표/오류 격리가 예상과 다릅니다: {batch}")
+        return False
+    if [sorted(entry) for entry in batch["results"][4:]] != [["error", "index"], ["error", "index"]]:
+        print(f"  ❌ 형식이 잘못된 하위 호출이 해당 항목의 오류로 기록되지 않았습니다: {batch['results'][4:]}")
+        return False
+    print("  ✅ 배치 실행 (batch, 이슈 중복 제거/오류 격리) 정상")
+    
+    # 변경 피드 (changes_since)
+    def make_feed_issue(key: str, status: str, assignee: str, histories: list = None) -> dict:
+        return {"key": key, "fields": {"summary": f"{key} 요약", "status": {"name": status}, "assignee": {"displayName": assignee}},
+                "changelog": {"histories": histories or []}}
+    
+    feed_issues = {key: make_feed_issue(key, "Open", "김철수") for key in ("QAQ-1", "QAQ-2", "QAQ-3", "QAQ-5")}
+    feed_changed: set = set()
+    await server.aclose()
+    server = make_test_server(make_fake_feed_jira(feed_issues, feed_changed))
+    feed_args = {"query_name": "open_issues", "jql": "status = Open", "include_changelog": True}
+    await server._changes_since(feed_args)
+    
+    now = time.strftime("%Y-%m-%dT%H:%M:%S.000%z", time.localtime(time.time() + 1))
+    feed_issues["QAQ-2"] = make_feed_issue("QAQ-2", "Open", "이영희")
+    feed_issues["QAQ-3"] = make_feed_issue("QAQ-3", "Closed", "김철수")
+    feed_issues["QAQ-4"] = make_feed_issue("QAQ-4", "Open", "김철수", [
+        {"created": now, "author": {"displayName": "김철수"}, "items": [{"field": "status", "fromString": "New", "toString": "Open"}]}
+    ])
+    feed_issues["QAQ-5"]["fields"]["status"] = None  # 필드가 EMPTY로 바뀌어도 제외로 판단
+    feed_issues["QAQ-9"] = make_feed_issue("QAQ-9", "Closed", "김철수")  # 추적한 적 없는 이슈는 removed 대상이 아님
+    feed_changed.update({"QAQ-1", "QAQ-2", "QAQ-3", "QAQ-4", "QAQ-5", "QAQ-9"})
+    result = await server._changes_since(feed_args)
+    feed = json.loads(result[0].text.split("```json\n", 1)[1].rsplit("\n```", 1)[0])
+    changes = {row["key"]: row for row in feed["issues"]}
+    if feed["baseline"] or {key: row["change"] for key, row in changes.items()} != {
+        "QAQ-2": "changed", "QAQ-3": "removed", "QAQ-4": "added", "QAQ-5": "removed"
+    }:
+        print(f"  ❌ 변경 피드 결과가 예상과 다릅니다: {feed}")
+        return False
+    if list(changes["QAQ-2"]["changed_fields"]) != ["assignee"] or changes["QAQ-4"]["transitions"][0]["to"] != "Open":
+        print(f"  ❌ 변경 필드/상태 전환이 예상과 다릅니다: {changes['QAQ-2']}, {changes['QAQ-4']}")
+        return False
+    
+    # ORDER BY가 있는 JQL도 증분 조회 시 정렬 절을 조건 뒤로 옮겨 조회
+    ordered_args = {"query_name": "open_ordered", "jql": "status = Open ORDER BY updated DESC"}
+    await server._changes_since(ordered_args)
+    feed_issues["QAQ-1"] = make_feed_issue("QAQ-1", "Open", "이영희")
+    result = await server._changes_since(ordered_args)
+    if "❌" in result[0].text:
+        print(f"  ❌ ORDER BY가 있는 JQL의 증분 조회가 실패했습니다: {result[0].text[:120]}")
+        return False
+    ordered = json.loads(result[0].text.split("```json\n", 1)[1].rsplit("\n```", 1)[0])
+    if ordered["baseline"] or [(row["key"], row["change"]) for row in ordered["issues"]] != [("QAQ-1", "changed")]:
+        print(f"  ❌ ORDER BY가 있는 JQL의 변경 피드가 예상과 다릅니다: {ordered}")
+        return False
+    print("  ✅ 변경 피드 (changes_since) 정상")
+    
+    # 이슈 활동 일괄 조회 (get_issue_activity)
+    def at(day: int, hour: int = 9) -> str:
+        return f"2025-01-{day:02d}T{hour:02d}:00:00.000+0900"
+    
+    activity_comments = {
+        "QAQ-1": [{"created": at(day), "author": {"displayName": "김철수"}, "body": f"댓글 {day} " + "가" * 50} for day in (1, 3, 4, 2, 5)],
+        "QAQ-2": [{"created": at(1), "author": {"displayName": "이영희"}, "body": "오래된 댓글"}],
+        "QAQ-3": []
+    }
+    activity_worklogs = {
+        "QAQ-1": [{"started": at(3, 10), "author": {"displayName": "김철수"}, "timeSpent": "1h", "comment": "검증"}], "QAQ-2": [], "QAQ-3": []
+    }
+    activity_histories = {
+        "QAQ-1": [{"created": at(2, 11), "author": {"displayName": "이영희"}, "items": [
+            {"field": "status", "fromString": "Open", "toString": "In Progress"},
+            {"field": "assignee", "fromString": None, "toString": "김철수"}
+        ]}],
+        "QAQ-2": [],
+        "QAQ-3": []
+    }
+    activity_handler, activity_requests = make_fake_activity_jira(
+        activity_comments, activity_worklogs, activity_histories, forbidden=("QAQ-3",)
+    )
+    await server.aclose()
+    server = make_test_server(activity_handler)
+    result = await server._get_issue_activity({"issue_keys": ["QAQ-1", "qaq-2", "QAQ-404"], "body_chars": 10})
+    activity = json.loads(result[0].text.split("```json\n", 1)[1].rsplit("\n```", 1)[0])
+    stream = activity["issues"][0]["activity"]
+    if [entry["at"] for entry in stream] != sorted(entry["at"] for entry in stream) or activity["issues"][0]["counts"] != {"comment": 5, "change": 2, "worklog": 1}:
+        print(f"  ❌ 활동 목록 병합/정렬이 예상과 다릅니다: {stream}")
+        return False
+    if not stream[0]["body"].endswith("…") or list(activity["errors"]) != ["QAQ-404"] or activity["found"] != 2:
+        print(f"  ❌ 본문 자르기/없는 키 처리가 예상과 다릅니다: {activity['errors']}")
+        return False
+    comment_pages = [r for r in activity_requests if r.url.path.endswith("QAQ-1/comment")]
+    if len(comment_pages) != 3 or sum(r.url.path == "/rest/api/2/search" for r in activity_requests) != 1:
+        print(f"  ❌ 댓글 페이지 조회 횟수가 예상과 다릅니다: {len(comment_pages)}회")
+        return False
+    
+    result = await server._get_issue_activity({"issue_keys": ["QAQ-3"]})
+    failed = json.loads(result[0].text.split("```json\n", 1)[1].rsplit("\n```", 1)[0])
+    if sorted(failed["errors"].get("QAQ-3", {})) != ["comment", "worklog"]:
+        print(f"  ❌ 이슈별 출처 오류가 모두 기록되지 않았습니다: {failed['errors']}")
+        return False
+    
+    activity_requests.clear()
+    result = await server._get_issue_activity({
+        "issue_keys": ["QAQ-1", "QAQ-2"], "since": "2025-01-03T00:00:00+0900", "changelog_fields": ["status"], "output_format": "compact"
+    })
+    activity = json.loads(result[0].text.split("```json\n", 1)[1].rsplit("\n```", 1)[0])
+    recent = {issue["key"]: issue["activity"] for issue in activity["issues"]}
+    if [entry["type"] for entry in recent["QAQ-1"]] != ["comment", "worklog", "comment", "comment"] or recent["QAQ-2"]:
+        print(f"  ❌ since/changelog_fields 필터가 예상과 다릅니다: {recent}")
+        return False
+    if any("QAQ-2/" in r.url.path for r in activity_requests):
+        print("  ❌ since 이전에 수정된 이슈의 댓글/작업 로그를 조회했습니다")
+        return False
+    print("  ✅ 이슈 활동 일괄 조회 (get_issue_activity) 정상")
+    
+    # 에픽 트리 펼치기
+    def make_tree_issue(key: str, **fields) -> dict:
+        return {"key": key, "fields": {"summary": f"{key} 요약", **fields}}
+    
+    tree = {issue["key"]: issue for issue in (
+        make_tree_issue("QAQ-100", issuelinks=[{"type": {"outward": "blocks"}, "outwardIssue": {"key": "APP-1"}}]),
+        make_tree_issue("QAQ-200"),
+        make_tree_issue("QAQ-101", customfield_10101="QAQ-100"),
+        make_tree_issue("QAQ-102", customfield_10101="QAQ-100"),
+        make_tree_issue("QAQ-201", customfield_10101="QAQ-200",
+                        issuelinks=[{"type": {"inward": "relates to"}, "inwardIssue": {"key": "QAQ-101"}}]),
+        make_tree_issue("QAQ-103", parent={"key": "QAQ-101"}),
+        make_tree_issue("APP-1", issuelinks=[{"type": {"outward": "relates to"}, "outwardIssue": {"key": "APP-2"}}]),
+        make_tree_issue("APP-2")
+    )}
+    epic_handler, epic_calls = make_fake_epic_jira(tree)
+    await server.aclose()
+    server = make_test_server(epic_handler)
+    result = await server._expand_epic({"epic_keys": ["QAQ-100", "qaq-200"], "link_depth": 1})
+    expanded = json.loads(result[0].text.split("```json\n", 1)[1].rsplit("\n```", 1)[0])
+    levels = [(row["key"], row["level"]) for row in expanded["issues"]]
+    expected = [
+        ("QAQ-100", "epic"), ("QAQ-101", "child"), ("QAQ-103", "subtask"), ("QAQ-102", "child"),
+        ("QAQ-200", "epic"), ("QAQ-201", "child"), ("APP-1", "linked")
+    ]
+    searches = [call for call in epic_calls if call.url.path == "/rest/api/2/search"]
+    # 에픽 1회, 하위 이슈 1회, 서브태스크 1회, 새 연결 이슈(APP-1) 1회 — 이미 조회한 QAQ-101은 다시 요청하지 않음
+    if levels != expected or len(searches) != 4 or "APP-2" in searches[-1].url.params["jql"]:
+        print(f"  ❌ 에픽 트리 결과가 예상과 다릅니다: {levels}, {len(searches)}회 검색")
+        return False
+    print("  ✅ 에픽 트리 펼치기 (expand_epic) 정상")
+    
+    # 로컬 SQLite 미러
+    from ssg_jira_mcp_server import IssueMirror
+    
+    def make_issue(key: str, qa_target: str) -> dict:
+        return {"key": key, "fields": {
+            "summary": f"{key} 요약", "project": {"key": "QAQ", "name": "QAQ"},
+            "customfield_12213": {"value": qa_target}, "fixVersions": [], "updated": "2025-01-01T09:00:00.000+0900"
+        }}
+    
+    mirror_issues = {key: make_issue(key, flag) for key, flag in (("QAQ-1", "Y"), ("QAQ-2", "Y"), ("QAQ-3", "N"))}
+    changed: set = set()
+    mirror_handler = make_fake_mirror_jira(mirror_issues, changed)
+    mirror_requests = []
+    with tempfile.TemporaryDirectory() as mirror_dir:
+        await server.aclose()
+        server = make_test_server(lambda request: mirror_requests.append(request) or mirror_handler(request))
+        server.mirror = IssueMirror(mirror_dir, ["QAQ"])
+        # 동기화 전 첫 호출은 전체 동기화를 기다리지 않고 Jira에서 조회하며, 전체 동기화는 백그라운드에서 진행
+        result = await server._search_qa_issues({"search_type": "qa_target"})
+        first = json.loads(result[0].text.split("```json\n", 1)[1].rsplit("\n```", 1)[0])
+        initial_sync = server.mirror_initial_sync
+        await initial_sync
+        
+        mirror_issues["QAQ-2"] = make_issue("QAQ-2", "N")
+        mirror_issues["QAQ-3"] = make_issue("QAQ-3", "Y")
+        changed.update({"QAQ-2", "QAQ-3"})
+        server.mirror_max_staleness = 0
+        result = await server._search_qa_issues({"search_type": "qa_target"})
+        preset = json.loads(result[0].text.split("```json\n", 1)[1].rsplit("\n```", 1)[0])
+        
+        # 동시에 오래된 미러를 확인해도 동기화는 한 번만 실행
+        server.mirror_max_staleness = 60
+        sync_requests = []
+        for callers in (1, 3):
+            server.mirror.set_state(watermark=time.time() - 120)
+            mirror_requests.clear()
+            await asyncio.gather(*(server._ensure_mirror_fresh() for _ in range(callers)))
+            sync_requests.append(len(mirror_requests))
+        server.mirror.close()
+        server.mirror = None
+    if first.get("source") == "mirror" or initial_sync is None or sorted(i["key"] for i in first["issues"]) != ["QAQ-1", "QAQ-2"]:
+        print(f"  ❌ 동기화 전 미러 조회가 예상과 다릅니다: {first}")
+        return False
+    if preset.get("source") != "mirror" or sorted(i["key"] for i in preset["issues"]) != ["QAQ-1", "QAQ-3"]:
+        print(f"  ❌ 미러 증분 동기화 결과가 예상과 다릅니다: {preset}")
+        return False
+    if sync_requests[0] == 0 or sync_requests[1] != sync_requests[0]:
+        print(f"  ❌ 동시 확인 시 미러 동기화가 중복 실행되었습니다: {sync_requests}")
+        return False
+    print("  ✅ 로컬 이슈 미러 (전체/증분 동기화) 정상")
+    
+    # 재시도, 서킷 브레이커
+    from ssg_jira_mcp_server import CircuitBreaker
+    
+    responses = [httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(200, json={"key": "QAQ-1"})]
+    await server.aclose()
+    server = make_test_server(lambda request: responses.pop(0))
+    server.retry_backoff_base = 0
+    data = await server._make_request("GET", "/rest/api/2/issue/QAQ-1")
+    if data.get("key") != "QAQ-1" or responses:
+        print("  ❌ 429 응답 후 재시도되지 않았습니다")
+        return False
+    
+    failures = []
+    await server.aclose()
+    server.client = httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda request: failures.append(request) or httpx.Response(503, text="unavailable")
+    ))
+    server.max_retries = 0
+    server.circuit = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    for _ in range(3):
+        try:
+            await server._make_request("GET", "/rest/api/2/issue/QAQ-1")
+        except Exception as e:
+            error = str(e)
+    if len(failures) != 2 or "차단" not in error:
+        print(f"  ❌ 서킷 브레이커가 열리지 않았습니다: {len(failures)}회 요청, {error}")
+        return False
+    print("  ✅ 재시도 및 서킷 브레이커 정상")
+    
+    # 동일 요청 합치기 (single-flight)
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"key": "QAQ-9"})
+    
+    upstream = []
+    await server.aclose()
+    server = make_test_server(lambda request: upstream.append(request) or slow_handler(request))
+    results = await asyncio.gather(*(
+        server._make_request("GET", "/rest/api/2/issue/QAQ-9", params={"fields": "summary"}) for _ in range(5)
+    ))
+    if len(upstream) != 1 or server.single_flight.saved != 4 or any(r.get("key") != "QAQ-9" for r in results):
+        print(f"  ❌ 동일 요청이 합쳐지지 않았습니다: {len(upstream)}회 요청")
+        return False
+    print("  ✅ 동일 요청 합치기 (single-flight) 정상")
+    
+    # 도구 호출 지표 (server_stats)
+    import mcp.types as mcp_types
+    
+    await server.aclose()
+    server = make_test_server(handler)
+    call_tool = server.server.request_handlers[mcp_types.CallToolRequest]
+    await call_tool(mcp_types.CallToolRequest(
+        method="tools/call",
+        params=mcp_types.CallToolRequestParams(name="get_issue", arguments={"issue_key": "QAQ-10", "bypass_cache": True})
+    ))
+    stats = server._server_stats_snapshot()["tools"].get("get_issue", {})
+    if not all(metric in stats for metric in ("tool_seconds", "upstream_seconds", "wait_seconds", "parse_seconds", "response_bytes")):
+        print(f"  ❌ 도구별 지표가 기록되지 않았습니다: {list(stats)}")
+        return False
+    if "ssg_jira_upstream_seconds_bucket" not in server.metrics.prometheus_text():
+        print("  ❌ Prometheus 형식 변환 실패")
+        return False
+    print("  ✅ 도구 호출 지표 (server_stats) 정상")
+    
+    # 진행 알림과 중간 중단 (stop_operation)
+    from ssg_jira_mcp_server import CURRENT_OPERATION, Operation
+    
+    class FakeSession:
+        def __init__(self):
+            self.notifications = []
+        
+        async def send_progress_notification(self, token, progress, total, message):
+            self.notifications.append((token, progress, total))
+    
+    search_handler, _ = make_fake_jira(total_issues=230, page_cap=50)
+    
+    async def slow_search_handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return search_handler(request)
+    
+    await server.aclose()
+    server = make_test_server(slow_search_handler)
+    call_tool = server.server.request_handlers[mcp_types.CallToolRequest]
+    session = FakeSession()
+    token = CURRENT_OPERATION.set(Operation("p-1", "search_issues", session=session, progress_token="p-1"))
+    try:
+        await server._search_issues({"jql": "project = QAQ", "fetch_all": True, "bypass_cache": True})
+    finally:
+        CURRENT_OPERATION.reset(token)
+    if [n[1:] for n in session.notifications] != [(i, 5) for i in range(1, 6)]:
+        print(f"  ❌ 진행 알림이 예상과 다릅니다: {session.notifications}")
+        return False
+    
+    # 내부 보조 조회는 보고하지 않고, 동시에 실행된 하위 검색은 페이지 수를 합산해 진행률이 줄지 않아야 함
+    session = FakeSession()
+    token = CURRENT_OPERATION.set(Operation("p-2", "batch", session=session, progress_token="p-2"))
+    try:
+        await server._search_all({"jql": "project = QAQ", "fields": "key", "maxResults": 50})
+        await asyncio.gather(*(
+            server._search_result({"jql": f"project = QAQ AND n = {i}", "fetch_all": True, "max_results": 50}) for i in range(2)
+        ))
+    finally:
+        CURRENT_OPERATION.reset(token)
+    done = [n[1] for n in session.notifications]
+    if done != list(range(1, 11)) or session.notifications[-1][2] != 10:
+        print(f"  ❌ 하위 검색 진행 알림이 예상과 다릅니다: {session.notifications}")
+        return False
+    
+    server.page_concurrency = 1
+    call = asyncio.ensure_future(call_tool(mcp_types.CallToolRequest(
+        method="tools/call",
+        params=mcp_types.CallToolRequestParams(name="search_issues", arguments={
+            "jql": "project = QAQ", "fetch_all": True, "bypass_cache": True, "max_results": 50
+        })
+    )))
+    while not any(op.progress[0] >= 2 for op in server.operations.values()):
+        await asyncio.sleep(0.01)
+    listed = await server._stop_operation({})
+    operation_id = next(iter(server.operations))
+    await server._stop_operation({"operation_id": operation_id})
+    text = (await call).root.content[0].text
+    partial = json.loads(text.split("```json\n", 1)[1].rsplit("\n```", 1)[0])
+    if operation_id not in listed[0].text or partial.get("partial") != "stop_operation 요청" or not 50 <= len(partial["issues"]) < 230:
+        print(f"  ❌ 중단 후 부분 결과가 예상과 다릅니다: {text[:120]}")
+        return False
+    if server.operations:
+        print(f"  ❌ 종료된 작업이 남아 있습니다: {list(server.operations)}")
+        return False
+    print("  ✅ 진행 알림 및 중간 중단 (stop_operation) 정상")
+    
+    # HTTP 모드 (여러 클라이언트가 한 서버 공유, 클라이언트별 인증 분리)
+    import base64
+    import socket
+    from mcp import ClientSession
+    from mcp.client.sse import sse_client
+    from mcp.client.streamable_http import streamablehttp_client
+    
+    seen_auth = []
+    
+    def auth_handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/rest/api/2/issue/"):
+            seen_auth.append(request.headers.get("Authorization"))
+        return search_handler(request)
+    
+    await server.aclose()
+    server = make_test_server(auth_handler)
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        server.http_port = sock.getsockname()[1]
+    serve_task = asyncio.ensure_future(server._serve_http())
+    while server.http_server is None or not server.http_server.started:
+        await asyncio.sleep(0.01)
+    
+    async def call_over_http(client, url, headers):
+        async with client(url, headers=headers) as streams:
+            async with ClientSession(streams[0], streams[1]) as session:
+                await session.initialize()
+                result = await session.call_tool("get_issue", {"issue_key": "QAQ-77"})
+                return result.content[0].text
+    
+    base = f"http://127.0.0.1:{server.http_port}"
+    try:
+        texts = [
+            await call_over_http(streamablehttp_client, base + server.http_path, {"X-Jira-Username": "a@ssg.com", "X-Jira-Api-Token": "a"}),
+            await call_over_http(streamablehttp_client, base + server.http_path, {"X-Jira-Username": "b@ssg.com", "X-Jira-Api-Token": "b"}),
+            await call_over_http(sse_client, base + "/sse", {"X-Jira-Username": "a@ssg.com", "X-Jira-Api-Token": "a"}),
+            await call_over_http(streamablehttp_client, base + server.http_path, {})
+        ]
+    finally:
+        server.http_server.should_exit = True
+        await serve_task
+    expected = {"Basic " + base64.b64encode(c.encode()).decode() for c in ("a@ssg.com:a", "b@ssg.com:b", "test@ssg.com:test-token")}
+    if not all("QAQ-77" in text for text in texts) or set(seen_auth) != expected or len(seen_auth) != 3:
+        print(f"  ❌ HTTP 모드 클라이언트별 인증/캐시 분리가 예상과 다릅니다: {seen_auth}, {[t[:40] for t in texts]}")
+        return False
+    print("  ✅ HTTP 모드 (streamable HTTP/SSE, 클라이언트별 인증) 정상")
+    
+    await server.aclose()
+    return True
+
+
 if __name__ == "__main__":
     success = asyncio.run(test_server())
     sys.exit(0 if success else 1)